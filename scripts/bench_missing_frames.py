@@ -0,0 +1,76 @@
+"""
+Benchmark missing-frame detection on large synthetic sequences.
+
+Compares the previous set + range() walk with
+toolkit.validation._compute_missing (the missing_frames list validate, disk,
+report and serve build) and toolkit.frames.missing_ranges (gap runs only).
+Cases range from gap-free to gap-heavy partial renders (every other frame,
+30% random drops).
+
+Run from the repo root:
+  python scripts/bench_missing_frames.py
+  python scripts/bench_missing_frames.py --frames 1000000 --repeat 5
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from toolkit.frames import missing_ranges  # noqa: E402
+from toolkit.validation import _compute_missing  # noqa: E402
+
+
+def _legacy_compute_missing(frames: list[int]) -> list[int]:
+    if not frames:
+        return []
+    lo, hi = frames[0], frames[-1]
+    have = set(frames)
+    return [f for f in range(lo, hi + 1) if f not in have]
+
+
+def _best_of(fn, frames: list[int], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(frames)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _cases(n: int) -> dict[str, list[int]]:
+    rng = random.Random(1234)
+    dense = list(range(1, n + 1))
+    gappy = [f for f in dense if rng.random() > 0.01]
+    dropped = [f for f in dense if rng.random() > 0.30]
+    alternating = dense[::2]
+    stray = list(range(1, 1001)) + [n * 10]
+    return {
+        f"{n} frames, no gaps": dense,
+        f"{n} frames, ~1% gaps": gappy,
+        f"{n} span, ~30% random gaps": dropped,
+        f"{n} span, every other frame": alternating,
+        f"1000 frames + stray frame {n * 10}": stray,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1_000_000, help="Sequence length (default: 1000000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats, best-of (default: 3)")
+    args = parser.parse_args()
+
+    print(f"{'case':<40} {'legacy':>10} {'gap list':>10} {'ranges':>10} {'speedup':>8}")
+    # speedup: legacy frame list vs the gap list results keep as missing_frames
+    for name, frames in _cases(args.frames).items():
+        assert _legacy_compute_missing(frames) == _compute_missing(frames)
+        legacy = _best_of(_legacy_compute_missing, frames, args.repeat)
+        new = _best_of(_compute_missing, frames, args.repeat)
+        ranges = _best_of(missing_ranges, frames, args.repeat)
+        print(f"{name:<40} {legacy * 1000:>8.1f}ms {new * 1000:>8.1f}ms {ranges * 1000:>8.1f}ms {legacy / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark validate / disk / publish across synthetic tree sizes.
+
+Each size gets a fresh tree (scripts/make_large_show.py) in a temp dir; each phase
+runs in its own subprocess so peak RSS is per phase. Results (wall time, files/sec,
+peak RSS) are printed and written as JSON so runs can be compared.
+
+Run from the repo root:
+  python scripts/bench_scan.py
+  python scripts/bench_scan.py --sizes 100 1000 --frames 240 --workers 8 --out bench_scan.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from make_large_show import generate_tree  # noqa: E402
+
+PHASES = ("validate", "disk", "publish")
+NAMING = {"frame_prefix": "frame_", "frame_padding": 4, "frame_ext": ".exr"}
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _run_phase(phase: str, shows_root: Path, workers: int, work_dir: Path, executor: str = "thread") -> dict:
+    """
+    Time one phase in this process (called in a child process by main)
+    """
+    from toolkit.monitoring import disk_usage_by_shot
+    from toolkit.publishing import PublishRequest, publish_shots
+    from toolkit.tracking.json_tracker import JsonTracker
+    from toolkit.validation import iter_shot_render_dirs, validate_renders
+
+    t0 = time.perf_counter()
+    if phase == "validate":
+        results = validate_renders(shows_root, workers=workers, executor=executor, **NAMING)
+    elif phase == "disk":
+        results = disk_usage_by_shot(shows_root, workers=workers, executor=executor)
+    elif phase == "publish":
+        requests = [PublishRequest(show=show, shot=shot) for show, shot, _ in iter_shot_render_dirs(shows_root)]
+        results = publish_shots(
+            requests,
+            shows_root=shows_root,
+            tracker=JsonTracker(work_dir / "tracking_db.jsonl", fmt="jsonl"),
+            workers=workers,
+            publish_root=work_dir / "published",
+            **NAMING,
+        )
+    else:
+        raise ValueError(f"Unknown phase: {phase}")
+    seconds = time.perf_counter() - t0
+
+    return {"phase": phase, "seconds": seconds, "results": len(results), "peak_rss_bytes": _peak_rss_bytes()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500], help="Total shot counts to test (default: 50 500)")
+    parser.add_argument("--shows", type=int, default=5, help="Shows per tree; shots are split across them (default: 5)")
+    parser.add_argument("--frames", type=int, default=100, help="Frames per shot (default: 100)")
+    parser.add_argument("--gap-rate", type=float, default=0.01, help="Missing frame probability (default: 0.01)")
+    parser.add_argument("--file-size", type=int, default=4096, help="Frame file size in bytes (sparse, default: 4096)")
+    parser.add_argument("--workers", type=int, default=1, help="Scan/publish workers (default: 1)")
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread", help="Scan executor for validate/disk (default: thread)")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES), help="Phases to run")
+    parser.add_argument("--out", default="bench_scan.json", help="JSON results file (default: bench_scan.json)")
+    parser.add_argument("--_run-phase", dest="run_phase", nargs=3, metavar=("PHASE", "ROOT", "WORK_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_phase:
+        phase, root, work_dir = args.run_phase
+        print(json.dumps(_run_phase(phase, Path(root), args.workers, Path(work_dir), args.executor)))
+        return
+
+    runs = []
+    print(f"{'shots':>7} {'files':>9} {'phase':<9} {'seconds':>9} {'files/s':>11} {'peak RSS':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="toolkit-bench-") as tmp:
+            tmp_path = Path(tmp)
+            shows_root = tmp_path / "shows"
+            shows = max(1, min(args.shows, size))
+            tree = generate_tree(
+                shows_root,
+                shows=shows,
+                shots=max(1, size // shows),
+                frames=args.frames,
+                gap_rate=args.gap_rate,
+                min_size=args.file_size,
+                max_size=args.file_size,
+                sparse=True,
+            )
+            for phase in args.phases:
+                proc = subprocess.run(
+                    [sys.executable, __file__, "--workers", str(args.workers), "--executor", args.executor, "--_run-phase", phase, str(shows_root), str(tmp_path)],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                result = json.loads(proc.stdout)
+                result["files_per_sec"] = tree["files"] / result["seconds"] if result["seconds"] else 0.0
+                runs.append({"tree": tree, **result})
+                print(
+                    f"{tree['shots']:>7} {tree['files']:>9} {phase:<9} {result['seconds']:>9.3f} "
+                    f"{result['files_per_sec']:>11.0f} {result['peak_rss_bytes'] / (1 << 20):>8.1f}MB"
+                )
+
+    payload = {
+        "tool": "vfx-ops-toolkit",
+        "benchmark": "scan",
+        "timestamp_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "frames": args.frames,
+            "gap_rate": args.gap_rate,
+            "file_size": args.file_size,
+            "workers": args.workers,
+            "executor": args.executor,
+        },
+        "runs": runs,
+    }
+    Path(args.out).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
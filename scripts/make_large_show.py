@@ -0,0 +1,105 @@
+"""
+Generate a synthetic show tree for benchmarking validate / disk / publish.
+
+Layout matches the toolkit convention:
+  <root>/<show>/shots/<shot>/renders/<prefix><frame><ext>
+
+Run from the repo root:
+  python scripts/make_large_show.py --root /tmp/bench_shows
+  python scripts/make_large_show.py --root /tmp/bench_shows --shows 4 --shots 250 --frames 240 --gap-rate 0.01 --sparse
+"""
+import argparse
+import json
+import random
+import shutil
+from pathlib import Path
+
+
+def generate_tree(
+        root: Path,
+        *,
+        shows: int = 2,
+        shots: int = 50,
+        frames: int = 100,
+        gap_rate: float = 0.0,
+        min_size: int = 0,
+        max_size: int = 0,
+        sparse: bool = False,
+        start_frame: int = 1001,
+        prefix: str = "frame_",
+        padding: int = 4,
+        ext: str = ".exr",
+        seed: int = 1234,
+) -> dict:
+    """
+    Write the tree under root and return counts (shows, shots, files, missing frames, bytes).
+    Each frame is dropped with probability gap_rate (first/last frames are always kept).
+    File sizes are uniform in [min_size, max_size]; sparse=True allocates no data blocks.
+    """
+    rng = random.Random(seed)
+    chunk = b"\0" * (1 << 20)
+    files = missing = total_bytes = 0
+    last = start_frame + frames - 1
+
+    for show_i in range(1, shows + 1):
+        for shot_i in range(1, shots + 1):
+            render_dir = root / f"show{show_i:03d}" / "shots" / f"shot{shot_i * 10:04d}" / "renders"
+            render_dir.mkdir(parents=True, exist_ok=True)
+            for frame in range(start_frame, last + 1):
+                if frame not in (start_frame, last) and rng.random() < gap_rate:
+                    missing += 1
+                    continue
+                size = rng.randint(min_size, max(min_size, max_size))
+                with open(render_dir / f"{prefix}{frame:0{padding}d}{ext}", "wb") as f:
+                    if sparse:
+                        f.truncate(size)
+                    else:
+                        remaining = size
+                        while remaining > 0:
+                            remaining -= f.write(chunk[:remaining])
+                files += 1
+                total_bytes += size
+
+    return {
+        "shows": shows,
+        "shots": shows * shots,
+        "files": files,
+        "missing_frames": missing,
+        "total_bytes": total_bytes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", required=True, help="Output shows_root (created if needed)")
+    parser.add_argument("--shows", type=int, default=2, help="Number of shows (default: 2)")
+    parser.add_argument("--shots", type=int, default=50, help="Shots per show (default: 50)")
+    parser.add_argument("--frames", type=int, default=100, help="Frames per shot (default: 100)")
+    parser.add_argument("--gap-rate", type=float, default=0.0, help="Probability a frame is missing (default: 0)")
+    parser.add_argument("--min-size", type=int, default=0, help="Minimum file size in bytes (default: 0)")
+    parser.add_argument("--max-size", type=int, default=0, help="Maximum file size in bytes (default: 0)")
+    parser.add_argument("--sparse", action="store_true", help="Create sparse files (size without allocated blocks)")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed (default: 1234)")
+    parser.add_argument("--clean", action="store_true", help="Delete --root first")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if args.clean and root.exists():
+        shutil.rmtree(root)
+
+    stats = generate_tree(
+        root,
+        shows=args.shows,
+        shots=args.shots,
+        frames=args.frames,
+        gap_rate=args.gap_rate,
+        min_size=args.min_size,
+        max_size=args.max_size,
+        sparse=args.sparse,
+        seed=args.seed,
+    )
+    print(json.dumps({"root": root.as_posix(), **stats}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import pytest
+
+from toolkit.config import CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_cache(tmp_path: Path, monkeypatch) -> Path:
+    """
+    Point the parsed-config cache at tmp_path for every test, so CLI runs (in-process
+    or `python -m toolkit` subprocesses, which inherit the environment) never write
+    to ~/.cache/vfx-ops-toolkit
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
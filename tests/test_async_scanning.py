@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from toolkit import async_scanning
+from toolkit.async_scanning import scan_shows
+from toolkit.monitoring import disk_usage_by_shot
+from toolkit.validation import validate_renders
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def _make_tree(shows_root: Path) -> None:
+    for show in ("show_a", "show_b"):
+        for i, shot in enumerate(("shot010", "shot020", "shot030")):
+            renders = shows_root / show / "shots" / shot / "renders"
+            for f in (1, 2, 4 + i):
+                _touch(renders / f"frame_{f:04d}.exr", 10 * f)
+    # shot without renders dir and show without shots dir are skipped
+    (shows_root / "show_a" / "shots" / "shot040").mkdir(parents=True)
+    (shows_root / "show_c").mkdir(parents=True)
+
+
+async def _collect(shows_root: Path, **kwargs) -> list:
+    """Results in (show, shot) order; scan_shows yields them as they complete"""
+    results = [r async for r in scan_shows(shows_root, **kwargs)]
+    return sorted(results, key=lambda r: (r.show, r.shot))
+
+
+def test_scan_shows_matches_sync_validate_and_disk(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    results = asyncio.run(_collect(shows_root, sizes=True, concurrency=4))
+    validation = validate_renders(shows_root)
+    disk = disk_usage_by_shot(shows_root)
+
+    assert [(r.show, r.shot, r.frames_found, r.missing_frames) for r in results] == [
+        (v.show, v.shot, v.frames_found, v.missing_frames) for v in validation
+    ]
+    assert [(r.total_bytes, r.file_count, r.allocated_bytes) for r in results] == [
+        (d.total_bytes, d.file_count, d.allocated_bytes) for d in disk
+    ]
+    assert results[0].render_dir == shows_root / "show_a" / "shots" / "shot010" / "renders"
+
+
+def test_scan_shows_bounds_concurrency_and_does_not_block_loop(tmp_path: Path, monkeypatch):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    lock = threading.Lock()
+    in_flight = peak = 0
+    original = async_scanning._scan_if_present
+
+    def slow_scan(*args):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)  # simulated high-latency listing
+        try:
+            return original(*args)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    monkeypatch.setattr(async_scanning, "_scan_if_present", slow_scan)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        t = asyncio.ensure_future(ticker())
+        results = await _collect(shows_root, concurrency=3)
+        t.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+    assert len(results) == 6
+    assert 1 < peak <= 3
+    assert ticks > 3  # the event loop kept running during the scan
+
+
+def test_scan_shows_early_break_cleans_up(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    async def first_only():
+        agen = scan_shows(shows_root, concurrency=2)
+        async for r in agen:
+            await agen.aclose()
+            return r
+
+    r = asyncio.run(first_only())
+    assert r.show in ("show_a", "show_b")
+
+
+def test_scan_shows_yields_as_completed_and_bounds_pending_work(tmp_path: Path, monkeypatch):
+    shows_root = tmp_path / "shows"
+    for i in range(1, 41):
+        _touch(shows_root / "show_a" / "shots" / f"shot{i:03d}" / "renders" / "frame_0001.exr")
+
+    lock = threading.Lock()
+    started = []
+    original = async_scanning._scan_if_present
+
+    def scan(render_dir, *args):
+        with lock:
+            started.append(render_dir.parent.name)
+        if render_dir.parent.name == "shot001":
+            time.sleep(0.3)  # slow head shot
+        return original(render_dir, *args)
+
+    monkeypatch.setattr(async_scanning, "_scan_if_present", scan)
+
+    async def main():
+        order, started_while_paused = [], None
+        async for r in scan_shows(shows_root, concurrency=2):
+            order.append(r.shot)
+            if len(order) == 1:
+                await asyncio.sleep(0.1)  # slow consumer: workers must stop, not run ahead
+                started_while_paused = len(started)
+        return order, started_while_paused
+
+    order, started_while_paused = asyncio.run(main())
+    assert order[0] != "shot001"  # the slow head shot does not hold back the others
+    assert sorted(order) == [f"shot{i:03d}" for i in range(1, 41)]
+    assert started_while_paused <= 8
+
+
+def test_scan_shows_raises_scan_errors(tmp_path: Path, monkeypatch):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    def broken(*args):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(async_scanning, "_scan_if_present", broken)
+    with pytest.raises(PermissionError):
+        asyncio.run(_collect(shows_root, concurrency=2))
+
+
+def test_scan_shows_missing_root_yields_nothing(tmp_path: Path):
+    assert asyncio.run(_collect(tmp_path / "nope")) == []
+
+
+def test_scan_shows_applies_show_and_shot_filters(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    results = asyncio.run(_collect(shows_root, show="show_b", shot="shot0[12]0"))
+    assert [(r.show, r.shot) for r in results] == [("show_b", "shot010"), ("show_b", "shot020")]
+    assert [(r.show, r.shot) for r in results] == [
+        (v.show, v.shot) for v in validate_renders(shows_root, show="show_b", shot="shot0[12]0")
+    ]
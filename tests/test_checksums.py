@@ -0,0 +1,85 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from toolkit.checksums import ChecksumCache, checksum_files, get_hasher, hash_file
+
+
+def _write(p: Path, data: bytes, age: float = 60) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(data)
+    t = time.time() - age
+    os.utime(p, (t, t))
+
+
+def test_hash_file_matches_hashlib_across_chunks(tmp_path: Path):
+    data = os.urandom(10_000)
+    path = tmp_path / "frame_0001.exr"
+    _write(path, data)
+
+    assert hash_file(path, "blake2b", chunk_size=4096) == hashlib.blake2b(data).hexdigest()
+    assert hash_file(path, "sha256", chunk_size=4096) == hashlib.sha256(data).hexdigest()
+
+
+def test_checksum_files_preserves_order_in_parallel(tmp_path: Path):
+    paths = []
+    for i in range(8):
+        p = tmp_path / f"frame_{i:04d}.exr"
+        _write(p, bytes([i]) * (i + 1))
+        paths.append(p)
+
+    digests = checksum_files(paths, workers=4)
+    assert digests == [hashlib.blake2b(p.read_bytes()).hexdigest() for p in paths]
+
+
+def test_checksum_cache_only_rehashes_changed_files(tmp_path: Path):
+    a = tmp_path / "renders" / "frame_0001.exr"
+    b = tmp_path / "renders" / "frame_0002.exr"
+    _write(a, b"aaaa")
+    _write(b, b"bbbb")
+    cache_path = tmp_path / "checksum_cache.json"
+
+    cache = ChecksumCache(cache_path)
+    first = checksum_files([a, b], cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    cache.save()
+
+    _write(b, b"bbbbbb", age=30)
+    cache = ChecksumCache(cache_path)
+    second = checksum_files([a, b], cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second[0] == first[0]
+    assert second[1] == hashlib.blake2b(b"bbbbbb").hexdigest()
+
+
+def test_checksum_cache_save_uses_per_process_temp_file(tmp_path: Path, monkeypatch):
+    path = tmp_path / "frame_0001.exr"
+    _write(path, b"data")
+    cache = ChecksumCache(tmp_path / "checksum_cache.json")
+    checksum_files([path], cache=cache)
+
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: (replaced.append(Path(src).name), real_replace(src, dst)))
+    cache.save()
+
+    assert replaced == [f"checksum_cache.json.{os.getpid()}.tmp"]
+    assert ChecksumCache(tmp_path / "checksum_cache.json").lookup(path, "blake2b", path.stat()) is not None
+
+
+def test_checksum_cache_skips_recently_modified_files(tmp_path: Path):
+    path = tmp_path / "frame_0001.exr"
+    _write(path, b"data", age=0)
+    cache = ChecksumCache(tmp_path / "checksum_cache.json")
+
+    checksum_files([path], cache=cache)
+    checksum_files([path], cache=cache)
+    assert cache.hits == 0
+
+
+def test_get_hasher_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        get_hasher("md5")
@@ -3,6 +3,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def _touch(p: Path, size: int = 0) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -161,3 +163,554 @@ def test_cli_disk_warns_when_threshold_exceeded(tmp_path: Path):
 
     assert proc.returncode == 0
     assert "[WARN >= 1 MB]" in proc.stdout
+
+
+def test_cli_validate_json_with_workers(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for shot in ("shot010", "shot020", "shot030"):
+        renders = shows_root / "demo_show" / "shots" / shot / "renders"
+        _touch(renders / "frame_0001.exr")
+        _touch(renders / "frame_0002.exr")
+
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "scan:\n"
+        "  workers: 1\n",
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "validate", "--json", "--workers", "3"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0
+    payload = json.loads(proc.stdout)
+    assert [r["shot"] for r in payload["results"]] == ["shot010", "shot020", "shot030"]
+
+
+def test_cli_tracker_compact_migrates_to_jsonl(tmp_path: Path):
+    db_path = tmp_path / "data" / "tracking_db.json"
+    db_path.parent.mkdir(parents=True)
+    row = {
+        "show": "demo_show", "shot": "shot010", "version": "v001", "status": "ok", "note": "",
+        "timestamp_utc": "2026-01-01T00:00:00Z", "frames_found": [1], "missing_frames": [],
+        "total_bytes": 1, "file_count": 1,
+    }
+    db_path.write_text(json.dumps([row, row], indent=2), encoding="utf-8")
+
+    (tmp_path / "toolkit.yaml").write_text(
+        "tracking:\n"
+        "  backend: \"json\"\n"
+        "  json_format: \"jsonl\"\n"
+        f'  json_path: "{db_path.as_posix()}"\n',
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "tracker", "compact", "--json"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0
+    payload = json.loads(proc.stdout)
+    assert payload["records_before"] == 2
+    assert payload["records_after"] == 1
+    assert db_path.read_text(encoding="utf-8").splitlines() == [json.dumps(row)]
+
+
+def test_cli_validate_json_frame_ranges(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    for f in (1, 2, 3, 7, 8):
+        _touch(renders / f"frame_{f:04d}.exr")
+
+    (tmp_path / "toolkit.yaml").write_text(f'shows_root: "{shows_root.as_posix()}"\n', encoding="utf-8")
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "validate", "--json", "--frames-format", "ranges"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 1
+    payload = json.loads(proc.stdout)
+    assert payload["frames_format"] == "ranges"
+    assert payload["results"][0]["frames_found"] == "1-3,7-8"
+    assert payload["results"][0]["missing_frames"] == "4-6"
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "validate"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert "Missing frames: 0004-0006" in proc.stdout
+
+
+def test_cli_validate_and_disk_ndjson_stream(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for shot, frames in (("shot010", (1, 2, 4)), ("shot020", (1, 2))):
+        renders = shows_root / "demo_show" / "shots" / shot / "renders"
+        for f in frames:
+            _touch(renders / f"frame_{f:04d}.exr", 10)
+
+    (tmp_path / "toolkit.yaml").write_text(f'shows_root: "{shows_root.as_posix()}"\n', encoding="utf-8")
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "validate", "--format", "ndjson"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 1
+    lines = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert [line["type"] for line in lines] == ["result", "result", "summary"]
+    assert lines[0]["shot"] == "shot010"
+    assert lines[0]["missing_frames"] == [3]
+    assert lines[2]["shots"] == 2
+    assert lines[2]["shots_with_missing"] == 1
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "disk", "--format", "ndjson"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0
+    lines = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert [line.get("total_bytes") for line in lines] == [30, 20, 50]
+    assert lines[-1]["type"] == "summary"
+
+
+def test_cli_publish_batch_from_stdin(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for shot in ("shot010", "shot020"):
+        _touch(shows_root / "demo_show" / "shots" / shot / "renders" / "frame_0001.exr", 10)
+
+    db_path = tmp_path / "data" / "tracking_db.json"
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "tracking:\n"
+        f'  json_path: "{db_path.as_posix()}"\n',
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "publish-batch", "--json", "--workers", "2"],
+        cwd=str(tmp_path),
+        input="show,shot,version,note\ndemo_show,shot010,v001,a\ndemo_show,shot020,v001,b\ndemo_show,nope,v001,c\n",
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 2
+    payload = json.loads(proc.stdout)
+    assert payload["published"] == 2
+    assert payload["failed"] == 1
+    assert [r["ok"] for r in payload["results"]] == [True, True, False]
+    assert len(json.loads(db_path.read_text(encoding="utf-8"))) == 2
+
+
+def test_cli_watch_poll_ndjson_reports_initial_state(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(renders / "frame_0001.exr")
+    _touch(renders / "frame_0004.exr")
+
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "naming:\n"
+        "  frame_prefix: \"frame_\"\n"
+        "  frame_padding: 4\n"
+        "  frame_ext: \".exr\"\n",
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "watch", "--backend", "poll", "--interval", "0.1", "--duration", "0.3", "--format", "ndjson"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0
+    events = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert events == [{
+        "type": "missing_frames",
+        "timestamp": events[0]["timestamp"],
+        "show": "demo_show",
+        "shot": "shot010",
+        "render_dir": renders.as_posix(),
+        "missing_frames": "0002-0003",
+        "frame_count": 2,
+        "total_bytes": 0,
+        "warning": False,
+    }]
+
+
+def test_cli_disk_allocated_accounting_ignores_sparse_size(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    renders.mkdir(parents=True)
+    with open(renders / "frame_0001.exr", "wb") as f:
+        f.truncate(4 * 1024 * 1024)
+    allocated = (renders / "frame_0001.exr").stat()
+    if getattr(allocated, "st_blocks", None) is None or allocated.st_blocks * 512 >= 1024 * 1024:
+        pytest.skip("no sparse file support on this filesystem")
+
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "thresholds:\n"
+        "  disk_warning_mb: 1\n",
+        encoding="utf-8",
+    )
+
+    def run(*extra):
+        proc = subprocess.run(
+            [sys.executable, "-m", "toolkit", "disk", "--json", "--no-cache", *extra],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode == 0
+        return json.loads(proc.stdout)
+
+    apparent = run()
+    assert apparent["accounting"] == "apparent"
+    assert apparent["results"][0]["total_bytes"] == 4 * 1024 * 1024
+    assert apparent["results"][0]["warning"] is True
+
+    alloc = run("--accounting", "allocated")
+    assert alloc["accounting"] == "allocated"
+    assert alloc["results"][0]["allocated_bytes"] == allocated.st_blocks * 512
+    assert alloc["results"][0]["warning"] is False
+
+
+def test_cli_validate_process_executor_matches_threads(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for show in ("show_a", "show_b"):
+        for shot in ("shot010", "shot020"):
+            renders = shows_root / show / "shots" / shot / "renders"
+            _touch(renders / "frame_0001.exr")
+            _touch(renders / "frame_0003.exr")
+
+    (tmp_path / "toolkit.yaml").write_text(f'shows_root: "{shows_root.as_posix()}"\n', encoding="utf-8")
+
+    def run(executor):
+        proc = subprocess.run(
+            [sys.executable, "-m", "toolkit", "validate", "--json", "--no-cache", "--workers", "2", "--executor", executor],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode == 1
+        return json.loads(proc.stdout)["results"]
+
+    processes = run("process")
+    assert processes == run("thread")
+    assert [(r["show"], r["shot"], r["missing_frames"]) for r in processes] == [
+        ("show_a", "shot010", [2]),
+        ("show_a", "shot020", [2]),
+        ("show_b", "shot010", [2]),
+        ("show_b", "shot020", [2]),
+    ]
+
+
+def test_cli_validate_and_disk_show_shot_filters(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for show in ("show_a", "show_b"):
+        for shot in ("shot010", "shot100", "shot110"):
+            _touch(shows_root / show / "shots" / shot / "renders" / "frame_0001.exr", 10)
+
+    (tmp_path / "toolkit.yaml").write_text(f'shows_root: "{shows_root.as_posix()}"\n', encoding="utf-8")
+
+    for command in ("validate", "disk"):
+        proc = subprocess.run(
+            [sys.executable, "-m", "toolkit", command, "--json", "--no-cache", "--show", "show_b", "--shot", "shot1*"],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode == 0, proc.stderr
+        results = json.loads(proc.stdout)["results"]
+        assert [(r["show"], r["shot"]) for r in results] == [("show_b", "shot100"), ("show_b", "shot110")]
+
+
+def test_cli_validate_sequences_json(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    for f in (1001, 1002, 1004):
+        _touch(renders / f"beauty.{f}.exr")
+    for f in (1001, 1002, 1003):
+        _touch(renders / f"depth.{f}.exr")
+        _touch(renders / f"depth.{f}.jpg")
+
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "sequences:\n"
+        "  include: [\"*.exr\"]\n",
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "validate", "--sequences", "--json", "--frames-format", "ranges"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 1, proc.stderr
+    (result,) = json.loads(proc.stdout)["results"]
+    assert [(s["sequence"], s["frames_found"], s["missing_frames"]) for s in result["sequences"]] == [
+        ("beauty.####.exr", "1001-1002,1004", "1003"),
+        ("depth.####.exr", "1001-1003", ""),
+    ]
+
+
+def test_print_json_stream_matches_print_json(capsys):
+    from toolkit.cli import _print_json, _print_json_stream
+
+    payload = {"tool": "vfx-ops-toolkit", "command": "validate"}
+    items = [{"show": "a", "frames_found": [1, 2], "note": "line\nbreak"}, {"show": "b", "frames_found": []}]
+    for rows in (items, []):
+        _print_json({**payload, "results": rows})
+        expected = capsys.readouterr().out
+        _print_json_stream(payload, "results", iter(rows))
+        assert capsys.readouterr().out == expected
+
+    _print_json({**payload, "results": items, "summary": {"shots": 2}, "ok": True})
+    expected = capsys.readouterr().out
+    _print_json_stream(payload, "results", iter(items), tail=lambda: {"summary": {"shots": 2}, "ok": True})
+    assert capsys.readouterr().out == expected
+
+
+def test_cli_report_json_joins_latest_publish(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for shot in ("shot010", "shot020"):
+        renders = shows_root / "demo_show" / "shots" / shot / "renders"
+        for f in (1, 2, 4):
+            _touch(renders / f"frame_{f:04d}.exr", 10)
+
+    db_path = tmp_path / "data" / "tracking_db.json"
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "tracking:\n"
+        "  backend: \"json\"\n"
+        f'  json_path: "{db_path.as_posix()}"\n',
+        encoding="utf-8",
+    )
+
+    def run(*args):
+        return subprocess.run(
+            [sys.executable, "-m", "toolkit", *args],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+
+    assert run("publish", "--show", "demo_show", "--shot", "shot020", "--version", "v003").returncode == 0
+    proc = run("report", "--json", "--no-cache")
+
+    assert proc.returncode == 1, proc.stderr
+    data = json.loads(proc.stdout)
+    assert data["command"] == "report"
+    assert [(r["shot"], r["frame_count"], r["missing_frames"], r["total_bytes"]) for r in data["results"]] == [
+        ("shot010", 3, [3], 30),
+        ("shot020", 3, [3], 30),
+    ]
+    assert data["results"][0]["latest_publish"] is None
+    assert data["results"][1]["latest_publish"]["version"] == "v003"
+    assert data["summary"]["shots_unpublished"] == 1
+
+
+def test_cli_metrics_textfile_per_command(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    for f in (1, 2, 4):
+        _touch(renders / f"frame_{f:04d}.exr", 10)
+
+    metrics_dir = tmp_path / "textfile"
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "metrics:\n"
+        f'  textfile_dir: "{metrics_dir.as_posix()}"\n',
+        encoding="utf-8",
+    )
+
+    for command in ("validate", "disk"):
+        proc = subprocess.run(
+            [sys.executable, "-m", "toolkit", command, "--json", "--no-cache"],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+        assert proc.returncode in (0, 1), proc.stderr
+
+    assert sorted(p.name for p in metrics_dir.iterdir()) == ["vfx_ops_toolkit_disk.prom", "vfx_ops_toolkit_validate.prom"]
+    validate = (metrics_dir / "vfx_ops_toolkit_validate.prom").read_text(encoding="utf-8")
+    disk = (metrics_dir / "vfx_ops_toolkit_disk.prom").read_text(encoding="utf-8")
+    assert 'toolkit_shot_missing_frames{command="validate",show="demo_show",shot="shot010"} 1' in validate
+    assert 'toolkit_shot_bytes{command="disk",show="demo_show",shot="shot010"} 30' in disk
+    assert 'toolkit_scan_files{command="disk"} 3' in disk
+    assert "toolkit_shot_bytes" not in validate
+
+
+@pytest.mark.parametrize("fmt", ["text", "json", "ndjson"])
+def test_cli_report_unreachable_tracker_exits_2(tmp_path: Path, fmt: str):
+    shows_root = tmp_path / "shows"
+    _touch(shows_root / "demo_show" / "shots" / "shot010" / "renders" / "frame_0001.exr", 10)
+    (tmp_path / "toolkit.yaml").write_text(
+        f'shows_root: "{shows_root.as_posix()}"\n'
+        "tracking:\n"
+        "  backend: \"http\"\n"
+        '  http_url: "http://127.0.0.1:1"\n'
+        "  http_retries: 0\n",
+        encoding="utf-8",
+    )
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "report", "--format", fmt],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 2
+    assert proc.stderr.startswith("ERROR: GET http://127.0.0.1:1/publishes")
+    assert "Traceback" not in proc.stderr
+    assert proc.stdout == ""
+
+
+def test_cli_http_tracking_backend(tmp_path: Path):
+    import threading
+
+    from toolkit.tracking.http_stub import StubTrackingServer
+
+    shows_root = tmp_path / "shows"
+    for f in (1, 2, 3):
+        _touch(shows_root / "demo_show" / "shots" / "shot010" / "renders" / f"frame_{f:04d}.exr", 10)
+
+    server = StubTrackingServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        def run(url: str, *args):
+            (tmp_path / "toolkit.yaml").write_text(
+                f'shows_root: "{shows_root.as_posix()}"\n'
+                "tracking:\n"
+                "  backend: \"http\"\n"
+                f'  http_url: "{url}"\n'
+                "  http_retries: 0\n",
+                encoding="utf-8",
+            )
+            return subprocess.run(
+                [sys.executable, "-m", "toolkit", *args],
+                cwd=str(tmp_path),
+                capture_output=True,
+                text=True,
+            )
+
+        assert run(server.url, "publish", "--show", "demo_show", "--shot", "shot010", "--version", "v002").returncode == 0
+        proc = run(server.url, "list-publishes", "--json", "--shot", "shot010")
+        assert proc.returncode == 0, proc.stderr
+        assert [r["version"] for r in json.loads(proc.stdout)["records"]] == ["v002"]
+        assert server.requests[-1] == ("GET", "/publishes?limit=50&shot=shot010")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # server down: every command that talks to the tracker fails cleanly with exit 2
+    for args in (
+        ("list-publishes",),
+        ("report",),
+        ("report", "--format", "ndjson", "--metrics-out", str(tmp_path / "report.prom")),
+        ("serve", "--port", "0", "--duration", "1"),
+        ("publish", "--show", "demo_show", "--shot", "shot010", "--version", "v003"),
+    ):
+        proc = run(server.url, *args)
+        assert proc.returncode == 2, args
+        assert "ERROR" in proc.stdout + proc.stderr, args
+        assert "Traceback" not in proc.stderr, args
+
+
+def test_cli_report_metrics_count_records_from_one_tracker_read(tmp_path: Path):
+    import threading
+
+    from toolkit.tracking.http_stub import StubTrackingServer
+
+    shows_root = tmp_path / "shows"
+    for shot in ("shot010", "shot020"):
+        _touch(shows_root / "demo_show" / "shots" / shot / "renders" / "frame_0001.exr", 10)
+
+    server = StubTrackingServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        server.store([
+            {"show": "demo_show", "shot": shot, "version": version, "status": "ok", "note": "",
+             "timestamp_utc": f"2026-01-0{i}T00:00:00Z", "frames_found": "1", "missing_frames": "",
+             "total_bytes": 10, "file_count": 1}
+            for i, (shot, version) in enumerate((("shot010", "v001"), ("shot010", "v002"), ("shot020", "v001")), start=1)
+        ], None)
+        (tmp_path / "toolkit.yaml").write_text(
+            f'shows_root: "{shows_root.as_posix()}"\n'
+            "tracking:\n"
+            "  backend: \"http\"\n"
+            f'  http_url: "{server.url}"\n',
+            encoding="utf-8",
+        )
+        metrics_out = tmp_path / "report.prom"
+        proc = subprocess.run(
+            [sys.executable, "-m", "toolkit", "report", "--json", "--metrics-out", str(metrics_out)],
+            cwd=str(tmp_path),
+            capture_output=True,
+            text=True,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert proc.returncode == 0, proc.stderr
+    assert [r["latest_publish"]["version"] for r in json.loads(proc.stdout)["results"]] == ["v002", "v001"]
+    assert [method for method, _ in server.requests] == ["GET"]
+    assert 'toolkit_tracker_records{command="report",show="demo_show"} 3' in metrics_out.read_text(encoding="utf-8")
+
+
+def test_cli_watch_show_shot_filters(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for show, shot in (("demo_show", "shot010"), ("demo_show", "shot020"), ("other_show", "shot010")):
+        renders = shows_root / show / "shots" / shot / "renders"
+        _touch(renders / "frame_0001.exr")
+        _touch(renders / "frame_0003.exr")
+
+    proc = subprocess.run(
+        [
+            sys.executable, "-m", "toolkit", "watch",
+            "--shows-root", str(shows_root),
+            "--show", "demo_show", "--shot", "shot010",
+            "--backend", "poll", "--duration", "0", "--format", "ndjson",
+        ],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    events = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert [(e["show"], e["shot"]) for e in events] == [("demo_show", "shot010")]
+
+
+def test_cli_rejects_abbreviated_options(tmp_path: Path):
+    # publish-batch has no --show; it must not be read as a prefix of --shows-root
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "publish-batch", "--show", "demo_show"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 2
+    assert "unrecognized arguments: --show" in proc.stderr
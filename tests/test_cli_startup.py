@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Modules only specific commands need; importing the CLI must not pull them in.
+HEAVY_MODULES = {
+    "yaml",
+    "logging",
+    "sqlite3",
+    "cProfile",
+    "concurrent.futures",
+    "toolkit.scanning",
+    "toolkit.validation",
+    "toolkit.monitoring",
+    "toolkit.publishing",
+    "toolkit.checksums",
+    "toolkit.reporting",
+    "toolkit.serving",
+    "toolkit.metrics",
+    "toolkit.tracking.http_tracker",
+    "http.server",
+    "toolkit.watching",
+    "toolkit.tracking",
+}
+
+
+def _imported_modules(args: list[str], cwd: Path, env: dict) -> tuple[subprocess.CompletedProcess, set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return proc, modules
+
+
+def _env(tmp_path: Path) -> dict:
+    return {**os.environ, "TOOLKIT_CACHE_DIR": str(tmp_path / "cache")}
+
+
+def test_cli_import_is_lazy(tmp_path: Path):
+    proc, modules = _imported_modules(["-c", "import toolkit.cli"], tmp_path, _env(tmp_path))
+
+    assert proc.returncode == 0, proc.stderr
+    assert "toolkit.cli" in modules
+    assert not modules & HEAVY_MODULES
+
+
+def test_cli_list_publishes_reuses_cached_config(tmp_path: Path):
+    db_path = tmp_path / "data" / "tracking_db.json"
+    cfg_path = tmp_path / "toolkit.yaml"
+    cfg_path.write_text(
+        "tracking:\n"
+        "  backend: \"json\"\n"
+        f'  json_path: "{db_path.as_posix()}"\n',
+        encoding="utf-8",
+    )
+    t = time.time() - 60
+    os.utime(cfg_path, (t, t))
+    env = _env(tmp_path)
+    args = ["-m", "toolkit", "list-publishes", "--json"]
+
+    first, first_modules = _imported_modules(args, tmp_path, env)
+    second, second_modules = _imported_modules(args, tmp_path, env)
+
+    assert first.returncode == second.returncode == 0
+    assert json.loads(second.stdout)["records"] == []
+    assert "yaml" in first_modules
+    # second run: config from the cache, JSON tracker only, nothing logged
+    assert {"yaml", "logging", "sqlite3", "toolkit.scanning", "toolkit.publishing"}.isdisjoint(second_modules)
+    assert "toolkit.tracking.json_tracker" in second_modules
+    assert not (tmp_path / "logs").exists()
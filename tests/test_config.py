@@ -1,7 +1,10 @@
+import json
+import os
+import time
 from pathlib import Path
 import pytest
 
-from toolkit.config import load_config
+from toolkit.config import load_config, load_config_cached
 
 
 def test_load_config_returns_empty_when_no_default_file(tmp_path: Path, monkeypatch):
@@ -48,3 +51,43 @@ def test_load_config_accepts_list_arg_and_uses_last(tmp_path: Path):
 
     cfg = load_config([str(a), str(b)])
     assert cfg["shows_root"] == "B"
+
+
+def _age(path: Path, seconds: float = 60) -> None:
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+def test_load_config_cached_reuses_parsed_config_until_file_changes(tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("TOOLKIT_CACHE_DIR", str(cache_dir))
+    cfg_path = tmp_path / "toolkit.yaml"
+    cfg_path.write_text("shows_root: A\n", encoding="utf-8")
+    _age(cfg_path)
+
+    assert load_config_cached(str(cfg_path)) == {"shows_root": "A"}
+    (cache_file,) = cache_dir.iterdir()
+
+    # a hit is served from the cache file, not the YAML
+    entry = json.loads(cache_file.read_text(encoding="utf-8"))
+    entry["config"] = {"shows_root": "from-cache"}
+    cache_file.write_text(json.dumps(entry), encoding="utf-8")
+    assert load_config_cached(str(cfg_path)) == {"shows_root": "from-cache"}
+
+    cfg_path.write_text("shows_root: B\n", encoding="utf-8")
+    _age(cfg_path, 30)
+    assert load_config_cached(str(cfg_path)) == {"shows_root": "B"}
+
+
+def test_load_config_cached_skips_recent_and_non_json_configs(tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("TOOLKIT_CACHE_DIR", str(cache_dir))
+    recent = tmp_path / "recent.yaml"
+    recent.write_text("shows_root: A\n", encoding="utf-8")
+    dated = tmp_path / "dated.yaml"
+    dated.write_text("released: 2024-01-01\n", encoding="utf-8")
+    _age(dated)
+
+    assert load_config_cached(str(recent)) == {"shows_root": "A"}
+    assert load_config_cached(str(dated))["released"].year == 2024
+    assert not cache_dir.exists()
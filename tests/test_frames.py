@@ -0,0 +1,75 @@
+import pytest
+
+from toolkit.frames import (
+    format_frame_ranges,
+    frame_ranges,
+    missing_frame_numbers,
+    missing_ranges,
+    parse_frame_ranges,
+)
+
+
+def test_frame_ranges_collapses_runs():
+    assert frame_ranges([]) == []
+    assert frame_ranges([5]) == [(5, 5)]
+    assert frame_ranges([1, 2, 3, 5, 7, 8]) == [(1, 3), (5, 5), (7, 8)]
+    assert frame_ranges([1, 1, 2]) == [(1, 2)]
+
+
+def test_format_frame_ranges_with_padding():
+    assert format_frame_ranges([]) == ""
+    assert format_frame_ranges(list(range(1001, 1241)) + list(range(1242, 2001))) == "1001-1240,1242-2000"
+    assert format_frame_ranges([3, 5, 6, 7], padding=4) == "0003,0005-0007"
+
+
+def test_parse_frame_ranges_round_trips_and_accepts_lists():
+    frames = [1, 2, 3, 5, 10, 11]
+    assert parse_frame_ranges(format_frame_ranges(frames)) == frames
+    assert parse_frame_ranges("0003,0005-0007") == [3, 5, 6, 7]
+    assert parse_frame_ranges("") == []
+    assert parse_frame_ranges(None) == []
+    # backward-compatible read path for plain lists / JSON list text
+    assert parse_frame_ranges([1, 2, 4]) == [1, 2, 4]
+    assert parse_frame_ranges("[1, 2, 4]") == [1, 2, 4]
+
+
+def test_parse_frame_ranges_rejects_garbage():
+    with pytest.raises(ValueError):
+        parse_frame_ranges("1-x")
+    with pytest.raises(ValueError):
+        parse_frame_ranges(42)
+
+
+def test_missing_ranges_finds_gaps_in_order():
+    assert missing_ranges([]) == []
+    assert missing_ranges([7]) == []
+    assert missing_ranges(list(range(1, 1001))) == []
+    assert missing_ranges([1, 2, 4, 5, 9, 10, 12]) == [(3, 3), (6, 8), (11, 11)]
+    assert missing_ranges([1, 2, 3, 9999]) == [(4, 9998)]
+    assert missing_ranges(list(range(1, 11, 2))) == [(2, 2), (4, 4), (6, 6), (8, 8)]
+
+
+def test_missing_gaps_tolerate_duplicate_frames():
+    assert missing_ranges([1, 1, 3]) == [(2, 2)]
+    assert missing_ranges([1, 3, 3, 5]) == [(2, 2), (4, 4)]
+    assert missing_frame_numbers([1, 1, 3]) == [2]
+    assert missing_frame_numbers([1, 3, 3, 5]) == [2, 4]
+    # span small enough for the bitmap path
+    assert missing_frame_numbers([1, 1, 3, 5, 5, 7]) == [2, 4, 6]
+
+
+def test_missing_frame_numbers_matches_naive_walk():
+    import random
+
+    rng = random.Random(7)
+    for _ in range(100):
+        frames = sorted(rng.sample(range(1000, 1300), rng.randint(1, 250)))
+        if rng.random() < 0.3:
+            frames = sorted(frames + rng.sample(frames, max(1, len(frames) // 5)))
+        have = set(frames)
+        naive = [f for f in range(frames[0], frames[-1] + 1) if f not in have]
+        assert missing_frame_numbers(frames) == naive
+        assert frame_ranges(naive) == missing_ranges(frames)
+    assert missing_frame_numbers([]) == []
+    assert missing_frame_numbers(list(range(1, 11, 2))) == [2, 4, 6, 8]
+    assert missing_frame_numbers([1, 2, 3, 9999]) == list(range(4, 9999))
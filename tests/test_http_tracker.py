@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from toolkit.tracking.base import PublishRecord
+from toolkit.tracking.http_stub import StubTrackingServer
+from toolkit.tracking.http_tracker import HttpTracker
+
+
+def _rec(show: str, shot: str, version: str, ts: str) -> PublishRecord:
+    return PublishRecord(
+        show=show,
+        shot=shot,
+        version=version,
+        status="warnings",
+        note="n",
+        timestamp_utc=ts,
+        frames_found=[1, 2, 4],
+        missing_frames=[3],
+        total_bytes=30,
+        file_count=3,
+    )
+
+
+@pytest.fixture
+def stub():
+    server = StubTrackingServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_tracker_round_trips_in_batches_over_one_connection(stub):
+    tracker = HttpTracker(stub.url + "/api", batch_size=2, backoff=0)
+    records = [_rec("demo_show", "shot010", f"v{i:03d}", f"2026-01-0{i}T00:00:00Z") for i in range(1, 6)]
+    tracker.record_publishes(records)
+
+    assert [m for m, _ in stub.requests] == ["POST"] * 3
+    assert stub.rows[0]["frames_found"] == "1-2,4"
+    assert tracker.list_publishes() == list(reversed(records))
+    assert stub.connections == 1
+    assert tracker.connections_opened == 1
+
+
+def test_http_tracker_pushes_filters_and_limit_and_pages(stub):
+    tracker = HttpTracker(stub.url, page_size=2, backoff=0)
+    tracker.record_publishes([
+        _rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z"),
+        _rec("demo_show", "shot010", "v002", "2026-01-03T00:00:00Z"),
+        _rec("demo_show", "shot020", "v001", "2026-01-02T00:00:00Z"),
+        _rec("demo_show", "shot010", "v003", "2026-01-04T00:00:00Z"),
+        _rec("other_show", "shot010", "v001", "2026-01-05T00:00:00Z"),
+    ])
+    stub.requests.clear()
+
+    rows = tracker.list_publishes(show="demo_show", shot="shot010", limit=3)
+    assert [r.version for r in rows] == ["v003", "v002", "v001"]
+    assert stub.requests == [
+        ("GET", "/publishes?limit=2&show=demo_show&shot=shot010"),
+        ("GET", "/publishes?limit=1&show=demo_show&shot=shot010&cursor=2"),
+    ]
+    assert [r.show for r in tracker.list_publishes()] == ["other_show"] + ["demo_show"] * 4
+    assert tracker.list_publishes(limit=0) == []
+
+
+def test_http_tracker_retries_with_idempotent_posts(stub):
+    tracker = HttpTracker(stub.url, retries=2, backoff=0)
+    stub.fail_next = [503, 502]
+    tracker.record_publish(_rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z"))
+    assert len(stub.rows) == 1
+
+    stub.fail_next = [503, 503, 503]
+    with pytest.raises(ConnectionError, match="HTTP 503"):
+        tracker.list_publishes()
+
+    stub.fail_next = [400]
+    with pytest.raises(ConnectionError, match="HTTP 400"):
+        tracker.list_publishes()
+    assert len(stub.requests) == 1 + 2 + 3 + 1  # 400 is not retried
+
+    # a batch replayed with the same key (response lost after the server stored it) is stored once
+    assert stub.store([{"show": "x"}], "key-1") == 1
+    assert stub.store([{"show": "x"}], "key-1") == 0
+
+
+def test_http_tracker_reconnects_after_server_closes_idle_connection(stub):
+    tracker = HttpTracker(stub.url, retries=0, backoff=0)
+    tracker.record_publish(_rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z"))
+    for conn in tracker._idle:
+        conn.sock.close()  # the pooled socket is dead, as after a server-side idle timeout
+
+    assert len(tracker.list_publishes()) == 1
+    assert tracker.connections_opened == 2
+
+
+def test_http_tracker_rejects_bad_url():
+    with pytest.raises(ValueError):
+        HttpTracker("ftp://tracker")
@@ -1,5 +1,9 @@
+import json
+from dataclasses import replace
 from pathlib import Path
 
+import pytest
+
 from toolkit.tracking.base import PublishRecord
 from toolkit.tracking.json_tracker import JsonTracker
 
@@ -27,3 +31,108 @@ def test_json_tracker_records_and_lists(tmp_path: Path):
     assert rows[0].show == "demo_show"
     assert rows[0].shot == "shot010"
     assert rows[0].version == "v001"
+
+
+def _rec(version: str, ts: str, show: str = "demo_show") -> PublishRecord:
+    return PublishRecord(
+        show=show,
+        shot="shot010",
+        version=version,
+        status="ok",
+        note="",
+        timestamp_utc=ts,
+        frames_found=[1],
+        missing_frames=[],
+        total_bytes=1,
+        file_count=1,
+    )
+
+
+def test_json_tracker_jsonl_appends_one_line_per_publish(tmp_path: Path):
+    db = tmp_path / "tracking_db.jsonl"
+    tracker = JsonTracker(db, fmt="jsonl")
+
+    tracker.record_publish(_rec("v001", "2026-01-01T00:00:00Z"))
+    tracker.record_publish(_rec("v002", "2026-01-02T00:00:00Z"))
+
+    lines = db.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])["version"] == "v002"
+    assert [r.version for r in tracker.list_publishes()] == ["v002", "v001"]
+
+
+def test_json_tracker_jsonl_migrates_legacy_list_and_skips_torn_lines(tmp_path: Path):
+    db = tmp_path / "tracking_db.json"
+    JsonTracker(db).record_publish(_rec("v001", "2026-01-01T00:00:00Z"))
+    assert db.read_text(encoding="utf-8").lstrip().startswith("[")
+
+    tracker = JsonTracker(db, fmt="jsonl")
+    tracker.record_publish(_rec("v002", "2026-01-02T00:00:00Z"))
+    with db.open("a", encoding="utf-8") as f:
+        f.write('{"show": "torn"')
+    tracker.record_publish(_rec("v003", "2026-01-03T00:00:00Z"))
+
+    assert [r.version for r in tracker.list_publishes()] == ["v003", "v002", "v001"]
+
+
+def test_json_tracker_compact_dedupes_and_sorts(tmp_path: Path):
+    db = tmp_path / "tracking_db.jsonl"
+    tracker = JsonTracker(db, fmt="jsonl")
+    tracker.record_publish(_rec("v002", "2026-01-02T00:00:00Z"))
+    tracker.record_publish(_rec("v001", "2026-01-01T00:00:00Z"))
+    tracker.record_publish(_rec("v002", "2026-01-02T00:00:00Z"))
+    with db.open("a", encoding="utf-8") as f:
+        f.write('{"not": "a record"}\n')
+
+    before, after = tracker.compact()
+
+    assert (before, after) == (4, 2)
+    rows = [json.loads(line) for line in db.read_text(encoding="utf-8").splitlines()]
+    assert [r["version"] for r in rows] == ["v001", "v002"]
+
+
+def test_json_tracker_rejects_unknown_format(tmp_path: Path):
+    with pytest.raises(ValueError):
+        JsonTracker(tmp_path / "db.json", fmt="xml")
+
+
+def test_json_tracker_ranges_storage_reads_old_and_new_rows(tmp_path: Path):
+    db = tmp_path / "tracking_db.jsonl"
+    JsonTracker(db, fmt="jsonl").record_publish(_rec("v001", "2026-01-01T00:00:00Z"))
+
+    tracker = JsonTracker(db, fmt="jsonl", frames_format="ranges")
+    rec = replace(_rec("v002", "2026-01-02T00:00:00Z"), frames_found=list(range(1, 10001)))
+    tracker.record_publish(rec)
+
+    last = json.loads(db.read_text(encoding="utf-8").splitlines()[-1])
+    assert last["frames_found"] == "1-10000"
+    assert last["missing_frames"] == ""
+
+    rows = tracker.list_publishes()
+    assert rows[0].frames_found == list(range(1, 10001))
+    assert rows[1].frames_found == [1]
+
+
+def test_json_tracker_concurrent_writers_keep_every_record(tmp_path: Path):
+    import subprocess
+    import sys
+
+    path = tmp_path / "tracking.json"
+    script = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from toolkit.tracking.base import PublishRecord\n"
+        "from toolkit.tracking.json_tracker import JsonTracker\n"
+        "t = JsonTracker(Path(sys.argv[1]))\n"
+        "for i in range(20):\n"
+        "    t.record_publish(PublishRecord('show', sys.argv[2], f'v{i:03d}', 'ok', '', '2026-01-01T00:00:00Z', [1], [], 1, 1))\n"
+    )
+    root = Path(__file__).resolve().parents[1]
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script, str(path), f"shot{n}"], cwd=str(root))
+        for n in range(4)
+    ]
+    assert [p.wait() for p in procs] == [0, 0, 0, 0]
+
+    assert len(JsonTracker(path).list_publishes()) == 80
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tracking.json", "tracking.json.lock"]
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from toolkit.metrics import ScanMetrics, write_textfile
+
+
+def _samples(text: str) -> dict[str, str]:
+    out = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            out[name] = value
+    return out
+
+
+def test_render_text_format_and_omitted_families():
+    m = ScanMetrics("disk")
+    m.add_shot("show_a", "shot010", total_bytes=30, allocated_bytes=4096, file_count=3)
+    m.add_shot('we"ird\\show', "shot020", total_bytes=0, allocated_bytes=0, file_count=0)
+    m.finish()
+    text = m.render()
+    samples = _samples(text)
+
+    assert samples['toolkit_shot_bytes{command="disk",show="show_a",shot="shot010"}'] == "30"
+    assert samples['toolkit_shot_files{command="disk",show="we\\"ird\\\\show",shot="shot020"}'] == "0"
+    assert samples['toolkit_scan_shots{command="disk"}'] == "2"
+    assert samples['toolkit_scan_files{command="disk"}'] == "3"
+    assert float(samples['toolkit_scan_duration_seconds{command="disk"}']) >= 0
+    assert "toolkit_shot_missing_frames" not in text
+    assert "toolkit_tracker_records" not in text
+    # every family is announced once, before its samples
+    assert text.count("# TYPE toolkit_shot_bytes gauge") == 1
+    assert text.index("# TYPE toolkit_shot_bytes gauge") < text.index("toolkit_shot_bytes{")
+    assert text.endswith("\n")
+
+
+def test_tracker_record_counts_and_frame_files():
+    m = ScanMetrics("report")
+    m.add_shot("show_a", "shot010", frames=3, missing_frames=1)
+    m.tracker_records = {"show_a": 2, "show_b": 1}
+    samples = _samples(m.render())
+
+    assert samples['toolkit_scan_files{command="report"}'] == "3"
+    assert samples['toolkit_tracker_records{command="report",show="show_a"}'] == "2"
+    assert samples['toolkit_tracker_records{command="report",show="show_b"}'] == "1"
+
+
+def test_write_textfile_replaces_atomically(tmp_path: Path):
+    path = tmp_path / "textfile" / "toolkit.prom"
+    write_textfile(path, "a 1\n")
+    write_textfile(path, "a 2\n")
+    assert path.read_text(encoding="utf-8") == "a 2\n"
+    assert [p.name for p in path.parent.iterdir()] == ["toolkit.prom"]
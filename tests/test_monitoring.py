@@ -1,5 +1,8 @@
+import os
 from pathlib import Path
 
+import pytest
+
 from toolkit.monitoring import _dir_size_bytes, disk_usage_by_shot, format_bytes, bytes_to_mb
 
 
@@ -43,4 +46,22 @@ def test_disk_usage_by_shot_reports_expected_totals(tmp_path: Path):
 
 def test_bytes_to_mb():
     assert bytes_to_mb(0) == 0.0
-    assert bytes_to_mb(1024 * 1024) == 1.0
\ No newline at end of file
+    assert bytes_to_mb(1024 * 1024) == 1.0
+
+@pytest.mark.skipif(not hasattr(os.stat_result, "st_blocks"), reason="st_blocks is POSIX-only")
+@pytest.mark.parametrize("workers", [1, 4])
+def test_disk_usage_counts_hardlinked_frames_once_across_shots(tmp_path: Path, workers: int):
+    shows_root = tmp_path / "shows"
+    shot010 = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    shot020 = shows_root / "demo_show" / "shots" / "shot020" / "renders"
+    _touch_with_size(shot010 / "frame_0001.exr", 8192)
+    shot020.mkdir(parents=True)
+    os.link(shot010 / "frame_0001.exr", shot020 / "frame_0001.exr")
+    alloc = os.stat(shot010 / "frame_0001.exr").st_blocks * 512
+
+    first, second = disk_usage_by_shot(shows_root, workers=workers)
+
+    assert (first.total_bytes, second.total_bytes) == (8192, 8192)
+    assert (first.allocated_bytes, second.allocated_bytes) == (alloc, 0)
+    assert second.usage_bytes("apparent") == 8192
+    assert second.usage_bytes("allocated") == 0
@@ -0,0 +1,98 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from toolkit import profiling
+from toolkit.validation import validate_renders
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+@pytest.fixture(autouse=True)
+def _profiling_off():
+    profiling.disable()
+    yield
+    profiling.disable()
+
+
+def test_disabled_phase_is_shared_noop():
+    assert profiling.active() is None
+    assert profiling.phase("a") is profiling.phase("b")
+
+    @profiling.timed("fn")
+    def fn(x):
+        return x + 1
+
+    assert fn(1) == 2
+
+
+def test_profiler_collects_phases_calls_and_shots():
+    profiler = profiling.enable()
+
+    @profiling.timed("fn")
+    def fn():
+        return None
+
+    fn()
+    fn()
+    with profiling.phase("block"):
+        pass
+    profiler.shot("show", "shot010", 0.5)
+    profiler.shot("show", "shot010", 0.25)
+    profiler.shot("show", "shot020", 0.1)
+
+    summary = profiler.summary(top_shots=1)
+    assert summary["phases"]["fn"]["calls"] == 2
+    assert summary["phases"]["block"]["calls"] == 1
+    assert summary["shots_timed"] == 2
+    assert summary["slowest_shots"] == [{"show": "show", "shot": "shot010", "seconds": 0.75}]
+
+
+def test_scan_phases_recorded_when_enabled(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for shot in ("shot010", "shot020"):
+        renders = shows_root / "demo_show" / "shots" / shot / "renders"
+        _touch(renders / "frame_0001.exr")
+        _touch(renders / "frame_0003.exr")
+
+    profiler = profiling.enable()
+    validate_renders(shows_root, frame_prefix="frame_", frame_padding=4, frame_ext=".exr")
+    summary = profiler.summary()
+
+    assert summary["phases"]["scan.regex"]["calls"] == 4
+    assert summary["phases"]["scan.shot"]["calls"] == 2
+    assert summary["phases"]["validate.missing"]["calls"] == 2
+    assert "scan.stat" not in summary["phases"]  # validation does not stat files
+    assert {s["shot"] for s in summary["slowest_shots"]} == {"shot010", "shot020"}
+
+
+def test_cli_disk_profile_out(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(renders / "frame_0001.exr", 10)
+    _touch(renders / "frame_0002.exr", 10)
+    (tmp_path / "toolkit.yaml").write_text(f'shows_root: "{shows_root.as_posix()}"\n', encoding="utf-8")
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "toolkit", "disk", "--json", "--no-cache",
+         "--profile-out", "profile.json", "--cprofile-out", "disk.prof"],
+        cwd=str(tmp_path),
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0
+    assert json.loads(proc.stdout)["results"][0]["file_count"] == 2
+    profile = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert profile["command"] == "disk"
+    assert {"command", "config", "scan.list", "scan.stat", "output.encode"} <= set(profile["phases"])
+    assert profile["phases"]["scan.stat"]["calls"] == 2
+    assert profile["slowest_shots"][0]["shot"] == "shot010"
+    assert (tmp_path / "disk.prof").stat().st_size > 0
+    assert "profile phase=scan.stat" in (tmp_path / "logs" / "toolkit.log").read_text(encoding="utf-8")
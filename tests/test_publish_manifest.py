@@ -1,7 +1,8 @@
+import hashlib
 import json
 from pathlib import Path
 
-from toolkit.publishing import publish_shot, write_publish_manifest
+from toolkit.publishing import frame_checksums, publish_shot, write_publish_manifest
 from toolkit.tracking.json_tracker import JsonTracker
 
 
@@ -45,4 +46,80 @@ def test_write_publish_manifest_creates_file(tmp_path: Path):
     assert data["record"]["show"] == "demo_show"
     assert data["record"]["shot"] == "shot010"
     assert data["record"]["version"] == "v001"
-    assert "source_render_dir" in data
\ No newline at end of file
+    assert "source_render_dir" in data
+
+
+def test_write_publish_manifest_ranges_format(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    for f in (1, 2, 3, 5):
+        _touch(renders / f"frame_{f:04d}.exr", 10)
+
+    result = publish_shot(
+        shows_root=shows_root,
+        show="demo_show",
+        shot="shot010",
+        version="v001",
+        note="",
+        tracker=JsonTracker(tmp_path / "tracking.json"),
+        frame_prefix="frame_",
+        frame_padding=4,
+        frame_ext=".exr",
+    )
+
+    manifest_path = write_publish_manifest(
+        publish_root=tmp_path / "published",
+        shows_root=shows_root,
+        record=result.record,
+        frames_format="ranges",
+    )
+
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert data["frames_format"] == "ranges"
+    assert data["record"]["frames_found"] == "1-3,5"
+    assert data["record"]["missing_frames"] == "4"
+
+
+def test_write_publish_manifest_with_frame_checksums(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(renders / "frame_0001.exr", 10)
+    _touch(renders / "frame_0002.exr", 20)
+
+    result = publish_shot(
+        shows_root=shows_root,
+        show="demo_show",
+        shot="shot010",
+        version="v001",
+        note="",
+        tracker=JsonTracker(tmp_path / "tracking.json"),
+        frame_prefix="frame_",
+        frame_padding=4,
+        frame_ext=".exr",
+    )
+    checksums = frame_checksums(
+        renders,
+        result.record.frames_found,
+        frame_prefix="frame_",
+        frame_padding=4,
+        frame_ext=".exr",
+        algorithm="sha256",
+        workers=2,
+    )
+
+    manifest_path = write_publish_manifest(
+        publish_root=tmp_path / "published",
+        shows_root=shows_root,
+        record=result.record,
+        checksums=checksums,
+        checksum_algorithm="sha256",
+    )
+
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert data["checksums"] == {
+        "algorithm": "sha256",
+        "files": {
+            "frame_0001.exr": hashlib.sha256(b"x" * 10).hexdigest(),
+            "frame_0002.exr": hashlib.sha256(b"x" * 20).hexdigest(),
+        },
+    }
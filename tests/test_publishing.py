@@ -1,7 +1,7 @@
 import pytest
 from pathlib import Path
 from toolkit.publishing import publish_shot
-from toolkit.publishing import PublishError
+from toolkit.publishing import PublishError, PublishRequest, parse_publish_requests, publish_shots
 from toolkit.tracking.json_tracker import JsonTracker
 
 
@@ -84,3 +84,122 @@ def test_publish_shot_warns_if_no_frames(tmp_path: Path):
     assert result.record.frames_found == []
     assert result.record.missing_frames == []
     assert result.record.status == "warnings"
+
+
+def test_publish_shot_does_not_scan_other_shots(tmp_path: Path, monkeypatch):
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(renders / "frame_0001.exr", 10)
+    _touch(shows_root / "other_show" / "shots" / "shot020" / "renders" / "frame_0001.exr", 10)
+
+    def _no_tree_walk(*args, **kwargs):
+        raise AssertionError("publish_shot must not walk shows_root")
+
+    monkeypatch.setattr("toolkit.validation.iter_shot_render_dirs", _no_tree_walk)
+    monkeypatch.setattr("toolkit.validation.validate_renders", _no_tree_walk)
+
+    result = publish_shot(
+        shows_root=shows_root,
+        show="demo_show",
+        shot="shot010",
+        version="v001",
+        note="",
+        tracker=JsonTracker(tmp_path / "tracking.json"),
+        frame_prefix="frame_",
+        frame_padding=4,
+        frame_ext=".exr",
+    )
+
+    assert result.record.frames_found == [1]
+    assert result.record.status == "ok"
+
+
+def test_publish_shot_lists_render_dir_once(tmp_path: Path, monkeypatch):
+    import os
+
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(renders / "frame_0001.exr", 10)
+    _touch(renders / "frame_0003.exr", 10)
+    _touch(renders / "aovs" / "depth.exr", 5)
+
+    listed = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(Path(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    result = publish_shot(
+        shows_root=shows_root,
+        show="demo_show",
+        shot="shot010",
+        version="v001",
+        note="",
+        tracker=JsonTracker(tmp_path / "tracking.json"),
+        frame_prefix="frame_",
+        frame_padding=4,
+        frame_ext=".exr",
+    )
+
+    assert listed.count(renders) == 1
+    assert (result.record.frames_found, result.record.missing_frames) == ([1, 3], [2])
+    assert (result.record.total_bytes, result.record.file_count) == (25, 3)
+
+
+def test_parse_publish_requests_csv_and_json():
+    csv_text = "show,shot,version,note\ndemo_show,shot010,v002,hello\ndemo_show,shot020,,\n"
+    assert parse_publish_requests(csv_text) == [
+        PublishRequest("demo_show", "shot010", "v002", "hello"),
+        PublishRequest("demo_show", "shot020", "v001", ""),
+    ]
+
+    json_text = '{"publishes": [{"show": "demo_show", "shot": "shot010"}]}'
+    assert parse_publish_requests(json_text) == [PublishRequest("demo_show", "shot010")]
+
+    with pytest.raises(PublishError):
+        parse_publish_requests('[{"show": "demo_show"}]', "json")
+
+
+class _CountingTracker(JsonTracker):
+    def __init__(self, path):
+        super().__init__(path)
+        self.batches = []
+
+    def record_publishes(self, records):
+        self.batches.append(len(records))
+        super().record_publishes(records)
+
+
+def test_publish_shots_writes_one_batch_and_reports_failures(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for shot in ("shot010", "shot020"):
+        _touch(shows_root / "demo_show" / "shots" / shot / "renders" / "frame_0001.exr", 10)
+
+    tracker = _CountingTracker(tmp_path / "tracking.json")
+    requests = [
+        PublishRequest("demo_show", "shot010", "v001"),
+        PublishRequest("demo_show", "missing_shot", "v001"),
+        PublishRequest("demo_show", "shot020", "v003", "batch"),
+    ]
+
+    results = publish_shots(
+        requests,
+        shows_root=shows_root,
+        tracker=tracker,
+        frame_prefix="frame_",
+        frame_padding=4,
+        frame_ext=".exr",
+        workers=3,
+        publish_root=tmp_path / "published",
+    )
+
+    assert [r.request for r in results] == requests
+    assert results[1].record is None
+    assert "Shot path not found" in results[1].error
+    assert results[2].record.note == "batch"
+    assert results[2].manifest_path == tmp_path / "published" / "demo_show" / "shot020" / "v003" / "publish.json"
+    assert results[2].manifest_path.exists()
+    assert tracker.batches == [2]
+    assert len(tracker.list_publishes()) == 2
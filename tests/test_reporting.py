@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from toolkit.monitoring import disk_usage_by_shot
+from toolkit.reporting import iter_shot_reports, latest_publishes
+from toolkit.tracking.base import PublishRecord
+from toolkit.tracking.json_tracker import JsonTracker
+from toolkit.validation import validate_renders
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def _record(show: str, shot: str, version: str, ts: str) -> PublishRecord:
+    return PublishRecord(show, shot, version, "ok", "", ts, [1, 2], [], 20, 2)
+
+
+def _make_tree(shows_root: Path) -> None:
+    for show in ("show_a", "show_b"):
+        for i, shot in enumerate(("shot010", "shot020")):
+            renders = shows_root / show / "shots" / shot / "renders"
+            for f in (1, 2, 4 + i):
+                _touch(renders / f"frame_{f:04d}.exr", 10 * f)
+
+
+def test_latest_publishes_keeps_newest_per_shot(tmp_path: Path):
+    tracker = JsonTracker(tmp_path / "tracking.json")
+    tracker.record_publishes([
+        _record("show_a", "shot010", "v001", "2026-01-01T00:00:00Z"),
+        _record("show_a", "shot010", "v002", "2026-01-02T00:00:00Z"),
+        _record("show_b", "shot010", "v001", "2026-01-03T00:00:00Z"),
+    ])
+
+    latest = latest_publishes(tracker)
+    assert {k: r.version for k, r in latest.items()} == {("show_a", "shot010"): "v002", ("show_b", "shot010"): "v001"}
+    assert list(latest_publishes(tracker, show="show_b")) == [("show_b", "shot010")]
+    assert len(latest_publishes(tracker, show="show_*")) == 2
+
+
+def test_iter_shot_reports_joins_scan_and_tracker(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+    tracker = JsonTracker(tmp_path / "tracking.json")
+    tracker.record_publishes([
+        _record("show_a", "shot010", "v001", "2026-01-01T00:00:00Z"),
+        _record("show_a", "shot010", "v002", "2026-01-02T00:00:00Z"),
+        _record("show_b", "shot020", "v001", "2026-01-01T00:00:00Z"),
+    ])
+
+    reports = list(iter_shot_reports(shows_root, tracker=tracker, workers=2))
+    validation = validate_renders(shows_root)
+    disk = disk_usage_by_shot(shows_root)
+
+    assert [(r.show, r.shot, r.frames_found, r.missing_frames) for r in reports] == [
+        (v.show, v.shot, v.frames_found, v.missing_frames) for v in validation
+    ]
+    assert [(r.total_bytes, r.file_count, r.allocated_bytes) for r in reports] == [
+        (d.total_bytes, d.file_count, d.allocated_bytes) for d in disk
+    ]
+    assert [r.latest_publish.version if r.latest_publish else None for r in reports] == ["v002", None, None, "v001"]
+
+
+def test_iter_shot_reports_without_tracker(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    reports = list(iter_shot_reports(shows_root, show="show_b", shot="shot020"))
+    assert [(r.show, r.shot, r.missing_frames, r.latest_publish) for r in reports] == [
+        ("show_b", "shot020", [3, 4], None)
+    ]
+
+
+def test_iter_shot_reports_raises_tracker_errors_without_shots(tmp_path: Path):
+    class BrokenTracker:
+        def list_publishes(self, show=None, shot=None, limit=None):
+            raise ConnectionError("tracker down")
+
+    shows_root = tmp_path / "shows"
+    _make_tree(shows_root)
+
+    with pytest.raises(ConnectionError):
+        next(iter_shot_reports(shows_root, tracker=BrokenTracker()))
+    with pytest.raises(ConnectionError):
+        list(iter_shot_reports(shows_root, tracker=BrokenTracker(), show="no_such_show"))
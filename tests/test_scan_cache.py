@@ -0,0 +1,165 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from toolkit.monitoring import disk_usage_by_shot
+from toolkit.scan_cache import ScanCache
+from toolkit.validation import validate_renders
+
+OLD_NS = 1_600_000_000 * 1_000_000_000
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def _age_dirs(root: Path) -> None:
+    """Push directory mtimes into the past so the cache does not treat them as racy"""
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(OLD_NS, OLD_NS))
+
+
+def _make_shot(shows_root: Path) -> Path:
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(renders / "frame_0001.exr", 10)
+    _touch(renders / "frame_0002.exr", 10)
+    _touch(renders / "frame_0004.exr", 10)
+    _touch(renders / "aovs" / "depth.exr", 5)
+    _age_dirs(shows_root)
+    return renders
+
+
+def test_scan_cache_hits_on_second_run_and_persists(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_shot(shows_root)
+    cache_path = tmp_path / "data" / "scan_cache.json"
+
+    cache = ScanCache(cache_path)
+    first = validate_renders(shows_root, cache=cache)
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache_path.exists()
+
+    cache = ScanCache(cache_path)
+    second = validate_renders(shows_root, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert second == first
+    assert second[0].missing_frames == [3]
+
+
+def test_scan_cache_rescans_when_dir_mtime_changes(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = _make_shot(shows_root)
+    cache = ScanCache(tmp_path / "scan_cache.json")
+    validate_renders(shows_root, cache=cache)
+
+    _touch(renders / "frame_0003.exr", 10)
+    os.utime(renders, ns=(OLD_NS + 1, OLD_NS + 1))
+
+    results = validate_renders(shows_root, cache=cache)
+    assert results[0].missing_frames == []
+    assert cache.misses == 2
+
+
+def test_scan_cache_disk_tracks_subdirectory_changes(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = _make_shot(shows_root)
+    cache = ScanCache(tmp_path / "scan_cache.json")
+
+    assert disk_usage_by_shot(shows_root, cache=cache)[0].total_bytes == 35
+    assert disk_usage_by_shot(shows_root, cache=cache)[0].total_bytes == 35
+    assert cache.hits == 1
+
+    _touch(renders / "aovs" / "crypto.exr", 7)
+    os.utime(renders / "aovs", ns=(OLD_NS + 1, OLD_NS + 1))
+
+    assert disk_usage_by_shot(shows_root, cache=cache)[0].total_bytes == 42
+
+
+def test_scan_cache_skips_recently_modified_dirs(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _touch(shows_root / "demo_show" / "shots" / "shot010" / "renders" / "frame_0001.exr")
+    cache = ScanCache(tmp_path / "scan_cache.json")
+
+    validate_renders(shows_root, cache=cache)
+    validate_renders(shows_root, cache=cache)
+
+    assert cache.hits == 0
+
+
+@pytest.mark.skipif(not hasattr(os.stat_result, "st_blocks"), reason="st_blocks is POSIX-only")
+def test_scan_cache_keeps_allocated_bytes_and_hardlinks(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    renders = _make_shot(shows_root)
+    other = shows_root / "demo_show" / "shots" / "shot020" / "renders"
+    other.mkdir(parents=True)
+    os.link(renders / "frame_0001.exr", other / "frame_0001.exr")
+    _age_dirs(shows_root)
+    cache_path = tmp_path / "data" / "scan_cache.json"
+
+    cache = ScanCache(cache_path)
+    first = disk_usage_by_shot(shows_root, cache=cache)
+    cache.save()
+
+    cache = ScanCache(cache_path)
+    second = disk_usage_by_shot(shows_root, cache=cache)
+    assert cache.hits == 2
+    assert second == first
+    assert second[1].total_bytes == 10
+    assert second[1].allocated_bytes == 0
+
+
+def test_scan_cache_with_process_executor(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    _make_shot(shows_root)
+    cache_path = tmp_path / "data" / "scan_cache.json"
+
+    cache = ScanCache(cache_path)
+    first = disk_usage_by_shot(shows_root, workers=2, executor="process", cache=cache)
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache = ScanCache(cache_path)
+    second = disk_usage_by_shot(shows_root, workers=2, executor="process", cache=cache)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert second == first == disk_usage_by_shot(shows_root)
+
+
+def test_scan_cache_save_uses_per_process_temp_file(tmp_path: Path, monkeypatch):
+    shows_root = tmp_path / "shows"
+    _make_shot(shows_root)
+    cache = ScanCache(tmp_path / "scan_cache.json")
+    validate_renders(shows_root, cache=cache)
+
+    replaced = []
+    real_replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: (replaced.append(Path(src).name), real_replace(src, dst)))
+    cache.save()
+
+    assert replaced == [f"scan_cache.json.{os.getpid()}.tmp"]
+    assert [p.name for p in tmp_path.iterdir() if p.is_file()] == ["scan_cache.json"]
+
+
+def test_scan_cache_prunes_deleted_render_dirs_and_keeps_filtered_ones(tmp_path: Path):
+    import json
+    import shutil
+
+    shows_root = tmp_path / "shows"
+    renders = _make_shot(shows_root)
+    other = shows_root / "other_show" / "shots" / "shot010" / "renders"
+    _touch(other / "frame_0001.exr", 10)
+    _age_dirs(shows_root)
+    cache_path = tmp_path / "scan_cache.json"
+
+    cache = ScanCache(cache_path)
+    validate_renders(shows_root, cache=cache)
+    cache.save()
+
+    # a filtered run keeps the other show's entry; a deleted shot is dropped
+    shutil.rmtree(renders.parent)
+    cache = ScanCache(cache_path)
+    validate_renders(shows_root, cache=cache, show="no_such_show")
+    cache.save()
+    assert list(json.loads(cache_path.read_text(encoding="utf-8"))["entries"]) == [other.as_posix()]
@@ -0,0 +1,205 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from toolkit import scanning
+from toolkit.scanning import iter_shot_render_dirs, scan_render_dir, scan_render_dirs
+from toolkit.validation import _build_frame_regex
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def test_scan_render_dir_collects_frames_bytes_and_counts(tmp_path: Path):
+    render_dir = tmp_path / "renders"
+    _touch(render_dir / "frame_0002.exr", 10)
+    _touch(render_dir / "frame_0001.exr", 20)
+    _touch(render_dir / "notes.txt", 5)
+    _touch(render_dir / "sub" / "frame_0003.exr", 7)
+
+    rx = _build_frame_regex(prefix="frame_", padding=4, ext=".exr")
+    scan = scan_render_dir(render_dir, rx)
+
+    # frames are top-level only; sizes/counts are recursive
+    assert scan.frames == [1, 2]
+    assert scan.total_bytes == 42
+    assert scan.file_count == 4
+
+
+def test_scan_render_dir_without_sizes_skips_stats(tmp_path: Path):
+    render_dir = tmp_path / "renders"
+    _touch(render_dir / "frame_0001.exr", 10)
+    _touch(render_dir / "sub" / "frame_0002.exr", 10)
+
+    rx = _build_frame_regex(prefix="frame_", padding=4, ext=".exr")
+    scan = scan_render_dir(render_dir, rx, sizes=False)
+
+    assert scan.frames == [1]
+    assert scan.total_bytes == 0
+    assert scan.file_count == 0
+
+
+def test_scan_render_dir_raises_for_missing_dir(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        scan_render_dir(tmp_path / "nope")
+
+
+def test_iter_shot_render_dirs_sorted_and_skips_incomplete_layouts(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    (shows_root / "b_show" / "shots" / "shot020" / "renders").mkdir(parents=True)
+    (shows_root / "b_show" / "shots" / "shot010" / "renders").mkdir(parents=True)
+    (shows_root / "a_show" / "shots" / "shot010" / "renders").mkdir(parents=True)
+    (shows_root / "a_show" / "shots" / "shot099").mkdir(parents=True)  # no renders
+    (shows_root / "no_shots_show").mkdir(parents=True)
+    _touch(shows_root / "stray_file.txt")
+
+    found = [(show, shot) for show, shot, _ in iter_shot_render_dirs(shows_root)]
+
+    assert found == [("a_show", "shot010"), ("b_show", "shot010"), ("b_show", "shot020")]
+
+
+
+def test_iter_shot_render_dirs_filters_before_listing(tmp_path: Path, monkeypatch):
+    shows_root = tmp_path / "shows"
+    for show in ("alpha", "beta", "gamma"):
+        for shot in ("shot010", "shot100", "shot110", "shot200"):
+            (shows_root / show / "shots" / shot / "renders").mkdir(parents=True)
+
+    listed = []
+    real_list = scanning._list_subdirs
+    monkeypatch.setattr(scanning, "_list_subdirs", lambda p: listed.append(p) or real_list(p))
+
+    found = [(show, shot) for show, shot, _ in iter_shot_render_dirs(shows_root, show="beta", shot="shot1*")]
+    assert found == [("beta", "shot100"), ("beta", "shot110")]
+    assert listed == [shows_root / "beta" / "shots"]
+
+    listed.clear()
+    found = [(show, shot) for show, shot, _ in iter_shot_render_dirs(shows_root, show="[ab]*", shot="shot010")]
+    assert found == [("alpha", "shot010"), ("beta", "shot010")]
+    assert listed == [shows_root]
+
+    assert list(iter_shot_render_dirs(shows_root, show="delta")) == []
+    assert list(iter_shot_render_dirs(shows_root, show="..", shot="*")) == []
+
+def test_scan_render_dirs_parallel_keeps_input_order(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for i in range(12):
+        renders = shows_root / f"show{i % 3}" / "shots" / f"shot{i:03d}" / "renders"
+        for f in range(1, i + 2):
+            _touch(renders / f"frame_{f:04d}.exr", 1)
+
+    rx = _build_frame_regex(prefix="frame_", padding=4, ext=".exr")
+    serial = list(scan_render_dirs(iter_shot_render_dirs(shows_root), rx, workers=1))
+    parallel = list(scan_render_dirs(iter_shot_render_dirs(shows_root), rx, workers=4))
+
+    assert [(s, t) for s, t, _, _ in parallel] == [(s, t) for s, t, _, _ in serial]
+    assert [scan for _, _, _, scan in parallel] == [scan for _, _, _, scan in serial]
+
+
+def test_scan_render_dirs_process_executor_matches_serial(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for i in range(9):
+        renders = shows_root / f"show{i % 3}" / "shots" / f"shot{i:03d}" / "renders"
+        for f in range(1, i + 2):
+            if f != 2:
+                _touch(renders / f"frame_{f:04d}.exr", f)
+        _touch(renders / "aovs" / "depth.exr", 3)
+
+    rx = _build_frame_regex(prefix="frame_", padding=4, ext=".exr")
+    items = list(iter_shot_render_dirs(shows_root))
+    items.append(("show9", "shot999", tmp_path / "gone" / "renders"))  # vanished dir -> empty
+    serial = list(scan_render_dirs(items, rx, workers=1))
+    processes = list(scan_render_dirs(items, rx, workers=3, executor="process"))
+
+    assert processes == serial
+    assert processes[-1][3].file_count == 0
+
+
+def test_scan_render_dirs_rejects_unknown_executor(tmp_path: Path):
+    with pytest.raises(ValueError):
+        list(scan_render_dirs([], workers=2, executor="gpu"))
+
+
+def test_scan_render_dirs_treats_vanished_dir_as_empty(tmp_path: Path):
+    gone = tmp_path / "gone" / "renders"
+
+    [(_, _, _, scan)] = list(scan_render_dirs([("show", "shot", gone)], workers=2))
+
+    assert scan.frames == []
+    assert scan.total_bytes == 0
+    assert scan.file_count == 0
+
+
+@pytest.mark.skipif(not hasattr(os.stat_result, "st_blocks"), reason="st_blocks is POSIX-only")
+def test_scan_render_dir_allocated_bytes_sparse_and_hardlinks(tmp_path: Path):
+    render_dir = tmp_path / "renders"
+    render_dir.mkdir()
+    with open(render_dir / "frame_0001.exr", "wb") as f:
+        f.truncate(10 * 1024 * 1024)  # sparse: large apparent size, (almost) nothing allocated
+    _touch(render_dir / "frame_0002.exr", 5000)
+    os.link(render_dir / "frame_0002.exr", render_dir / "frame_0003.exr")
+
+    scan = scan_render_dir(render_dir)
+    data_alloc = os.stat(render_dir / "frame_0002.exr").st_blocks * 512
+    sparse_alloc = os.stat(render_dir / "frame_0001.exr").st_blocks * 512
+
+    assert scan.total_bytes == 10 * 1024 * 1024 + 2 * 5000
+    assert scan.file_count == 3
+    assert scan.allocated_bytes == sparse_alloc + data_alloc  # hardlinked inode counted once
+    assert sparse_alloc < 10 * 1024 * 1024
+    st = os.stat(render_dir / "frame_0002.exr")
+    assert scan.linked == ((st.st_dev, st.st_ino, data_alloc),)
+
+
+def test_ordered_map_bounds_in_flight_and_reads_input_lazily():
+    from concurrent.futures import ThreadPoolExecutor
+
+    pulled = []
+
+    def items():
+        for i in range(50):
+            pulled.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = scanning._ordered_map(pool, lambda i: i * i, items(), window=4)
+        assert next(results) == (0, 0)
+        assert len(pulled) <= 5
+        rest = list(results)
+
+    assert [r for _, r in rest] == [i * i for i in range(1, 50)]
+
+
+def test_ordered_map_runs_ahead_of_a_slow_head_up_to_the_buffer():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    release = threading.Event()
+    pulled = []
+    seen_while_blocked = []
+
+    def items():
+        for i in range(20):
+            pulled.append(i)
+            yield i
+
+    def fn(i):
+        if i == 0:
+            release.wait(5)
+        return i * i
+
+    def unblock():
+        seen_while_blocked.append(len(pulled))
+        release.set()
+
+    timer = threading.Timer(0.3, unblock)
+    timer.start()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(scanning._ordered_map(pool, fn, items(), window=2, buffered=6))
+
+    assert results == [(i, i * i) for i in range(20)]
+    # the free worker kept going past the slow head, but only up to window + buffered
+    assert seen_while_blocked == [8]
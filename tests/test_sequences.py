@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from toolkit.sequences import group_sequences, scan_sequences
+from toolkit.validation import iter_validate_sequences
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def _summary(sequences) -> list[tuple]:
+    return [(s.pattern, s.frames_found, s.missing_frames) for s in sequences]
+
+
+def test_group_sequences_splits_aov_passes():
+    names = [
+        "beauty.1001.exr", "beauty.1002.exr", "beauty.1004.exr",
+        "depth.1001.exr", "depth.1002.exr",
+        "crypto_v002.1001.exr",
+        "notes.txt", "thumb.jpg",
+    ]
+
+    assert _summary(group_sequences(names)) == [
+        ("beauty.####.exr", [1001, 1002, 1004], [1003]),
+        ("crypto_v002.####.exr", [1001], []),
+        ("depth.####.exr", [1001, 1002], []),
+    ]
+
+
+def test_group_sequences_mixed_padding_and_overflow():
+    names = ["plate.0999.exr", "plate.1000.exr", "plate.00001.exr", "plate.00002.exr",
+             "comp.9999.exr", "comp.10000.exr", "f_9.png", "f_10.png", "f_12.png", "clip.mp4"]
+
+    assert _summary(group_sequences(names)) == [
+        ("comp.####.exr", [9999, 10000], []),
+        ("f_#.png", [9, 10, 12], [11]),
+        ("plate.####.exr", [999, 1000], []),
+        ("plate.#####.exr", [1, 2], []),
+    ]
+
+
+def test_group_sequences_include_patterns():
+    names = ["beauty.1001.exr", "beauty.1001.dpx", "depth.1001.exr", "beauty.1001.exr.tmp"]
+
+    found = group_sequences(names, include=["beauty.*.exr", "*.dpx"])
+    assert [s.pattern for s in found] == ["beauty.####.dpx", "beauty.####.exr"]
+
+
+def test_scan_sequences_lists_top_level_files_only(tmp_path: Path):
+    _touch(tmp_path / "beauty.0001.exr")
+    _touch(tmp_path / "beauty.0003.exr")
+    _touch(tmp_path / "aovs" / "depth.0001.exr")
+    (tmp_path / "cache.0001.d").mkdir()
+
+    assert _summary(scan_sequences(tmp_path)) == [("beauty.####.exr", [1, 3], [2])]
+
+
+def test_iter_validate_sequences_parallel_matches_serial(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for i in range(6):
+        renders = shows_root / f"show{i % 2}" / "shots" / f"shot{i:03d}" / "renders"
+        for f in range(1, 5 + i):
+            if f != 3:
+                _touch(renders / f"beauty.{f:04d}.exr")
+            _touch(renders / f"depth.{f:04d}.exr")
+
+    serial = list(iter_validate_sequences(shows_root))
+    parallel = list(iter_validate_sequences(shows_root, workers=3))
+
+    assert parallel == serial
+    assert [(r.show, r.shot) for r in serial][:2] == [("show0", "shot000"), ("show0", "shot002")]
+    assert _summary(serial[0].sequences) == [
+        ("beauty.####.exr", [1, 2, 4], [3]),
+        ("depth.####.exr", [1, 2, 3, 4], []),
+    ]
@@ -0,0 +1,198 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from toolkit.serving import ServeState, _etag_matches, make_server, serve
+from toolkit.scan_cache import ScanCache
+from toolkit.tracking.base import PublishRecord
+from toolkit.tracking.json_tracker import JsonTracker
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def _record(show: str, shot: str, version: str, ts: str) -> PublishRecord:
+    return PublishRecord(show, shot, version, "ok", "", ts, [1, 2], [], 20, 2)
+
+
+@pytest.fixture
+def served(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    for f in (1, 2, 4):
+        _touch(shows_root / "show_a" / "shots" / "shot010" / "renders" / f"frame_{f:04d}.exr", 10)
+    _touch(shows_root / "show_a" / "shots" / "shot020" / "renders" / "frame_0001.exr", 10)
+    tracker = JsonTracker(tmp_path / "tracking.json")
+    tracker.record_publishes([
+        _record("show_a", "shot010", "v001", "2026-01-01T00:00:00Z"),
+        _record("show_a", "shot010", "v002", "2026-01-02T00:00:00Z"),
+        _record("show_a", "shot020", "v001", "2026-01-03T00:00:00Z"),
+    ])
+    state = ServeState(shows_root, tracker=tracker, cache=ScanCache(tmp_path / "scan_cache.json"))
+    state.refresh()
+    server = make_server(state, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield state, f"http://{host}:{port}", shows_root, tracker
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str, etag: str = None):
+    req = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.headers.get("ETag"), resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("ETag"), e.read()
+
+
+def test_validate_and_disk_answer_from_memory_with_etags(served):
+    state, base, shows_root, _ = served
+
+    status, etag, body = _get(base + "/validate")
+    assert status == 200 and etag
+    payload = json.loads(body)
+    assert payload["command"] == "validate"
+    assert [(r["shot"], r["missing_frames"]) for r in payload["results"]] == [("shot010", [3]), ("shot020", [])]
+
+    assert _get(base + "/validate", etag)[0] == 304
+    assert _get(base + "/validate", f'W/{etag}, "other"')[0] == 304
+
+    disk = json.loads(_get(base + "/disk")[2])
+    assert [r["file_count"] for r in disk["results"]] == [3, 1]
+
+    # an unchanged rescan keeps the snapshot (and its ETag); a new frame changes it
+    state.refresh()
+    assert _get(base + "/validate", etag)[0] == 304
+    _touch(shows_root / "show_a" / "shots" / "shot010" / "renders" / "frame_0003.exr", 10)
+    state.refresh()
+    status, new_etag, body = _get(base + "/validate", etag)
+    assert status == 200 and new_etag != etag
+    assert json.loads(body)["results"][0]["missing_frames"] == []
+
+
+def test_publishes_filters_and_reloads_changed_tracker(served):
+    state, base, _, tracker = served
+
+    payload = json.loads(_get(base + "/publishes?show=show_a&shot=shot010")[2])
+    assert [r["version"] for r in payload["records"]] == ["v002", "v001"]
+    assert payload["filters"] == {"show": "show_a", "shot": "shot010", "limit": 50}
+    assert json.loads(_get(base + "/publishes?limit=1")[2])["count"] == 1
+    assert json.loads(_get(base + "/publishes?shot=shot020")[2])["count"] == 1
+    assert _get(base + "/publishes?limit=x")[0] == 400
+    assert _get(base + "/nope")[0] == 404
+
+    _, etag, _ = _get(base + "/publishes?show=show_a")
+    assert _get(base + "/publishes?show=show_a", etag)[0] == 304
+    tracker.record_publish(_record("show_a", "shot020", "v002", "2026-01-04T00:00:00Z"))
+    state.refresh()
+    status, _, body = _get(base + "/publishes?show=show_a", etag)
+    assert status == 200
+    assert json.loads(body)["records"][0]["version"] == "v002"
+    assert 'toolkit_tracker_records{command="serve",show="show_a"} 4' in state.metrics.render()
+
+
+def test_refresher_survives_unexpected_errors_and_reports_status(tmp_path: Path):
+    import time
+
+    class FlakyTracker:
+        broken = False
+
+        def list_publishes(self, show=None, shot=None, limit=None):
+            if self.broken:
+                raise RuntimeError("boom")
+            return []
+
+    _touch(tmp_path / "shows" / "show_a" / "shots" / "shot010" / "renders" / "frame_0001.exr", 10)
+    tracker = FlakyTracker()
+    state = ServeState(tmp_path / "shows", tracker=tracker)
+    ready = threading.Event()
+    bound = []
+    errors = []
+
+    def on_ready(host, port):
+        bound.append(f"http://{host}:{port}")
+        ready.set()
+
+    thread = threading.Thread(
+        target=serve,
+        args=(state,),
+        kwargs={"port": 0, "interval": 0.05, "duration": 2.0, "on_ready": on_ready, "on_error": errors.append},
+        daemon=True,
+    )
+    thread.start()
+    assert ready.wait(5)
+    status = json.loads(_get(bound[0] + "/status")[2])
+    assert status["command"] == "status"
+    assert status["ok"] is True and status["last_error"] is None
+
+    tracker.broken = True
+    time.sleep(0.3)
+    status = json.loads(_get(bound[0] + "/status")[2])
+    assert status["ok"] is False
+    assert status["failures"] >= 2  # the refresher kept looping after the first failure
+    assert status["last_error"]["message"] == "RuntimeError: boom"
+    assert all(isinstance(e, RuntimeError) for e in errors)
+
+    refreshes = status["refreshes"]
+    tracker.broken = False
+    time.sleep(0.3)
+    status = json.loads(_get(bound[0] + "/status")[2])
+    assert status["ok"] is True
+    assert status["refreshes"] > refreshes
+    assert status["last_error"]["message"] == "RuntimeError: boom"  # kept for inspection
+    thread.join(5)
+
+
+def test_refresh_records_tracker_outage(tmp_path: Path):
+    from toolkit.tracking.http_stub import StubTrackingServer
+    from toolkit.tracking.http_tracker import HttpTracker
+
+    _touch(tmp_path / "shows" / "show_a" / "shots" / "shot010" / "renders" / "frame_0001.exr", 10)
+    server = StubTrackingServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state = ServeState(tmp_path / "shows", tracker=HttpTracker(server.url, retries=0))
+    state.refresh()
+    validate, metrics = state.snapshot("validate"), state.metrics
+
+    # the scan would change, but nothing is swapped in when the tracker read fails
+    _touch(tmp_path / "shows" / "show_a" / "shots" / "shot010" / "renders" / "frame_0003.exr", 10)
+    server.shutdown()
+    server.server_close()
+    state.tracker.close()  # the stub's handler threads would keep pooled keep-alive connections answering
+    with pytest.raises(ConnectionError):
+        state.refresh()
+    status = json.loads(state.status().body)
+    assert status["ok"] is False and status["failures"] == 1
+    assert status["last_error"]["message"].startswith("ConnectionError: GET")
+    assert state.snapshot("validate") == validate
+    assert state.metrics is metrics
+
+
+def test_publish_cache_keeps_only_recent_queries(served, monkeypatch):
+    from toolkit import serving
+
+    state, _, _, _ = served
+    monkeypatch.setattr(serving, "PUBLISH_CACHE_SIZE", 2)
+
+    first = state.publishes(limit=1)
+    state.publishes(limit=2)
+    assert state.publishes(limit=1) is first  # hit, now most recent
+    state.publishes(limit=3)  # evicts limit=2
+
+    assert list(state._publish_cache) == [(None, None, 1), (None, None, 3)]
+
+
+def test_etag_matches():
+    assert _etag_matches('"a"', '"a"')
+    assert _etag_matches('W/"a"', '"a"')
+    assert _etag_matches('"b", "a"', '"a"')
+    assert _etag_matches("*", '"a"')
+    assert not _etag_matches('"b"', '"a"')
@@ -0,0 +1,74 @@
+import sqlite3
+from pathlib import Path
+
+from toolkit.tracking.base import PublishRecord
+from toolkit.tracking.sqlite_tracker import SqliteTracker
+
+
+def _rec(show: str, shot: str, version: str, ts: str) -> PublishRecord:
+    return PublishRecord(
+        show=show,
+        shot=shot,
+        version=version,
+        status="warnings",
+        note="n",
+        timestamp_utc=ts,
+        frames_found=[1, 2, 4],
+        missing_frames=[3],
+        total_bytes=30,
+        file_count=3,
+    )
+
+
+def test_sqlite_tracker_round_trips_records(tmp_path: Path):
+    tracker = SqliteTracker(tmp_path / "tracking.sqlite3")
+    rec = _rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z")
+    tracker.record_publish(rec)
+
+    assert tracker.list_publishes() == [rec]
+
+
+def test_sqlite_tracker_filters_orders_and_limits_in_query(tmp_path: Path):
+    tracker = SqliteTracker(tmp_path / "tracking.sqlite3")
+    tracker.record_publish(_rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z"))
+    tracker.record_publish(_rec("demo_show", "shot010", "v002", "2026-01-03T00:00:00Z"))
+    tracker.record_publish(_rec("demo_show", "shot020", "v001", "2026-01-02T00:00:00Z"))
+    tracker.record_publish(_rec("other_show", "shot010", "v001", "2026-01-04T00:00:00Z"))
+
+    rows = tracker.list_publishes(show="demo_show")
+    assert [(r.shot, r.version) for r in rows] == [("shot010", "v002"), ("shot020", "v001"), ("shot010", "v001")]
+
+    rows = tracker.list_publishes(show="demo_show", shot="shot010", limit=1)
+    assert [r.version for r in rows] == ["v002"]
+
+    assert len(tracker.list_publishes(shot="shot010")) == 3
+    assert tracker.list_publishes(limit=0) == []
+
+
+def test_sqlite_tracker_uses_wal_and_indexes(tmp_path: Path):
+    db = tmp_path / "tracking.sqlite3"
+    tracker = SqliteTracker(db)
+    tracker.record_publish(_rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z"))
+    tracker.close()
+
+    conn = sqlite3.connect(str(db))
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM publishes WHERE show = ? ORDER BY timestamp_utc DESC LIMIT 50",
+            ("demo_show",),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert any("idx_publishes_show_ts" in row[-1] for row in plan)
+
+
+def test_sqlite_tracker_record_publishes_in_one_transaction(tmp_path: Path):
+    tracker = SqliteTracker(tmp_path / "tracking.sqlite3")
+    tracker.record_publishes([
+        _rec("demo_show", "shot010", "v001", "2026-01-01T00:00:00Z"),
+        _rec("demo_show", "shot020", "v001", "2026-01-02T00:00:00Z"),
+    ])
+
+    assert [r.shot for r in tracker.list_publishes()] == ["shot020", "shot010"]
@@ -3,6 +3,7 @@ import pytest
 
 from toolkit.tracking.factory import make_tracker
 from toolkit.tracking.json_tracker import JsonTracker
+from toolkit.tracking.sqlite_tracker import SqliteTracker
 
 
 def test_make_tracker_defaults_to_json_backend(tmp_path: Path, monkeypatch):
@@ -14,3 +15,31 @@ def test_make_tracker_defaults_to_json_backend(tmp_path: Path, monkeypatch):
 def test_make_tracker_raises_on_unknown_backend():
     with pytest.raises(ValueError):
         make_tracker({"tracking": {"backend": "nope"}})
+
+
+def test_make_tracker_passes_json_format(tmp_path: Path):
+    t = make_tracker({"tracking": {"json_format": "jsonl", "json_path": str(tmp_path / "db.jsonl")}})
+    assert isinstance(t, JsonTracker)
+    assert t.fmt == "jsonl"
+
+
+def test_make_tracker_raises_on_unknown_json_format():
+    with pytest.raises(ValueError):
+        make_tracker({"tracking": {"json_format": "xml"}})
+
+
+def test_make_tracker_sqlite_backend(tmp_path: Path):
+    t = make_tracker({"tracking": {"backend": "sqlite", "sqlite_path": str(tmp_path / "db.sqlite3")}})
+    assert isinstance(t, SqliteTracker)
+
+
+def test_make_tracker_http_backend(monkeypatch):
+    from toolkit.tracking.http_tracker import HttpTracker
+
+    monkeypatch.setenv("TRACKER_TOKEN", "secret")
+    t = make_tracker({"tracking": {"backend": "http", "http_url": "https://tracker.example/api", "http_token_env": "TRACKER_TOKEN", "http_batch_size": 50}})
+    assert isinstance(t, HttpTracker)
+    assert (t.token, t.batch_size, t.base_url) == ("secret", 50, "https://tracker.example/api")
+
+    with pytest.raises(ValueError):
+        make_tracker({"tracking": {"backend": "http"}})
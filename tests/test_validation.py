@@ -1,11 +1,15 @@
+import dataclasses
 from pathlib import Path
+import re
 
 from toolkit.validation import (
+    ShotValidationResult,
     _build_frame_regex,
     _collect_frame_numbers,
     _compute_missing,
     iter_shot_render_dirs,
     validate_renders,
+    validate_shot,
 )
 
 
@@ -49,6 +53,27 @@ def test_compute_missing_detects_gaps():
     assert _compute_missing([1, 2, 3]) == []
     assert _compute_missing([1, 2, 4]) == [3]
     assert _compute_missing([10, 12]) == [11]
+    assert _compute_missing([1, 1, 3]) == [2]
+
+
+def test_collect_frame_numbers_keeps_duplicates_from_permissive_regex(tmp_path: Path):
+    render_dir = tmp_path / "renders"
+    _touch(render_dir / "shot_0001.exr")
+    _touch(render_dir / "shot_1.exr")
+    _touch(render_dir / "shot_0004.exr")
+
+    frames = _collect_frame_numbers(render_dir, re.compile(r"^shot_(\d+)\.exr$"))
+
+    assert frames == [1, 1, 4]
+    assert _compute_missing(frames) == [2, 3]
+
+
+def test_shot_validation_result_keeps_missing_frames_field():
+    r = ShotValidationResult(show="s", shot="sh", render_dir=Path("r"), frames_found=[1, 3, 4, 7], missing_frames=[2, 5, 6])
+
+    assert dataclasses.asdict(r)["missing_frames"] == [2, 5, 6]
+    assert [f.name for f in dataclasses.fields(r)][-1] == "missing_frames"
+    assert r.missing_ranges == [(2, 2), (5, 6)]
 
 
 def test_iter_shot_render_dirs_finds_expected_structure(tmp_path: Path):
@@ -98,4 +123,19 @@ def test_validate_renders_handles_no_frames(tmp_path: Path):
     r = results[0]
     assert r.frames_found == []
     assert r.missing_frames == []
-    
\ No newline at end of file
+
+
+def test_validate_shot_reports_one_render_dir(tmp_path: Path):
+    shows_root = tmp_path / "shows"
+    render_dir = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    _touch(render_dir / "frame_0001.exr")
+    _touch(render_dir / "frame_0003.exr")
+    _touch(shows_root / "demo_show" / "shots" / "shot020" / "renders" / "frame_0001.exr")
+
+    r = validate_shot(render_dir, frame_prefix="frame_", frame_padding=4, frame_ext=".exr")
+
+    assert r.show == "demo_show"
+    assert r.shot == "shot010"
+    assert r.render_dir == render_dir
+    assert r.frames_found == [1, 3]
+    assert r.missing_frames == [2]
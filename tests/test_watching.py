@@ -0,0 +1,118 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from toolkit.validation import _build_frame_regex
+from toolkit.watching import FrameIndex, InotifyWatcher, PollingWatcher, watch
+
+RX = _build_frame_regex(prefix="frame_", padding=4, ext=".exr")
+
+
+def _touch(p: Path, size: int = 0) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"x" * size)
+
+
+def _shot(tmp_path: Path, frames=(1, 2, 4)) -> tuple[Path, Path]:
+    shows_root = tmp_path / "shows"
+    renders = shows_root / "demo_show" / "shots" / "shot010" / "renders"
+    for f in frames:
+        _touch(renders / f"frame_{f:04d}.exr", 10)
+    return shows_root, renders
+
+
+def test_frame_index_seed_and_incremental_updates(tmp_path: Path):
+    shows_root, renders = _shot(tmp_path)
+    index = FrameIndex(RX, warn_mb=0.00005)  # ~52 bytes
+
+    seed = index.seed(shows_root)
+    assert [(e.kind, e.missing_frames) for e in seed] == [("missing_frames", "0003")]
+
+    _touch(renders / "frame_0003.exr", 10)
+    events = index.apply(renders, "frame_0003.exr", True)
+    assert [(e.kind, e.missing_frames, e.frame_count) for e in events] == [("missing_frames", "", 4)]
+
+    _touch(renders / "frame_0006.exr", 20)
+    events = index.apply(renders, "frame_0006.exr", True)
+    assert {e.kind for e in events} == {"missing_frames", "disk_warning"}
+    assert events[-1].warning is True
+    assert events[-1].total_bytes == 60
+
+    (renders / "frame_0006.exr").unlink()
+    events = index.apply(renders, "frame_0006.exr", False)
+    assert [(e.kind, e.warning) for e in events] == [("missing_frames", False), ("disk_warning", False)]
+
+    # unrelated files only change sizes
+    assert index.apply(renders, "notes.txt", True) == []
+
+
+def test_frame_index_seed_filters_shots_and_lists_each_dir_once(tmp_path: Path, monkeypatch):
+    import os
+
+    shows_root, renders = _shot(tmp_path)
+    _touch(renders / "cache" / "deep" / "tmp.bin", 30)
+    _touch(shows_root / "demo_show" / "shots" / "shot020" / "renders" / "frame_0001.exr", 10)
+    _touch(shows_root / "other_show" / "shots" / "shot010" / "renders" / "frame_0001.exr", 10)
+
+    listed = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(Path(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    index = FrameIndex(RX)
+    index.seed(shows_root, show="demo_*", shot="shot010")
+
+    assert list(index.shots) == [renders]
+    assert index.shots[renders].total_bytes == 60
+    assert listed.count(renders) == 1
+
+
+def test_polling_watcher_reports_changed_dirs(tmp_path: Path):
+    _, renders = _shot(tmp_path)
+    watcher = PollingWatcher([renders])
+    assert watcher.poll(0) == []
+
+    time.sleep(0.01)
+    _touch(renders / "frame_0003.exr")
+    assert watcher.poll(0) == [(renders, None, True)]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_reports_file_events(tmp_path: Path):
+    _, renders = _shot(tmp_path)
+    watcher = InotifyWatcher([renders])
+    try:
+        _touch(renders / "frame_0003.exr", 5)
+        (renders / "frame_0001.exr").unlink()
+
+        events = []
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and (renders, "frame_0001.exr", False) not in events:
+            events.extend(watcher.poll(0.1))
+    finally:
+        watcher.close()
+
+    assert (renders, "frame_0003.exr", True) in events
+    assert (renders, "frame_0001.exr", False) in events
+
+
+def test_watch_emits_events_as_frames_land(tmp_path: Path):
+    shows_root, renders = _shot(tmp_path)
+    seen = []
+
+    def _render_missing_frame():
+        time.sleep(0.2)
+        _touch(renders / "frame_0003.exr", 10)
+
+    t = threading.Thread(target=_render_missing_frame)
+    t.start()
+    watch(shows_root, frame_re=RX, on_event=seen.append, backend="auto", interval=0.05, duration=1.0)
+    t.join()
+
+    assert [e.missing_frames for e in seen if e.kind == "missing_frames"] == ["0003", ""]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+import re
+from typing import AsyncIterator, Optional
+
+from .frames import frame_ranges
+from .scan_cache import ScanCache
+from .scanning import RenderDirScan, _matching_subdirs, _scan_or_empty
+from .validation import _build_frame_regex, _compute_missing
+
+
+@dataclass(frozen=True)
+class ShotScanResult:
+    """
+    Frames and (optionally) sizes for one shot render directory.
+    Size fields are 0 when scanned with sizes=False; allocated_bytes counts a
+    hardlinked inode only in the first shot yielded that contains it.
+    """
+    show: str
+    shot: str
+    render_dir: Path
+    frames_found: list[int]
+    missing_frames: list[int]
+    total_bytes: int = 0
+    file_count: int = 0
+    allocated_bytes: int = 0
+
+    @cached_property
+    def missing_ranges(self) -> list[tuple[int, int]]:
+        """missing_frames as inclusive (start, end) runs, computed on first use"""
+        return frame_ranges(self.missing_frames)
+
+
+def _list_subdir_names(path: Path, pattern: Optional[str] = None) -> list[str]:
+    """
+    Sorted sub-directory names of path matching pattern (name or glob; None = all).
+    [] if path is missing or not a directory.
+    """
+    return [name for name, _ in _matching_subdirs(path, pattern)]
+
+
+def _scan_if_present(
+        render_dir: Path,
+        frame_re: re.Pattern,
+        sizes: bool,
+        cache: Optional[ScanCache],
+) -> Optional[RenderDirScan]:
+    """
+    Scan render_dir (through the cache); None when the shot has no renders directory
+    """
+    if not render_dir.is_dir():
+        return None
+    return _scan_or_empty(render_dir, frame_re, sizes, cache)
+
+
+async def scan_shows(
+        shows_root: Path,
+        *,
+        frame_prefix: str = "frame_",
+        frame_padding: int = 4,
+        frame_ext: str = ".exr",
+        sizes: bool = False,
+        concurrency: int = 16,
+        cache: Optional[ScanCache] = None,
+        executor: Optional[Executor] = None,
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> AsyncIterator[ShotScanResult]:
+    """
+    Async scan of shows_root/<show>/shots/<shot>/renders for embedding in asyncio services:
+
+        async for result in scan_shows(shows_root, concurrency=32):
+            ...
+
+    Every blocking call (each directory listing, each render dir scan) runs in an
+    executor and at most `concurrency` run at once, so on high-latency mounts the
+    listings overlap instead of queueing, and the event loop is never blocked.
+    `concurrency` worker tasks take render dirs from a bounded queue fed by the
+    show/shot walk, and results are yielded as each scan completes (not in show/shot
+    order), so memory stays bounded by `concurrency` whatever the number of shots.
+    executor defaults to a private thread pool with `concurrency` threads (shut down
+    when the iteration ends). show/shot (names or globs) limit the walk as in
+    iter_shot_render_dirs.
+    """
+    frame_re = _build_frame_regex(frame_prefix, frame_padding, frame_ext)
+    loop = asyncio.get_running_loop()
+    workers = max(1, concurrency)
+    semaphore = asyncio.Semaphore(workers)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="toolkit-aio")
+
+    async def blocking(fn, *args):
+        async with semaphore:
+            return await loop.run_in_executor(executor, fn, *args)
+
+    todo: asyncio.Queue = asyncio.Queue(maxsize=workers)
+    done: asyncio.Queue = asyncio.Queue(maxsize=workers)
+
+    async def walk() -> None:
+        try:
+            for show_name in await blocking(_list_subdir_names, shows_root, show):
+                shots_dir = shows_root / show_name / "shots"
+                for shot_name in await blocking(_list_subdir_names, shots_dir, shot):
+                    await todo.put((show_name, shot_name, shots_dir / shot_name / "renders"))
+        except Exception as e:
+            await done.put(e)  # the consumer raises it and cancels the workers
+            return
+        for _ in range(workers):
+            await todo.put(None)
+
+    async def work() -> None:
+        try:
+            while (item := await todo.get()) is not None:
+                scan = await blocking(_scan_if_present, item[2], frame_re, sizes, cache)
+                if scan is not None:
+                    await done.put((item, scan))
+        except Exception as e:
+            await done.put(e)
+            return
+        await done.put(None)
+
+    tasks = [asyncio.ensure_future(walk())] + [asyncio.ensure_future(work()) for _ in range(workers)]
+    seen_links: set[tuple[int, int]] = set()
+    running = workers
+    try:
+        while running:
+            got = await done.get()
+            if got is None:
+                running -= 1
+                continue
+            if isinstance(got, Exception):
+                raise got
+            (show_name, shot_name, render_dir), scan = got
+            allocated = scan.allocated_bytes
+            for dev, ino, alloc in scan.linked:
+                if (dev, ino) in seen_links:
+                    allocated -= alloc
+                else:
+                    seen_links.add((dev, ino))
+            yield ShotScanResult(
+                show=show_name,
+                shot=shot_name,
+                render_dir=render_dir,
+                frames_found=scan.frames,
+                missing_frames=_compute_missing(scan.frames),
+                total_bytes=scan.total_bytes,
+                file_count=scan.file_count,
+                allocated_bytes=allocated,
+            )
+    finally:
+        # consumer stopped early (break / cancellation) or a scan failed: drop the rest
+        for task in tasks:
+            task.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
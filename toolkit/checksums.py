@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import profiling
+
+# blake2b/sha256 come with hashlib; the xxhash family needs the optional `xxhash` package.
+ALGORITHMS = ("blake2b", "sha256", "xxh64", "xxh3_64", "xxh3_128")
+DEFAULT_ALGORITHM = "blake2b"
+CHUNK_SIZE = 1 << 20
+
+# Files modified this recently are not cached (same rule as the scan cache): a rewrite
+# within the same mtime tick that keeps the size would otherwise go unnoticed.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def get_hasher(algorithm: str) -> Callable[[], object]:
+    """
+    Return a factory for a hashlib-style object (update()/hexdigest()).
+    Raises ValueError for unknown algorithms or when xxhash is not installed.
+    """
+    if algorithm == "blake2b":
+        return hashlib.blake2b
+    if algorithm == "sha256":
+        return hashlib.sha256
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unsupported checksum algorithm: {algorithm}. Expected one of: {', '.join(ALGORITHMS)}")
+    try:
+        import xxhash
+    except ImportError as e:
+        raise ValueError(f"Checksum algorithm {algorithm} requires the 'xxhash' package (pip install xxhash)") from e
+    return getattr(xxhash, algorithm)
+
+
+def hash_file(path: Path, algorithm: str = DEFAULT_ALGORITHM, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Hex digest of one file, read in fixed-size chunks into a reused buffer
+    """
+    h = get_hasher(algorithm)()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+class ChecksumCache:
+    """
+    Persistent file checksum cache (JSON file, e.g. data/checksum_cache.json).
+
+    Entries are keyed on (algorithm, path) and reused only while the file's size,
+    mtime_ns and inode are unchanged, so re-publishing a new version over mostly
+    unchanged frames only hashes the frames that changed.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def save(self) -> None:
+        """
+        Write the cache atomically if anything changed since it was loaded
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({"version": self.VERSION, "entries": self._entries})
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # per-process temp name: concurrent publishes must not write into each other's temp file
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _key(path: Path, algorithm: str) -> str:
+        return f"{algorithm}:{path.as_posix()}"
+
+    def lookup(self, path: Path, algorithm: str, st: os.stat_result) -> Optional[str]:
+        """
+        Return the cached digest if path still has the size/mtime/inode it was hashed with
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(path, algorithm))
+            if isinstance(entry, list) and entry[:3] == [st.st_size, st.st_mtime_ns, st.st_ino]:
+                self.hits += 1
+                return entry[3]
+            self.misses += 1
+            return None
+
+    def store(self, path: Path, algorithm: str, st: os.stat_result, digest: str) -> None:
+        if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._entries[self._key(path, algorithm)] = [st.st_size, st.st_mtime_ns, st.st_ino, digest]
+            self._dirty = True
+
+
+def _checksum_one(path: Path, algorithm: str, cache: Optional[ChecksumCache]) -> str:
+    if cache is None:
+        with profiling.phase("checksum.hash"):
+            return hash_file(path, algorithm)
+
+    st = os.stat(path)
+    digest = cache.lookup(path, algorithm, st)
+    if digest is not None:
+        return digest
+    with profiling.phase("checksum.hash"):
+        digest = hash_file(path, algorithm)
+    # only cache if the file did not change while it was read
+    after = os.stat(path)
+    if (after.st_size, after.st_mtime_ns, after.st_ino) == (st.st_size, st.st_mtime_ns, st.st_ino):
+        cache.store(path, algorithm, st, digest)
+    return digest
+
+
+def checksum_files(
+        paths: list[Path],
+        *,
+        algorithm: str = DEFAULT_ALGORITHM,
+        workers: int = 4,
+        cache: Optional[ChecksumCache] = None,
+) -> list[str]:
+    """
+    Hex digests for paths (same order), hashing up to `workers` files at a time.
+    hashlib and xxhash release the GIL while hashing large buffers, so threads
+    overlap both the reads and the hashing. Unchanged files are served from cache.
+    Raises ValueError for an unusable algorithm and OSError for unreadable files.
+    """
+    get_hasher(algorithm)  # fail fast before starting any reads
+    if workers <= 1 or len(paths) <= 1:
+        return [_checksum_one(p, algorithm, cache) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="toolkit-checksum") as pool:
+        return list(pool.map(lambda p: _checksum_one(p, algorithm, cache), paths))
@@ -1,14 +1,153 @@
+from __future__ import annotations
 import argparse
+from itertools import chain
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
-from .config import load_config
-from .logging_utils import setup_logging
-from .monitoring import bytes_to_mb, disk_usage_by_shot, format_bytes
-from .publishing import PublishError, publish_shot, write_publish_manifest
-from .tracking.factory import make_tracker
-from .validation import validate_renders
+from . import profiling
+from .config import load_config_cached
+from .frames import FRAME_FORMATS, format_frame_ranges
+
+if TYPE_CHECKING:
+    from .checksums import ChecksumCache
+    from .metrics import ScanMetrics
+    from .scan_cache import ScanCache
+
+# Command modules (yaml, scanning, publishing, tracking backends, logging) are
+# imported inside the command that needs them: the CLI runs from farm hooks
+# thousands of times a day, so startup only pays for what the command uses.
+
+
+class _DeferredLogger:
+    """
+    File logger that is set up on first use, so a command that logs nothing
+    never imports logging or creates the log dir. The first record written is
+    the command context line.
+    """
+
+    def __init__(self, log_dir: Path, *context):
+        self._log_dir = log_dir
+        self._context = context
+        self._logger = None
+
+    def __getattr__(self, name: str):
+        if self._logger is None:
+            from .logging_utils import setup_logging
+            self._logger = setup_logging(self._log_dir)
+            self._logger.info(*self._context)
+        return getattr(self._logger, name)
+
+
+def _save_scan_cache(cache: ScanCache | None, logger) -> None:
+    """
+    Persist the scan cache (if enabled) and log its hit/miss summary
+    """
+    if cache is None:
+        return
+    logger.info("scan_cache hits=%d misses=%d path=%s", cache.hits, cache.misses, cache.path)
+    try:
+        with profiling.phase("scan_cache.save"):
+            cache.save()
+    except OSError as e:
+        logger.warning("scan_cache_write_failed %s", e)
+
+
+def _write_metrics(metrics: ScanMetrics | None, path: Path | None, logger) -> None:
+    """
+    Atomically write the metrics textfile (if enabled); failures are logged, not raised
+    """
+    if metrics is None or path is None:
+        return
+    from .metrics import write_textfile
+    try:
+        write_textfile(path, metrics.render())
+    except OSError as e:
+        logger.warning("metrics_write_failed %s", e)
+        return
+    logger.info("metrics_written path=%s", path)
+
+
+def _checksum_settings(args: argparse.Namespace, publishing_cfg: dict) -> tuple[str | None, int, ChecksumCache | None]:
+    """
+    (algorithm, workers, cache) for manifest checksums; algorithm is None when disabled.
+    Raises ValueError if the algorithm is unknown or its package is not installed.
+    """
+    if not (args.checksums or args.checksum_algorithm or publishing_cfg.get("checksums", False)):
+        return None, 1, None
+    from .checksums import ChecksumCache, get_hasher
+
+    algorithm = args.checksum_algorithm or publishing_cfg.get("checksum_algorithm", "blake2b")
+    get_hasher(algorithm)
+    workers = int(publishing_cfg.get("checksum_workers", 4))
+    cache_path = publishing_cfg.get("checksum_cache_path", "data/checksum_cache.json")
+    cache = ChecksumCache(Path(cache_path)) if cache_path else None
+    return algorithm, workers, cache
+
+
+def _save_checksum_cache(cache: ChecksumCache | None, logger) -> None:
+    """
+    Persist the checksum cache (if enabled) and log its hit/miss summary
+    """
+    if cache is None:
+        return
+    logger.info("checksum_cache hits=%d misses=%d path=%s", cache.hits, cache.misses, cache.path)
+    try:
+        cache.save()
+    except OSError as e:
+        logger.warning("checksum_cache_write_failed %s", e)
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _print_ndjson(obj: dict) -> None:
+    """
+    Print one NDJSON line and flush so downstream readers see it immediately
+    """
+    with profiling.phase("output.encode"):
+        line = json.dumps(obj, separators=(",", ":"))
+    print(line, flush=True)
+
+
+def _print_json(payload: dict) -> None:
+    with profiling.phase("output.encode"):
+        text = json.dumps(payload, indent=2)
+    print(text)
+
+
+def _print_json_stream(
+        payload: dict,
+        key: str,
+        items: Iterable[dict],
+        tail: Optional[Callable[[], dict]] = None,
+) -> None:
+    """
+    Print payload with payload[key] = list(items), byte-for-byte as _print_json would,
+    but encode and write one item at a time so the list is never held in memory.
+    tail() is called once items are exhausted; its keys follow the list (e.g. totals).
+    payload must not be empty.
+    """
+    with profiling.phase("output.encode"):
+        head = json.dumps(payload, indent=2)[:-2]  # drop the closing "\n}"
+    write = sys.stdout.write
+    write(f"{head},\n  {json.dumps(key)}: [")
+    sep = "\n"
+    for item in items:
+        with profiling.phase("output.encode"):
+            text = json.dumps(item, indent=2).replace("\n", "\n    ")
+        write(f"{sep}    {text}")
+        sep = ",\n"
+    write("\n  ]" if sep != "\n" else "]")
+    for tail_key, value in (tail() if tail is not None else {}).items():
+        with profiling.phase("output.encode"):
+            text = json.dumps(value, indent=2).replace("\n", "\n  ")
+        write(f",\n  {json.dumps(tail_key)}: {text}")
+    write("\n}\n")
+    sys.stdout.flush()
 
 
 def main() -> int:
@@ -25,26 +164,127 @@ def main() -> int:
     validate_p = sub.add_parser("validate", help="Scan renders and report missing frames")
     disk_p = sub.add_parser("disk", help="Report disk usage by show/shot")
     publish_p = sub.add_parser("publish", help="Record publish metadata")
+    batch_p = sub.add_parser("publish-batch", help="Publish many shots from a CSV/JSON list in one run")
     list_p = sub.add_parser("list-publishes", help="List publish records from tracking backend")
+    report_p = sub.add_parser("report", help="Missing frames, disk usage and latest publish per shot from one scan")
+    watch_p = sub.add_parser("watch", help="Watch render dirs and report missing-frame / disk changes as files land")
+    serve_p = sub.add_parser("serve", help="Keep scan results and the tracker index in memory and answer a localhost HTTP API")
+    tracker_p = sub.add_parser("tracker", help="Tracking backend maintenance")
+    tracker_sub = tracker_p.add_subparsers(dest="tracker_command", required=True)
+    compact_p = tracker_sub.add_parser(
+        "compact",
+        help="Rewrite and de-duplicate the JSON tracker file (also migrates a list file to JSON Lines)",
+    )
 
     publish_p.add_argument("--show", required=True, help="Show name (e.g. demo_show)")
     publish_p.add_argument("--shot", required=True, help="Shot name (e.g. shot010)")
     publish_p.add_argument("--version", default="v001", help="Publish version (default: v001)")
     publish_p.add_argument("--note", default="", help="Optional publish note")
 
+    batch_p.add_argument("--input", default="-", help="CSV/JSON file of show,shot,version,note rows (default: - for stdin)")
+    batch_p.add_argument("--input-format", choices=("csv", "json"), default=None, help="Input format (default: from file suffix/content)")
+    batch_p.add_argument("--workers", type=int, default=None, help="Shots to validate in parallel (default: scan.workers or 1)")
+
+    validate_p.add_argument(
+        "--sequences",
+        action="store_true",
+        help="Detect every frame sequence (prefix, padding, ext) per render dir instead of the naming pattern (default: sequences.detect)",
+    )
+    validate_p.add_argument(
+        "--include",
+        action="append",
+        default=None,
+        help="File name glob for --sequences, repeatable (e.g. '*.exr'; default: sequences.include or all files)",
+    )
+
+    for p in (disk_p, report_p, serve_p):
+        p.add_argument(
+            "--accounting",
+            choices=("apparent", "allocated"),
+            default=None,
+            help="Size used for warnings: apparent st_size, or allocated blocks with hardlinks counted once (default: thresholds.disk_accounting or apparent)",
+        )
+
+    watch_p.add_argument("--show", default=None, help="Only watch shows matching this name or glob (e.g. 'demo_*')")
+    watch_p.add_argument("--shot", default=None, help="Only watch shots matching this name or glob (e.g. 'shot1*')")
+    watch_p.add_argument("--backend", choices=("auto", "inotify", "poll"), default="auto", help="Event source (default: auto = inotify on Linux, else polling)")
+    watch_p.add_argument("--interval", type=float, default=2.0, help="Poll interval / max wait in seconds (default: 2)")
+    watch_p.add_argument("--duration", type=float, default=None, help="Stop after this many seconds (default: run until interrupted)")
+    watch_p.add_argument("--format", choices=("text", "ndjson"), default=None, help="Event output format (default: text)")
+
+    serve_p.add_argument("--host", default=None, help="Address to bind (default: serve.host or 127.0.0.1)")
+    serve_p.add_argument("--port", type=int, default=None, help="Port to bind, 0 for any free port (default: serve.port or 8765)")
+    serve_p.add_argument("--interval", type=float, default=None, help="Seconds between refreshes (default: serve.interval or 30)")
+    serve_p.add_argument("--duration", type=float, default=None, help="Stop after this many seconds (default: run until interrupted)")
+
+    for p in (publish_p, batch_p):
+        p.add_argument("--checksums", action="store_true", help="Add per-frame checksums to the manifest (default: publishing.checksums)")
+        p.add_argument(
+            "--checksum-algorithm",
+            default=None,
+            help="blake2b, sha256, or xxh64/xxh3_64/xxh3_128 with xxhash installed; implies --checksums (default: publishing.checksum_algorithm or blake2b)",
+        )
+
+    for p in (validate_p, disk_p, report_p, serve_p):
+        p.add_argument("--show", default=None, help="Only scan shows matching this name or glob (e.g. 'demo_*')")
+        p.add_argument("--shot", default=None, help="Only scan shots matching this name or glob (e.g. 'shot1*')")
+        p.add_argument("--workers", type=int, default=None, help="Shot dirs to scan in parallel (default: scan.workers or 1)")
+        p.add_argument("--no-cache", action="store_true", help="Ignore and do not update the on-disk scan cache")
+        p.add_argument(
+            "--executor",
+            choices=("thread", "process"),
+            default=None,
+            help="Parallel scan mode for --workers > 1: threads, or processes sharded by show (default: scan.executor or thread)",
+        )
+        p.add_argument(
+            "--metrics-out",
+            default=None,
+            help="Write Prometheus textfile gauges here after each scan (default: <metrics.textfile_dir>/vfx_ops_toolkit_<command>.prom if set)",
+        )
+
+    for p in (validate_p, disk_p, report_p):
+        p.add_argument(
+            "--format",
+            choices=("text", "json", "ndjson"),
+            default=None,
+            help="Output format; ndjson streams one result per line as shots finish, then a summary line",
+        )
+
+    for p in (validate_p, publish_p, batch_p, list_p, report_p, serve_p):
+        p.add_argument(
+            "--frames-format",
+            choices=FRAME_FORMATS,
+            default=None,
+            help="Frame lists in JSON output: 'list' of ints or compact 'ranges' like 1001-1240,1242 (default: output.frames_format or list)",
+        )
+
     list_p.add_argument("--show", default=None, help="Filter by show")
     list_p.add_argument("--shot", default=None, help="Filter by shot")
     list_p.add_argument("--limit", type=int, default=50, help="Max records to display (default: 50)")
 
-    for p in (validate_p, disk_p, publish_p, list_p):
+    for p in (validate_p, disk_p, report_p, publish_p, batch_p, list_p, watch_p, serve_p, compact_p):
+        # no prefix matching: on a command without --show, "--show X" would silently be --shows-root X
+        p.allow_abbrev = False
         p.add_argument("--json", action="store_true", help="Output machine-readable JSON")
         p.add_argument("--log-dir", default=None, help="Directory for log files (default: ./logs)")
         p.add_argument("--config", default=None, help="Path to toolkit.yaml (default: ./toolkit.yaml)")
         p.add_argument("--shows-root", default=None, help="Override shows_root from config")
+        p.add_argument("--profile", action="store_true", help="Log per-phase timings and the slowest shots")
+        p.add_argument("--profile-out", default=None, help="Write the profile summary as JSON to this file (implies --profile)")
+        p.add_argument("--cprofile-out", default=None, help="Also dump cProfile stats to this file (implies --profile)")
 
     args = parser.parse_args()
+    return _run(args)
+
 
-    cfg = load_config(args.config)
+def _run(args: argparse.Namespace) -> int:
+    """
+    Resolve config and logging, then run the parsed command (profiled if requested)
+    """
+    profiler = profiling.enable() if (args.profile or args.profile_out or args.cprofile_out) else None
+
+    with profiling.phase("config"):
+        cfg = load_config_cached(args.config)
 
     # Resolve settings: CLI overrides config, then fall back to defaults
     shows_root = Path(args.shows_root or cfg.get("shows_root", "examples/shows"))
@@ -52,10 +292,66 @@ def main() -> int:
     log_dir_value = args.log_dir or cfg.get("log_dir", "logs")
     log_dir = Path(log_dir_value)
 
-    logger = setup_logging(log_dir)
-    logger.info("command=%s shows_root=%s", args.command, shows_root)
+    logger = _DeferredLogger(log_dir, "command=%s shows_root=%s", args.command, shows_root)
+
+    if profiler is None:
+        return _dispatch(args, cfg, shows_root, logger)
+    return _run_profiled(args, profiler, logger, lambda: _dispatch(args, cfg, shows_root, logger))
+
 
+def _run_profiled(args: argparse.Namespace, profiler: profiling.Profiler, logger, run) -> int:
+    """
+    Call run() under the profiler (and cProfile if requested), then log and
+    optionally write the summary
+    """
+    cprof = None
+    if args.cprofile_out:
+        import cProfile
+        cprof = cProfile.Profile()
+        cprof.enable()
+    try:
+        with profiler.phase("command"):
+            code = run()
+    finally:
+        if cprof is not None:
+            cprof.disable()
+        profiling.disable()
+
+    summary = profiler.summary()
+    for name, stat in summary["phases"].items():
+        logger.info("profile phase=%s calls=%d seconds=%.6f", name, stat["calls"], stat["seconds"])
+    for s in summary["slowest_shots"]:
+        logger.info("profile shot show=%s shot=%s seconds=%.6f", s["show"], s["shot"], s["seconds"])
+
+    try:
+        if args.profile_out:
+            out = Path(args.profile_out)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "tool": "vfx-ops-toolkit",
+                "command": args.command,
+                "timestamp": _utc_now(),
+                "exit_code": code,
+                **summary,
+            }
+            out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            logger.info("profile_written path=%s", out)
+        if cprof is not None:
+            Path(args.cprofile_out).parent.mkdir(parents=True, exist_ok=True)
+            cprof.dump_stats(args.cprofile_out)
+            logger.info("cprofile_written path=%s", args.cprofile_out)
+    except OSError as e:
+        logger.warning("profile_write_failed %s", e)
+    return code
+
+
+def _dispatch(args: argparse.Namespace, cfg: dict, shows_root: Path, logger) -> int:
+    """
+    Run the parsed command; each command imports only the modules it needs
+    """
     use_json = bool(args.json)
+    output_format = getattr(args, "format", None) or ("json" if use_json else "text")
+    use_json = output_format == "json"
 
     naming = cfg.get("naming", {}) if isinstance(cfg.get("naming", {}), dict) else {}
     frame_prefix = naming.get("frame_prefix", "frame_")
@@ -65,44 +361,199 @@ def main() -> int:
         frame_padding = 4
     frame_ext = naming.get("frame_ext", ".exr")
 
-    if args.command == "validate":
-        results = validate_renders(
-            shows_root,
-            frame_prefix=frame_prefix,
-            frame_padding=frame_padding,
-            frame_ext=frame_ext
-        )
+    output_cfg = cfg.get("output", {}) if isinstance(cfg.get("output", {}), dict) else {}
+    frames_format = getattr(args, "frames_format", None) or output_cfg.get("frames_format", "list")
+    if frames_format not in FRAME_FORMATS:
+        frames_format = "list"
 
-        if use_json:
-            payload = {
-                "tool": "vfx-ops-toolkit",
-                "command": "validate",
-                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-                "shows_root": shows_root.as_posix(),
-                "results": [
+    def frames_out(frames: list[int]):
+        return format_frame_ranges(frames) if frames_format == "ranges" else frames
+
+    scan_cfg = cfg.get("scan", {}) if isinstance(cfg.get("scan", {}), dict) else {}
+    workers_value = getattr(args, "workers", None)
+    if workers_value is None:
+        workers_value = scan_cfg.get("workers", 1)
+    try:
+        workers = max(1, int(workers_value))
+    except (TypeError, ValueError):
+        workers = 1
+
+    executor = getattr(args, "executor", None) or scan_cfg.get("executor", "thread")
+    if executor not in ("thread", "process"):
+        executor = "thread"
+
+    sequences_cfg = cfg.get("sequences", {}) if isinstance(cfg.get("sequences", {}), dict) else {}
+    detect_sequences = args.command == "validate" and bool(args.sequences or sequences_cfg.get("detect", False))
+
+    cache = None
+    if args.command in ("validate", "disk", "report", "serve") and not detect_sequences and not args.no_cache and scan_cfg.get("cache", True):
+        from .scan_cache import ScanCache
+        cache = ScanCache(Path(scan_cfg.get("cache_path", "data/scan_cache.json")))
+
+    metrics_cfg = cfg.get("metrics", {}) if isinstance(cfg.get("metrics", {}), dict) else {}
+    metrics_out = None
+    if args.command in ("validate", "disk", "report", "serve"):
+        if args.metrics_out:
+            metrics_out = Path(args.metrics_out)
+        elif metrics_cfg.get("textfile_dir"):
+            metrics_out = Path(metrics_cfg["textfile_dir"]) / f"vfx_ops_toolkit_{args.command}.prom"
+    metrics = None
+    if metrics_out is not None and args.command in ("validate", "disk", "report"):
+        from .metrics import ScanMetrics
+        metrics = ScanMetrics(args.command)
+
+    if args.command == "validate" and detect_sequences:
+        from .validation import iter_validate_sequences
+
+        include = args.include or sequences_cfg.get("include") or None
+        if isinstance(include, str):
+            include = [include]
+
+        counts = {"shots": 0, "shots_with_missing": 0}
+
+        def sequence_results():
+            for r in iter_validate_sequences(shows_root, include=include, workers=workers, show=args.show, shot=args.shot):
+                counts["shots"] += 1
+                missing = [seq for seq in r.sequences if seq.missing_frames]
+                if missing:
+                    counts["shots_with_missing"] += 1
+                for seq in missing:
+                    logger.warning(
+                        "missing_frames show=%s shot=%s sequence=%s missing=%s",
+                        r.show, r.shot, seq.pattern, format_frame_ranges(seq.missing_frames),
+                    )
+                if metrics is not None:
+                    metrics.add_shot(
+                        r.show,
+                        r.shot,
+                        frames=sum(len(seq.frames_found) for seq in r.sequences),
+                        missing_frames=sum(len(seq.missing_frames) for seq in r.sequences),
+                    )
+                yield r
+            if metrics is not None:
+                metrics.finish()
+                _write_metrics(metrics, metrics_out, logger)
+
+        def sequence_out(r) -> dict:
+            return {
+                "show": r.show,
+                "shot": r.shot,
+                "render_dir": r.render_dir.as_posix(),
+                "sequences": [
                     {
-                        "show": r.show,
-                        "shot": r.shot,
-                        "render_dir": r.render_dir.as_posix(),
-                        "frames_found": r.frames_found,
-                        "missing_frames": r.missing_frames
+                        "sequence": seq.pattern,
+                        "prefix": seq.prefix,
+                        "padding": seq.padding,
+                        "ext": seq.ext,
+                        "frames_found": frames_out(seq.frames_found),
+                        "missing_frames": frames_out(seq.missing_frames),
                     }
-                    for r in results
-                ]
+                    for seq in r.sequences
+                ],
             }
-            print(json.dumps(payload, indent=2))
-            had_missing = any(r.missing_frames for r in results)
-            return 1 if had_missing else 0
 
-        if not results:
-            print(f"No shots found under: {shows_root}")
-            return 0
+        payload = {
+            "tool": "vfx-ops-toolkit",
+            "command": "validate",
+            "timestamp": _utc_now(),
+            "shows_root": shows_root.as_posix(),
+            "frames_format": frames_format,
+        }
+
+        if output_format == "ndjson":
+            for r in sequence_results():
+                _print_ndjson({"type": "result", **sequence_out(r)})
+            _print_ndjson({"type": "summary", **payload, **counts})
+            return 1 if counts["shots_with_missing"] else 0
+
+        if use_json:
+            _print_json_stream(payload, "results", (sequence_out(r) for r in sequence_results()))
+            return 1 if counts["shots_with_missing"] else 0
 
-        results.sort(key=lambda r: (r.show, r.shot))
         current_show = None
-        had_missing = False
+        for r in sequence_results():
+            if r.show != current_show:
+                current_show = r.show
+                print(f"Show: {r.show}")
+            print(f"  Shot: {r.shot}")
 
-        for r in results:
+            if not r.sequences:
+                print("    No frame sequences found")
+                continue
+
+            for seq in r.sequences:
+                first, last = seq.frames_found[0], seq.frames_found[-1]
+                span = f"{first:0{seq.padding}d}-{last:0{seq.padding}d}" if last != first else f"{first:0{seq.padding}d}"
+                if seq.missing_frames:
+                    missing_str = format_frame_ranges(seq.missing_frames, padding=seq.padding).replace(",", ", ")
+                    print(f"    {seq.pattern} ({span})  Missing frames: {missing_str}")
+                else:
+                    print(f"    {seq.pattern} ({span})  OK")
+
+        if not counts["shots"]:
+            print(f"No shots found under: {shows_root}")
+        return 1 if counts["shots_with_missing"] else 0
+
+    if args.command == "validate":
+        from .validation import iter_validate_renders
+
+        # results stream straight from the scan (already in show/shot order) to the
+        # output, so memory stays bounded by one shot whatever the output format
+        counts = {"shots": 0, "shots_with_missing": 0}
+
+        def validate_results():
+            for r in iter_validate_renders(
+                shows_root,
+                frame_prefix=frame_prefix,
+                frame_padding=frame_padding,
+                frame_ext=frame_ext,
+                workers=workers,
+                cache=cache,
+                executor=executor,
+                show=args.show,
+                shot=args.shot,
+            ):
+                counts["shots"] += 1
+                if r.missing_frames:
+                    counts["shots_with_missing"] += 1
+                    logger.warning("missing_frames show=%s shot=%s missing=%s", r.show, r.shot, format_frame_ranges(r.missing_frames))
+                if metrics is not None:
+                    metrics.add_shot(r.show, r.shot, frames=len(r.frames_found), missing_frames=len(r.missing_frames))
+                yield r
+            _save_scan_cache(cache, logger)
+            if metrics is not None:
+                metrics.finish()
+                _write_metrics(metrics, metrics_out, logger)
+
+        def result_out(r) -> dict:
+            return {
+                "show": r.show,
+                "shot": r.shot,
+                "render_dir": r.render_dir.as_posix(),
+                "frames_found": frames_out(r.frames_found),
+                "missing_frames": frames_out(r.missing_frames),
+            }
+
+        payload = {
+            "tool": "vfx-ops-toolkit",
+            "command": "validate",
+            "timestamp": _utc_now(),
+            "shows_root": shows_root.as_posix(),
+            "frames_format": frames_format,
+        }
+
+        if output_format == "ndjson":
+            for r in validate_results():
+                _print_ndjson({"type": "result", **result_out(r)})
+            _print_ndjson({"type": "summary", **payload, **counts})
+            return 1 if counts["shots_with_missing"] else 0
+
+        if use_json:
+            _print_json_stream(payload, "results", (result_out(r) for r in validate_results()))
+            return 1 if counts["shots_with_missing"] else 0
+
+        current_show = None
+        for r in validate_results():
             if r.show != current_show:
                 current_show = r.show
                 print(f"Show: {r.show}")
@@ -113,75 +564,297 @@ def main() -> int:
                 continue
 
             if r.missing_frames:
-                had_missing = True
-                missing_str = ", ".join(f"{f:0{frame_padding}d}" for f in r.missing_frames)
+                missing_str = format_frame_ranges(r.missing_frames, padding=frame_padding).replace(",", ", ")
                 print(f"    Missing frames: {missing_str}")
-                logger.warning("missing_frames show=%s shot=%s missing=%s", r.show, r.shot, r.missing_frames)
             else:
                 print("    OK (no missing frames)")
 
-        return 1 if had_missing else 0
+        if not counts["shots"]:
+            print(f"No shots found under: {shows_root}")
+        return 1 if counts["shots_with_missing"] else 0
 
     if args.command == "disk":
-        results = disk_usage_by_shot(shows_root)
+        from .monitoring import ACCOUNTING_MODES, bytes_to_mb, format_bytes, iter_disk_usage
 
         thresholds = cfg.get("thresholds", {}) if isinstance(cfg.get("thresholds", {}), dict) else {}
         try:
             warn_mb = float(thresholds.get("disk_warning_mb", 0))
         except (TypeError, ValueError):
             warn_mb = 0.0
+        accounting = args.accounting or thresholds.get("disk_accounting", "apparent")
+        if accounting not in ACCOUNTING_MODES:
+            accounting = "apparent"
+
+        counts = {"shots": 0, "shots_with_warning": 0, "total_bytes": 0, "allocated_bytes": 0}
+
+        def disk_results():
+            for r in iter_disk_usage(
+                shows_root, workers=workers, cache=cache, executor=executor, show=args.show, shot=args.shot
+            ):
+                mb = bytes_to_mb(r.usage_bytes(accounting))
+                warn = (warn_mb > 0 and mb >= warn_mb)
+                counts["shots"] += 1
+                counts["total_bytes"] += r.total_bytes
+                counts["allocated_bytes"] += r.allocated_bytes
+                if warn:
+                    counts["shots_with_warning"] += 1
+                    logger.warning("disk_warning show=%s shot=%s mb=%.3f threshold=%.3f accounting=%s", r.show, r.shot, mb, warn_mb, accounting)
+                if metrics is not None:
+                    metrics.add_shot(
+                        r.show,
+                        r.shot,
+                        total_bytes=r.total_bytes,
+                        allocated_bytes=r.allocated_bytes,
+                        file_count=r.file_count,
+                    )
+                yield r, warn
+            _save_scan_cache(cache, logger)
+            if metrics is not None:
+                metrics.finish()
+                _write_metrics(metrics, metrics_out, logger)
+            logger.info("disk_scan_complete shots=%d", counts["shots"])
+
+        def usage_out(r, warn: bool) -> dict:
+            return {
+                "show": r.show,
+                "shot": r.shot,
+                "render_dir": r.render_dir.as_posix(),
+                "total_bytes": r.total_bytes,
+                "allocated_bytes": r.allocated_bytes,
+                "file_count": r.file_count,
+                "total_mb": round(bytes_to_mb(r.total_bytes), 3),
+                "allocated_mb": round(bytes_to_mb(r.allocated_bytes), 3),
+                "warning": warn,
+            }
+
+        if output_format == "ndjson":
+            for r, warn in disk_results():
+                _print_ndjson({"type": "result", **usage_out(r, warn)})
+            _print_ndjson({
+                "type": "summary",
+                "tool": "vfx-ops-toolkit",
+                "command": "disk",
+                "timestamp": _utc_now(),
+                "shows_root": shows_root.as_posix(),
+                "shots": counts["shots"],
+                "shots_with_warning": counts["shots_with_warning"],
+                "accounting": accounting,
+                "total_bytes": counts["total_bytes"],
+                "allocated_bytes": counts["allocated_bytes"],
+            })
+            return 0
 
         if use_json:
             payload = {
                 "tool": "vfx-ops-toolkit",
                 "command": "disk",
-                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "timestamp": _utc_now(),
                 "shows_root": shows_root.as_posix(),
-                "results": [
-                    {
-                        "show": r.show,
-                        "shot": r.shot,
-                        "render_dir": r.render_dir.as_posix(),
-                        "total_bytes": r.total_bytes,
-                        "file_count": r.file_count,
-                        "total_mb": round(bytes_to_mb(r.total_bytes), 3),
-                        "warning": (warn_mb > 0 and bytes_to_mb(r.total_bytes) >= warn_mb)
-                    }
-                    for r in results
-                ]
+                "accounting": accounting,
             }
-            print(json.dumps(payload, indent=2))
+            _print_json_stream(payload, "results", (usage_out(r, warn) for r, warn in disk_results()))
             return 0
 
         print(f"Disk usage under: {shows_root}")
-        if not results:
-            print("No shots found.")
-            return 0
-
-        results.sort(key=lambda r: (r.show, r.shot))
         current_show = None
 
-        for r in results:
+        for r, warn in disk_results():
             if r.show != current_show:
                 current_show = r.show
                 print(f"\nShow: {r.show}")
 
-            mb = bytes_to_mb(r.total_bytes)
-            warn = (warn_mb > 0 and mb >= warn_mb)
-
-            line = f"  Shot: {r.shot}  renders={format_bytes(r.total_bytes)} ({r.file_count} files)"
+            line = (
+                f"  Shot: {r.shot}  renders={format_bytes(r.total_bytes)}"
+                f" allocated={format_bytes(r.allocated_bytes)} ({r.file_count} files)"
+            )
             if warn:
                 line += f"  [WARN >= {warn_mb:.0f} MB]"
-                logger.warning("disk_warning show=%s shot=%s mb=%.3f threshold=%.3f", r.show, r.shot, mb, warn_mb)
 
             print(line)
 
-        logger.info("disk_scan_complete shots=%d", len(results))
+        if not counts["shots"]:
+            print("No shots found.")
         return 0
 
+    if args.command == "report":
+        from .monitoring import ACCOUNTING_MODES, bytes_to_mb, format_bytes
+        from .reporting import iter_shot_reports
+        from .tracking.factory import make_tracker
+
+        try:
+            tracker = make_tracker(cfg)
+        except ValueError as e:
+            print(str(e))
+            return 2
+
+        thresholds = cfg.get("thresholds", {}) if isinstance(cfg.get("thresholds", {}), dict) else {}
+        try:
+            warn_mb = float(thresholds.get("disk_warning_mb", 0))
+        except (TypeError, ValueError):
+            warn_mb = 0.0
+        accounting = args.accounting or thresholds.get("disk_accounting", "apparent")
+        if accounting not in ACCOUNTING_MODES:
+            accounting = "apparent"
+
+        counts = {
+            "shots": 0,
+            "shots_with_missing": 0,
+            "shots_with_warning": 0,
+            "shots_unpublished": 0,
+            "total_bytes": 0,
+            "allocated_bytes": 0,
+        }
+
+        # per-show record counts for the metrics, from the report's own tracker read
+        record_counts: Optional[dict[str, int]] = {} if metrics is not None else None
+
+        def report_results():
+            for r in iter_shot_reports(
+                shows_root,
+                tracker=tracker,
+                record_counts=record_counts,
+                frame_prefix=frame_prefix,
+                frame_padding=frame_padding,
+                frame_ext=frame_ext,
+                workers=workers,
+                cache=cache,
+                executor=executor,
+                show=args.show,
+                shot=args.shot,
+            ):
+                mb = bytes_to_mb(r.usage_bytes(accounting))
+                warn = (warn_mb > 0 and mb >= warn_mb)
+                counts["shots"] += 1
+                counts["total_bytes"] += r.total_bytes
+                counts["allocated_bytes"] += r.allocated_bytes
+                if r.missing_frames:
+                    counts["shots_with_missing"] += 1
+                    logger.warning("missing_frames show=%s shot=%s missing=%s", r.show, r.shot, format_frame_ranges(r.missing_frames))
+                if warn:
+                    counts["shots_with_warning"] += 1
+                    logger.warning("disk_warning show=%s shot=%s mb=%.3f threshold=%.3f accounting=%s", r.show, r.shot, mb, warn_mb, accounting)
+                if r.latest_publish is None:
+                    counts["shots_unpublished"] += 1
+                if metrics is not None:
+                    metrics.add_shot(
+                        r.show,
+                        r.shot,
+                        total_bytes=r.total_bytes,
+                        allocated_bytes=r.allocated_bytes,
+                        file_count=r.file_count,
+                        frames=len(r.frames_found),
+                        missing_frames=len(r.missing_frames),
+                    )
+                yield r, warn
+            _save_scan_cache(cache, logger)
+            if metrics is not None:
+                metrics.finish()
+                metrics.tracker_records = record_counts
+                _write_metrics(metrics, metrics_out, logger)
+            logger.info("report_complete shots=%d", counts["shots"])
+
+        def report_out(r, warn: bool) -> dict:
+            latest = r.latest_publish
+            return {
+                "show": r.show,
+                "shot": r.shot,
+                "render_dir": r.render_dir.as_posix(),
+                # frame span + gaps only: the full frame list is what validate --json is for
+                "frame_count": len(r.frames_found),
+                "first_frame": r.frames_found[0] if r.frames_found else None,
+                "last_frame": r.frames_found[-1] if r.frames_found else None,
+                "missing_frames": frames_out(r.missing_frames),
+                "total_bytes": r.total_bytes,
+                "allocated_bytes": r.allocated_bytes,
+                "file_count": r.file_count,
+                "total_mb": round(bytes_to_mb(r.total_bytes), 3),
+                "allocated_mb": round(bytes_to_mb(r.allocated_bytes), 3),
+                "warning": warn,
+                "latest_publish": None if latest is None else {
+                    "version": latest.version,
+                    "status": latest.status,
+                    "note": latest.note,
+                    "timestamp_utc": latest.timestamp_utc,
+                },
+            }
+
+        # the tracker is read while the first render dirs are scanned; take the first
+        # result before printing anything, so a tracker error leaves no partial output
+        results = report_results()
+        try:
+            first = next(results, None)
+        except OSError as e:
+            logger.error("report_failed %s", e)
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+        if first is not None:
+            results = chain((first,), results)
+
+        payload = {
+            "tool": "vfx-ops-toolkit",
+            "command": "report",
+            "timestamp": _utc_now(),
+            "shows_root": shows_root.as_posix(),
+            "frames_format": frames_format,
+            "accounting": accounting,
+        }
+
+        if output_format == "ndjson":
+            for r, warn in results:
+                _print_ndjson({"type": "result", **report_out(r, warn)})
+            _print_ndjson({"type": "summary", **payload, **counts})
+            return 1 if counts["shots_with_missing"] else 0
+
+        if use_json:
+            _print_json_stream(
+                payload,
+                "results",
+                (report_out(r, warn) for r, warn in results),
+                tail=lambda: {"summary": counts},
+            )
+            return 1 if counts["shots_with_missing"] else 0
+
+        print(f"Report for: {shows_root}")
+        current_show = None
+        for r, warn in results:
+            if r.show != current_show:
+                current_show = r.show
+                print(f"\nShow: {r.show}")
+
+            if not r.frames_found:
+                frames_str = "no frames"
+            elif r.missing_frames:
+                frames_str = "missing " + format_frame_ranges(r.missing_frames, padding=frame_padding).replace(",", ", ")
+            else:
+                frames_str = "OK"
+            latest = r.latest_publish
+            publish_str = f"{latest.version} ({latest.status}, {latest.timestamp_utc})" if latest else "never"
+            line = (
+                f"  Shot: {r.shot}  frames={frames_str}  renders={format_bytes(r.total_bytes)}"
+                f" ({r.file_count} files)  latest publish={publish_str}"
+            )
+            if warn:
+                line += f"  [WARN >= {warn_mb:.0f} MB]"
+            print(line)
+
+        if not counts["shots"]:
+            print("No shots found.")
+        else:
+            print(
+                f"\n{counts['shots']} shots: {counts['shots_with_missing']} with missing frames,"
+                f" {counts['shots_with_warning']} over the disk threshold, {counts['shots_unpublished']} never published"
+            )
+        return 1 if counts["shots_with_missing"] else 0
+
     if args.command == "publish":
+        from .monitoring import format_bytes
+        from .publishing import PublishError, frame_checksums, publish_shot, write_publish_manifest
+        from .tracking.factory import make_tracker
+
+        publishing_cfg = cfg.get("publishing", {}) if isinstance(cfg.get("publishing", {}), dict) else {}
         try:
             tracker = make_tracker(cfg)
+            checksum_algorithm, checksum_workers, checksum_cache = _checksum_settings(args, publishing_cfg)
         except ValueError as e:
             print(str(e))
             return 2
@@ -198,24 +871,39 @@ def main() -> int:
                 frame_padding=frame_padding,
                 frame_ext=frame_ext,
             )
-        except PublishError as e:
+        except (PublishError, OSError) as e:
             logger.error("publish_failed %s", e)
             print(f"ERROR: {e}")
             return 2
 
-        publishing_cfg = cfg.get("publishing", {}) if isinstance(cfg.get("publishing", {}), dict) else {}
         publish_root = Path(publishing_cfg.get("publish_root", "published"))
 
         manifest_path = None
         try:
+            checksums = None
+            if checksum_algorithm is not None:
+                checksums = frame_checksums(
+                    shows_root / args.show / "shots" / args.shot / "renders",
+                    result.record.frames_found,
+                    frame_prefix=frame_prefix,
+                    frame_padding=frame_padding,
+                    frame_ext=frame_ext,
+                    algorithm=checksum_algorithm,
+                    workers=checksum_workers,
+                    cache=checksum_cache,
+                )
             manifest_path = write_publish_manifest(
                 publish_root=publish_root,
                 shows_root=shows_root,
                 record=result.record,
+                frames_format=publishing_cfg.get("frames_format", "list"),
+                checksums=checksums,
+                checksum_algorithm=checksum_algorithm or "blake2b",
             )
             logger.info("publish_manifest=%s", manifest_path)
         except OSError as e:
             logger.warning("publish_manifest_write_failed %s", e)
+        _save_checksum_cache(checksum_cache, logger)
 
         logger.info(
             "publish show=%s shot=%s version=%s status=%s",
@@ -229,9 +917,10 @@ def main() -> int:
             payload = {
                 "tool": "vfx-ops-toolkit",
                 "command": "publish",
-                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "timestamp": _utc_now(),
                 "shows_root": shows_root.as_posix(),
                 "manifest_path": manifest_path.as_posix() if manifest_path else None,
+                "frames_format": frames_format,
                 "record": {
                     "show": result.record.show,
                     "shot": result.record.shot,
@@ -239,13 +928,13 @@ def main() -> int:
                     "status": result.record.status,
                     "note": result.record.note,
                     "timestamp_utc": result.record.timestamp_utc,
-                    "frames_found": result.record.frames_found,
-                    "missing_frames": result.record.missing_frames,
+                    "frames_found": frames_out(result.record.frames_found),
+                    "missing_frames": frames_out(result.record.missing_frames),
                     "total_bytes": result.record.total_bytes,
                     "file_count": result.record.file_count,
                 },
             }
-            print(json.dumps(payload, indent=2))
+            _print_json(payload)
             return 0
 
         print("Publish recorded:")
@@ -254,7 +943,7 @@ def main() -> int:
         print(f"  Version: {result.record.version}")
         print(f"  Status: {result.record.status}")
         if result.record.missing_frames:
-            missing_str = ", ".join(f"{f:0{frame_padding}d}" for f in result.record.missing_frames)
+            missing_str = format_frame_ranges(result.record.missing_frames, padding=frame_padding).replace(",", ", ")
             print(f"  Missing frames: {missing_str}")
         print(f"  Renders size: {format_bytes(result.record.total_bytes)} ({result.record.file_count} files)")
         if result.record.note:
@@ -264,23 +953,285 @@ def main() -> int:
 
         return 0
 
+    if args.command == "publish-batch":
+        from .publishing import PublishError, parse_publish_requests, publish_shots
+        from .tracking.factory import make_tracker
+
+        try:
+            if args.input == "-":
+                text = sys.stdin.read()
+                input_format = args.input_format
+            else:
+                input_path = Path(args.input)
+                text = input_path.read_text(encoding="utf-8")
+                suffix_format = {".csv": "csv", ".json": "json"}.get(input_path.suffix.lower())
+                input_format = args.input_format or suffix_format
+            requests = parse_publish_requests(text, input_format)
+        except (OSError, PublishError) as e:
+            logger.error("publish_batch_input_failed %s", e)
+            print(f"ERROR: {e}")
+            return 2
+
+        publishing_cfg = cfg.get("publishing", {}) if isinstance(cfg.get("publishing", {}), dict) else {}
+        try:
+            tracker = make_tracker(cfg)
+            checksum_algorithm, checksum_workers, checksum_cache = _checksum_settings(args, publishing_cfg)
+        except ValueError as e:
+            print(str(e))
+            return 2
+
+        try:
+            results = publish_shots(
+                requests,
+                shows_root=shows_root,
+                tracker=tracker,
+                frame_prefix=frame_prefix,
+                frame_padding=frame_padding,
+                frame_ext=frame_ext,
+                workers=workers,
+                publish_root=Path(publishing_cfg.get("publish_root", "published")),
+                frames_format=publishing_cfg.get("frames_format", "list"),
+                checksum_algorithm=checksum_algorithm,
+                checksum_workers=checksum_workers,
+                checksum_cache=checksum_cache,
+            )
+        except OSError as e:
+            # the tracker write failed (e.g. tracking service unreachable); no manifests were written
+            logger.error("publish_batch_tracker_failed %s", e)
+            print(f"ERROR: {e}")
+            return 2
+        _save_checksum_cache(checksum_cache, logger)
+
+        failed = 0
+        for r in results:
+            req = r.request
+            if r.record is None:
+                failed += 1
+                logger.error("publish_failed show=%s shot=%s version=%s %s", req.show, req.shot, req.version, r.error)
+                continue
+            if r.error:
+                logger.warning("publish_manifest_write_failed show=%s shot=%s %s", req.show, req.shot, r.error)
+            logger.info(
+                "publish show=%s shot=%s version=%s status=%s",
+                r.record.show,
+                r.record.shot,
+                r.record.version,
+                r.record.status,
+            )
+        logger.info("publish_batch rows=%d published=%d failed=%d", len(results), len(results) - failed, failed)
+
+        if use_json:
+            payload = {
+                "tool": "vfx-ops-toolkit",
+                "command": "publish-batch",
+                "timestamp": _utc_now(),
+                "shows_root": shows_root.as_posix(),
+                "frames_format": frames_format,
+                "published": len(results) - failed,
+                "failed": failed,
+                "results": [
+                    {
+                        "show": r.request.show,
+                        "shot": r.request.shot,
+                        "version": r.request.version,
+                        "ok": r.record is not None,
+                        "error": r.error,
+                        "manifest_path": r.manifest_path.as_posix() if r.manifest_path else None,
+                        "record": None if r.record is None else {
+                            "status": r.record.status,
+                            "note": r.record.note,
+                            "timestamp_utc": r.record.timestamp_utc,
+                            "frames_found": frames_out(r.record.frames_found),
+                            "missing_frames": frames_out(r.record.missing_frames),
+                            "total_bytes": r.record.total_bytes,
+                            "file_count": r.record.file_count,
+                        },
+                    }
+                    for r in results
+                ],
+            }
+            _print_json(payload)
+            return 2 if failed else 0
+
+        print(f"Batch publish: {len(results)} rows, {len(results) - failed} published, {failed} failed")
+        for r in results:
+            req = r.request
+            if r.record is None:
+                print(f"  FAIL {req.show}/{req.shot}  {req.version}  {r.error}")
+                continue
+            line = f"  OK   {req.show}/{req.shot}  {req.version}  status={r.record.status}"
+            if r.manifest_path:
+                line += f"  manifest={r.manifest_path}"
+            if r.error:
+                line += f"  ({r.error})"
+            print(line)
+
+        return 2 if failed else 0
+
+    if args.command == "watch":
+        from .monitoring import format_bytes
+        from .validation import _build_frame_regex
+        from .watching import WatchEvent, watch
+
+        thresholds = cfg.get("thresholds", {}) if isinstance(cfg.get("thresholds", {}), dict) else {}
+        try:
+            warn_mb = float(thresholds.get("disk_warning_mb", 0))
+        except (TypeError, ValueError):
+            warn_mb = 0.0
+
+        def on_event(e: WatchEvent) -> None:
+            if e.kind == "missing_frames" and e.missing_frames:
+                logger.warning("missing_frames show=%s shot=%s missing=%s", e.show, e.shot, e.missing_frames)
+            elif e.kind == "disk_warning" and e.warning:
+                logger.warning("disk_warning show=%s shot=%s bytes=%d threshold_mb=%.3f", e.show, e.shot, e.total_bytes, warn_mb)
+
+            if output_format in ("json", "ndjson"):
+                _print_ndjson({
+                    "type": e.kind,
+                    "timestamp": _utc_now(),
+                    "show": e.show,
+                    "shot": e.shot,
+                    "render_dir": e.render_dir.as_posix(),
+                    "missing_frames": e.missing_frames,
+                    "frame_count": e.frame_count,
+                    "total_bytes": e.total_bytes,
+                    "warning": e.warning,
+                })
+                return
+
+            if e.kind == "missing_frames":
+                state = f"missing {e.missing_frames}" if e.missing_frames else "complete"
+                print(f"{e.show}/{e.shot}: {state} ({e.frame_count} frames)", flush=True)
+            else:
+                state = f"WARN >= {warn_mb:g} MB" if e.warning else "below threshold"
+                print(f"{e.show}/{e.shot}: renders={format_bytes(e.total_bytes)} {state}", flush=True)
+
+        try:
+            index = watch(
+                shows_root,
+                frame_re=_build_frame_regex(frame_prefix, frame_padding, frame_ext),
+                on_event=on_event,
+                warn_mb=warn_mb,
+                frame_padding=frame_padding,
+                backend=args.backend,
+                interval=max(0.05, args.interval),
+                duration=args.duration,
+                show=args.show,
+                shot=args.shot,
+            )
+        except KeyboardInterrupt:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.error("watch_failed %s", e)
+            print(f"ERROR: {e}")
+            return 2
+
+        logger.info("watch_stopped shots=%d", len(index.shots))
+        return 0
+
+    if args.command == "serve":
+        from .monitoring import ACCOUNTING_MODES
+        from .serving import DEFAULT_HOST, DEFAULT_PORT, ServeState, serve
+        from .tracking.factory import make_tracker
+
+        try:
+            tracker = make_tracker(cfg)
+        except ValueError as e:
+            print(str(e))
+            return 2
+
+        thresholds = cfg.get("thresholds", {}) if isinstance(cfg.get("thresholds", {}), dict) else {}
+        try:
+            warn_mb = float(thresholds.get("disk_warning_mb", 0))
+        except (TypeError, ValueError):
+            warn_mb = 0.0
+        accounting = args.accounting or thresholds.get("disk_accounting", "apparent")
+        if accounting not in ACCOUNTING_MODES:
+            accounting = "apparent"
+
+        serve_cfg = cfg.get("serve", {}) if isinstance(cfg.get("serve", {}), dict) else {}
+        host = args.host or serve_cfg.get("host", DEFAULT_HOST)
+        try:
+            port = int(args.port if args.port is not None else serve_cfg.get("port", DEFAULT_PORT))
+            interval = float(args.interval if args.interval is not None else serve_cfg.get("interval", 30))
+        except (TypeError, ValueError):
+            print("serve.port must be an integer and serve.interval a number")
+            return 2
+
+        state = ServeState(
+            shows_root,
+            tracker=tracker,
+            frame_prefix=frame_prefix,
+            frame_padding=frame_padding,
+            frame_ext=frame_ext,
+            workers=workers,
+            cache=cache,
+            executor=executor,
+            show=args.show,
+            shot=args.shot,
+            frames_format=frames_format,
+            accounting=accounting,
+            warn_mb=warn_mb,
+        )
+
+        def on_ready(bound_host: str, bound_port: int) -> None:
+            logger.info("serve_listening host=%s port=%d interval=%.1f", bound_host, bound_port, interval)
+            print(f"Serving {shows_root} on http://{bound_host}:{bound_port} (/validate, /disk, /publishes, /status)", flush=True)
+
+        def on_refresh() -> None:
+            _save_scan_cache(cache, logger)
+            _write_metrics(state.metrics, metrics_out, logger)
+            logger.info("serve_refreshed refreshes=%d seconds=%.3f", state.refreshes, state.last_refresh_seconds)
+
+        def on_error(e: Exception) -> None:
+            # called from the refresher's except block: unexpected errors get their traceback
+            logger.error("serve_refresh_failed %s", e, exc_info=not isinstance(e, (OSError, ValueError)))
+
+        try:
+            serve(
+                state,
+                host=host,
+                port=port,
+                interval=max(0.05, interval),
+                duration=args.duration,
+                on_ready=on_ready,
+                on_refresh=on_refresh,
+                on_error=on_error,
+            )
+        except KeyboardInterrupt:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.error("serve_failed %s", e)
+            print(f"ERROR: {e}")
+            return 2
+
+        logger.info("serve_stopped refreshes=%d", state.refreshes)
+        return 0
+
     if args.command == "list-publishes":
+        from .tracking.factory import make_tracker
+
         try:
             tracker = make_tracker(cfg)
         except ValueError as e:
             print(str(e))
             return 2
 
-        records = tracker.list_publishes(show=args.show, shot=args.shot)
-        records = records[: max(0, args.limit)]
+        try:
+            records = tracker.list_publishes(show=args.show, shot=args.shot, limit=max(0, args.limit))
+        except OSError as e:
+            logger.error("list_publishes_failed %s", e)
+            print(f"ERROR: {e}")
+            return 2
 
         if use_json:
             payload = {
                 "tool": "vfx-ops-toolkit",
                 "command": "list-publishes",
-                "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "timestamp": _utc_now(),
                 "shows_root": shows_root.as_posix(),
                 "filters": {"show": args.show, "shot": args.shot, "limit": args.limit},
+                "frames_format": frames_format,
                 "count": len(records),
                 "records": [
                     {
@@ -290,15 +1241,15 @@ def main() -> int:
                         "status": r.status,
                         "note": r.note,
                         "timestamp_utc": r.timestamp_utc,
-                        "frames_found": r.frames_found,
-                        "missing_frames": r.missing_frames,
+                        "frames_found": frames_out(r.frames_found),
+                        "missing_frames": frames_out(r.missing_frames),
                         "total_bytes": r.total_bytes,
                         "file_count": r.file_count,
                     }
                     for r in records
                 ],
             }
-            print(json.dumps(payload, indent=2))
+            _print_json(payload)
             return 0
 
         if not records:
@@ -314,6 +1265,45 @@ def main() -> int:
 
         return 0
 
+    if args.command == "tracker" and args.tracker_command == "compact":
+        from .tracking.factory import make_tracker
+
+        try:
+            tracker = make_tracker(cfg)
+        except ValueError as e:
+            print(str(e))
+            return 2
+
+        if not hasattr(tracker, "compact"):
+            print(f"Tracking backend does not support compaction: {type(tracker).__name__}")
+            return 2
+
+        try:
+            before, after = tracker.compact()
+        except OSError as e:
+            logger.error("tracker_compact_failed %s", e)
+            print(f"ERROR: {e}")
+            return 2
+
+        logger.info("tracker_compact path=%s before=%d after=%d", tracker.path, before, after)
+
+        if use_json:
+            payload = {
+                "tool": "vfx-ops-toolkit",
+                "command": "tracker compact",
+                "timestamp": _utc_now(),
+                "path": tracker.path.as_posix(),
+                "format": tracker.fmt,
+                "records_before": before,
+                "records_after": after,
+            }
+            _print_json(payload)
+            return 0
+
+        print(f"Compacted tracker: {tracker.path} ({tracker.fmt})")
+        print(f"  Records: {before} -> {after}")
+        return 0
+
     return 0
 
 
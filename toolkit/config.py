@@ -1,9 +1,19 @@
+from __future__ import annotations
+import json
+import os
 from pathlib import Path
-import yaml
+import time
+import zlib
 
-def load_config(path=None) -> dict:
+CACHE_DIR_ENV = "TOOLKIT_CACHE_DIR"
+# A config saved this recently is not cached: an edit within the same mtime tick
+# that keeps the size would otherwise be missed (same rule as the scan cache).
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _config_path(path=None):
     """
-    Load YAML config (deafaults to ./toolkit.yaml). Returns {} if missing.
+    Resolve the config path (argparse lists normalized); None if the default is missing
     """
     # If argparse gives 1-item list (nargs=1) or append list -> normalize it
     if isinstance(path, list):
@@ -12,10 +22,13 @@ def load_config(path=None) -> dict:
     if path is None:
         candidate = Path.cwd() / "toolkit.yaml"
         if not candidate.exists():
-            return {}
-        p = candidate
-    else:
-        p = Path(path)
+            return None
+        return candidate
+    return Path(path)
+
+
+def _parse_yaml(p: Path) -> dict:
+    import yaml
 
     with p.open("r", encoding="utf-8") as f:
         data = yaml.safe_load(f) or {}
@@ -24,3 +37,64 @@ def load_config(path=None) -> dict:
         raise ValueError(f"Config must be a mapping (dict). Got: {type(data).__name__}")
 
     return data
+
+
+def load_config(path=None) -> dict:
+    """
+    Load YAML config (deafaults to ./toolkit.yaml). Returns {} if missing.
+    """
+    p = _config_path(path)
+    if p is None:
+        return {}
+    return _parse_yaml(p)
+
+
+def config_cache_dir() -> Path:
+    """
+    Directory for the parsed-config cache: $TOOLKIT_CACHE_DIR, else
+    $XDG_CACHE_HOME/vfx-ops-toolkit (default ~/.cache/vfx-ops-toolkit)
+    """
+    env = os.environ.get(CACHE_DIR_ENV)
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "vfx-ops-toolkit"
+
+
+def load_config_cached(path=None) -> dict:
+    """
+    load_config, reusing a JSON copy of the parsed config while the YAML file's
+    (mtime_ns, size) is unchanged, so a cache hit does not import yaml.
+    Cache problems are ignored (the YAML is parsed as usual).
+    """
+    p = _config_path(path)
+    if p is None:
+        return {}
+
+    st = p.stat()
+    resolved = str(p.resolve())
+    stamp = [st.st_mtime_ns, st.st_size]
+    # crc32 keeps hashlib out of startup; the full path is checked on read anyway
+    cache_path = config_cache_dir() / f"config-{zlib.crc32(resolved.encode('utf-8')):08x}.json"
+
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached.get("path") == resolved and cached.get("stamp") == stamp and isinstance(cached.get("config"), dict):
+            return cached["config"]
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    data = _parse_yaml(p)
+    if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+        return data
+    try:
+        text = json.dumps({"path": resolved, "stamp": stamp, "config": data})
+        # only cache configs that survive a JSON round trip (no dates, non-string keys, ...)
+        if json.loads(text)["config"] == data:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
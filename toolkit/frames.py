@@ -0,0 +1,115 @@
+from __future__ import annotations
+import json
+from itertools import compress
+from typing import Iterable, Union
+
+FRAME_FORMATS = ("list", "ranges")
+
+
+def frame_ranges(frames: Iterable[int]) -> list[tuple[int, int]]:
+    """
+    Collapse sorted frame numbers into inclusive (start, end) runs,
+    e.g. [1, 2, 3, 5] -> [(1, 3), (5, 5)]. Duplicates are ignored.
+    """
+    runs: list[tuple[int, int]] = []
+    start = end = None
+    for f in frames:
+        if start is None:
+            start = end = f
+        elif f <= end + 1:
+            end = max(end, f)
+        else:
+            runs.append((start, end))
+            start = end = f
+    if start is not None:
+        runs.append((start, end))
+    return runs
+
+
+def missing_ranges(frames: list[int]) -> list[tuple[int, int]]:
+    """
+    Return the inclusive (start, end) gaps between min(frames) and max(frames).
+
+    frames must be sorted; duplicates (e.g. frame_1 and frame_0001 under a permissive
+    regex) are allowed. One pass over adjacent pairs: only steps larger than 1 are gaps.
+    """
+    return [(a + 1, b - 1) for a, b in zip(frames, frames[1:]) if b - a > 1]
+
+
+def missing_frame_numbers(frames: list[int]) -> list[int]:
+    """
+    Return every missing frame number between min(frames) and max(frames)
+    (frames sorted, duplicates allowed).
+
+    Sparse gaps are filled in from one pass over adjacent pairs, so a stray
+    frame_9999 costs one range(). When at least a tenth of a span no wider than
+    4x the frame count is missing (partial renders, every other frame), expanding
+    that many small gaps one by one is slower than the old set walk; a bytearray
+    over the span is marked instead and the missing numbers are picked out with
+    itertools.compress.
+    """
+    if not frames:
+        return []
+    lo, hi = frames[0], frames[-1]
+    span = hi - lo + 1
+    n = len(frames)
+    if span <= 4 * n and (span - n) * 10 >= span:
+        absent = bytearray(b"\x01") * span
+        for f in frames:
+            absent[f - lo] = 0
+        return list(compress(range(lo, hi + 1), absent))
+    missing: list[int] = []
+    for a, b in zip(frames, frames[1:]):
+        if b - a > 1:
+            missing.extend(range(a + 1, b))
+    return missing
+
+
+def format_ranges(runs: Iterable[tuple[int, int]], padding: int = 0) -> str:
+    """
+    Format inclusive (start, end) runs as a range-set string, e.g. "1001-1240,1242"
+    padding zero-pads each number (e.g. padding=4 -> "0003-0005").
+    """
+    parts = []
+    for start, end in runs:
+        if start == end:
+            parts.append(f"{start:0{padding}d}")
+        else:
+            parts.append(f"{start:0{padding}d}-{end:0{padding}d}")
+    return ",".join(parts)
+
+
+def format_frame_ranges(frames: Iterable[int], padding: int = 0) -> str:
+    """
+    Compact range-set string for sorted frames, e.g. "1001-1240,1242-2000" ("" if none).
+    padding zero-pads each number (e.g. padding=4 -> "0003-0005").
+    """
+    return format_ranges(frame_ranges(frames), padding)
+
+
+def parse_frame_ranges(value: Union[str, Iterable[int], None]) -> list[int]:
+    """
+    Expand a range-set string ("1-3,5") into frame numbers.
+    Plain lists (and JSON list text) are accepted too, so records written before
+    range encoding still read back. Raises ValueError on malformed input.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            return parse_frame_ranges(json.loads(text))
+        frames: list[int] = []
+        for part in text.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            start, sep, end = part.partition("-")
+            if sep:
+                frames.extend(range(int(start), int(end) + 1))
+            else:
+                frames.append(int(start))
+        return frames
+    if isinstance(value, (list, tuple)):
+        return [int(f) for f in value]
+    raise ValueError(f"Unsupported frame list value: {type(value).__name__}")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+# (name, help) per family, in output order; per-shot families are labelled {command, show, shot}
+_SHOT_FAMILIES = (
+    ("toolkit_shot_bytes", "Apparent size (st_size) of the shot's render files in bytes."),
+    ("toolkit_shot_allocated_bytes", "Allocated size of the shot's render files in bytes, hardlinks counted once."),
+    ("toolkit_shot_files", "Number of files under the shot's render directory."),
+    ("toolkit_shot_frames", "Number of frames found in the shot's render sequence."),
+    ("toolkit_shot_missing_frames", "Number of frames missing between the shot's first and last frame."),
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text exposition format"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class ScanMetrics:
+    """
+    Gauges for one scan: per-shot sizes/files/frames/missing counts, scan duration,
+    files per second and (optionally) tracker record counts per show.
+
+    Per-shot values that a command does not measure are left as None and their
+    family is omitted (validate has no sizes, disk has no frames). Every series
+    carries a command label, so files written by several commands can share one
+    node_exporter textfile directory without duplicate series.
+    """
+
+    def __init__(self, command: str):
+        self.command = command
+        self.files = 0
+        self.duration_seconds: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.tracker_records: Optional[dict[str, int]] = None
+        # (show, shot, total_bytes, allocated_bytes, file_count, frames, missing)
+        self._shots: list[tuple] = []
+        self._t0 = perf_counter()
+
+    def add_shot(
+            self,
+            show: str,
+            shot: str,
+            *,
+            total_bytes: Optional[int] = None,
+            allocated_bytes: Optional[int] = None,
+            file_count: Optional[int] = None,
+            frames: Optional[int] = None,
+            missing_frames: Optional[int] = None,
+    ) -> None:
+        self._shots.append((show, shot, total_bytes, allocated_bytes, file_count, frames, missing_frames))
+        self.files += file_count if file_count is not None else (frames or 0)
+
+    def finish(self) -> None:
+        """Stop the scan clock (call once the scan is exhausted, before any tracker read)"""
+        self.duration_seconds = perf_counter() - self._t0
+        self.finished_at = time.time()
+
+    def render(self) -> str:
+        """The metrics in Prometheus text exposition format (version 0.0.4)"""
+        lines: list[str] = []
+        command = _escape(self.command)
+        for i, (name, help_text) in enumerate(_SHOT_FAMILIES, start=2):
+            rows = [row for row in self._shots if row[i] is not None]
+            if not rows:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for row in rows:
+                lines.append(f'{name}{{command="{command}",show="{_escape(row[0])}",shot="{_escape(row[1])}"}} {row[i]}')
+
+        duration = self.duration_seconds if self.duration_seconds is not None else perf_counter() - self._t0
+        scan = [
+            ("toolkit_scan_shots", "Shots covered by the last scan.", len(self._shots)),
+            ("toolkit_scan_files", "Files counted by the last scan (matched frame files for validate).", self.files),
+            ("toolkit_scan_duration_seconds", "Wall time of the last scan in seconds.", round(duration, 6)),
+            (
+                "toolkit_scan_files_per_second",
+                "Files counted per second of scan wall time.",
+                round(self.files / duration, 3) if duration > 0 else 0,
+            ),
+        ]
+        if self.finished_at is not None:
+            scan.append(("toolkit_scan_timestamp_seconds", "Unix time the last scan finished.", round(self.finished_at, 3)))
+        for name, help_text, value in scan:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f'{name}{{command="{command}"}} {value}')
+
+        if self.tracker_records is not None:
+            lines.append("# HELP toolkit_tracker_records Publish records in the tracking backend per show.")
+            lines.append("# TYPE toolkit_tracker_records gauge")
+            for show in sorted(self.tracker_records):
+                lines.append(f'toolkit_tracker_records{{command="{command}",show="{_escape(show)}"}} {self.tracker_records[show]}')
+        return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path, text: str) -> None:
+    """
+    Write a node_exporter textfile atomically: a temp file in the same directory
+    (not ending in .prom, so the collector never reads it half-written), then os.replace
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -1,53 +1,96 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from .validation import iter_shot_render_dirs
+from typing import Iterator, Optional
+from . import profiling
+from .scan_cache import ScanCache
+from .scanning import iter_shot_render_dirs, scan_render_dir, scan_render_dirs
+
+ACCOUNTING_MODES = ("apparent", "allocated")
 
 @dataclass(frozen=True)
 class ShotDiskUsage:
-    """Disk usage summary for one shot render directory"""
+    """
+    Disk usage summary for one shot render directory.
+    total_bytes is apparent size (st_size, once per link); allocated_bytes is the
+    space actually allocated (st_blocks), counting each hardlinked inode only in the
+    first shot (in show/shot order) that contains it.
+    """
     show: str
     shot: str
     render_dir: Path
     total_bytes: int
     file_count: int
+    allocated_bytes: int = 0
 
+    def usage_bytes(self, accounting: str = "apparent") -> int:
+        """
+        Bytes for the given accounting mode ("apparent" or "allocated")
+        """
+        return self.allocated_bytes if accounting == "allocated" else self.total_bytes
 
+
+@profiling.timed("disk.dir_size")
 def _dir_size_bytes(root: Path) -> tuple[int, int]:
     """
     Returns (total_bytes, file_count) for all files under root (recursive)
     """
-    total = 0
-    count = 0
-    if not root.exists():
+    try:
+        scan = scan_render_dir(root)
+    except (FileNotFoundError, NotADirectoryError):
         return 0, 0
-    
-    for p in root.rglob("*"):
-        if p.is_file():
-            count += 1
-            try:
-                total += p.stat().st_size
-            except OSError:
-                continue
-    return total, count
+    return scan.total_bytes, scan.file_count
 
-def disk_usage_by_shot(shows_root: Path) -> list[ShotDiskUsage]:
+def iter_disk_usage(
+        shows_root: Path,
+        *,
+        workers: int = 1,
+        cache: Optional[ScanCache] = None,
+        executor: str = "thread",
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> Iterator[ShotDiskUsage]:
     """
-    Compute disk usage for each shot's renders directory under show_root
+    Yield disk usage per shot renders directory in (show, shot) order as each shot
+    finishes scanning. workers > 1 scans shots concurrently (executor "thread", or
+    "process" sharded by show); with a cache, render dirs whose directory mtimes are
+    unchanged are not listed again. show/shot (names or globs) limit the scan to matching shots.
+    Hardlinked inodes are de-duplicated here, in yield order, so allocated_bytes does
+    not depend on workers or on which shots came from the cache.
     """
-    results: list[ShotDiskUsage] = []
-    for show, shot, render_dir in iter_shot_render_dirs(shows_root):
-        total, count = _dir_size_bytes(render_dir)
-        results.append(
-            ShotDiskUsage(
-                show=show,
-                shot=shot,
-                render_dir=render_dir,
-                total_bytes=total,
-                file_count=count
-            )
+    scans = scan_render_dirs(iter_shot_render_dirs(shows_root, show, shot), workers=workers, cache=cache, executor=executor)
+    seen_links: set[tuple[int, int]] = set()
+    for show, shot, render_dir, scan in scans:
+        allocated = scan.allocated_bytes
+        for dev, ino, alloc in scan.linked:
+            if (dev, ino) in seen_links:
+                allocated -= alloc
+            else:
+                seen_links.add((dev, ino))
+        yield ShotDiskUsage(
+            show=show,
+            shot=shot,
+            render_dir=render_dir,
+            total_bytes=scan.total_bytes,
+            file_count=scan.file_count,
+            allocated_bytes=allocated,
         )
-    return results
+
+def disk_usage_by_shot(
+        shows_root: Path,
+        *,
+        workers: int = 1,
+        cache: Optional[ScanCache] = None,
+        executor: str = "thread",
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> list[ShotDiskUsage]:
+    """
+    Compute disk usage for each shot's renders directory under show_root
+    (list form of iter_disk_usage; holds every result, so prefer the generator on
+    large roots)
+    """
+    return list(iter_disk_usage(shows_root, workers=workers, cache=cache, executor=executor, show=show, shot=shot))
 
 def bytes_to_mb(num_bytes: int) -> float:
     return num_bytes / (1024 * 1024)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+import functools
+import threading
+from time import perf_counter
+from typing import Callable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# Shared no-op context returned by phase() while profiling is off, so a disabled
+# phase costs one global lookup and an empty with-block.
+_NULL = nullcontext()
+_active: Optional[Profiler] = None
+
+
+class _Phase:
+    __slots__ = ("_profiler", "_name", "_t0")
+
+    def __init__(self, profiler: Profiler, name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._t0 = perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self._profiler.add(self._name, perf_counter() - self._t0)
+
+
+class Profiler:
+    """
+    Collects per-phase wall time and call counts, plus per-shot latency.
+    Phases are flat names such as "scan.stat" or "tracker.save"; nested phases
+    overlap (a "command" phase includes everything run inside it). Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases: dict[str, list] = {}  # name -> [calls, seconds]
+        self._shots: dict[tuple[str, str], float] = {}
+        self._t0 = perf_counter()
+
+    def add(self, name: str, seconds: float, calls: int = 1) -> None:
+        with self._lock:
+            stat = self._phases.get(name)
+            if stat is None:
+                self._phases[name] = [calls, seconds]
+            else:
+                stat[0] += calls
+                stat[1] += seconds
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def shot(self, show: str, shot: str, seconds: float) -> None:
+        """
+        Add seconds spent on one shot (accumulates across phases)
+        """
+        with self._lock:
+            key = (show, shot)
+            self._shots[key] = self._shots.get(key, 0.0) + seconds
+
+    def summary(self, top_shots: int = 10) -> dict:
+        """
+        Return a JSON-ready summary: phases sorted by time, and the slowest shots
+        """
+        with self._lock:
+            phases = sorted(self._phases.items(), key=lambda kv: kv[1][1], reverse=True)
+            shots = sorted(self._shots.items(), key=lambda kv: kv[1], reverse=True)
+        return {
+            "wall_seconds": round(perf_counter() - self._t0, 6),
+            "phases": {
+                name: {"calls": calls, "seconds": round(seconds, 6)} for name, (calls, seconds) in phases
+            },
+            "shots_timed": len(shots),
+            "slowest_shots": [
+                {"show": show, "shot": shot, "seconds": round(seconds, 6)}
+                for (show, shot), seconds in shots[:top_shots]
+            ],
+        }
+
+
+def enable() -> Profiler:
+    """
+    Start collecting into a new process-wide profiler and return it
+    """
+    global _active
+    _active = Profiler()
+    return _active
+
+
+def disable() -> Optional[Profiler]:
+    """
+    Stop collecting; returns the profiler that was active (if any)
+    """
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+def active() -> Optional[Profiler]:
+    return _active
+
+
+def phase(name: str):
+    """
+    Context manager timing a phase; a shared no-op when profiling is disabled
+    """
+    profiler = _active
+    if profiler is None:
+        return _NULL
+    return _Phase(profiler, name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator form of phase() for whole functions
+    """
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return fn(*args, **kwargs)
+            t0 = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.add(name, perf_counter() - t0)
+        return wrapper
+    return decorator
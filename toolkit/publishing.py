@@ -1,14 +1,24 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import csv
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+import io
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
 
-from .monitoring import _dir_size_bytes
-from .validation import validate_renders
+from . import profiling
+from .frames import format_frame_ranges
+from .scanning import scan_render_dir
+from .validation import _build_frame_regex, _compute_missing
 from .tracking.base import PublishRecord, Tracker
 
 import json
 
+if TYPE_CHECKING:
+    from .checksums import ChecksumCache
+
 class PublishError(RuntimeError):
     pass
 
@@ -16,25 +26,40 @@ class PublishError(RuntimeError):
 class PublishResult:
     record: PublishRecord
 
-def publish_shot(
+@dataclass(frozen=True)
+class PublishRequest:
+    """One row of a batch publish input"""
+    show: str
+    shot: str
+    version: str = "v001"
+    note: str = ""
+
+@dataclass(frozen=True)
+class BatchPublishResult:
+    """Outcome of one batch row; record is None when the shot could not be published"""
+    request: PublishRequest
+    record: Optional[PublishRecord] = None
+    manifest_path: Optional[Path] = None
+    error: Optional[str] = None
+
+def build_publish_record(
     *,
     shows_root: Path,
     show: str,
     shot: str,
     version: str,
     note: str,
-    tracker: Tracker,
     frame_prefix: str,
     frame_padding: int,
     frame_ext: str,
-) -> PublishResult:
+) -> PublishRecord:
     """
-    Simulate publishing a shot:
-    - validate frames for that shot
-    - compute disk usage for that shot's renders folder
-    - write a publish record via tracker
-    No file moves/deletes.
+    Validate frames and measure the renders folder of one shot and return the
+    publish record, without writing it anywhere. Raises PublishError.
     """
+    profiler = profiling.active()
+    t0 = perf_counter() if profiler is not None else 0.0
+
     shot_root = shows_root / show / "shots" / shot
     render_dir = shot_root / "renders"
 
@@ -44,25 +69,12 @@ def publish_shot(
     if not render_dir.exists() or not render_dir.is_dir():
         raise PublishError(f"Renders directory not found: {render_dir}")
 
-    frames_found: list[int] = []
-    missing_frames: list[int] = []
-    total_bytes = 0
-    file_count = 0
-
-    all_results = validate_renders(
-        shows_root,
-        frame_prefix=frame_prefix,
-        frame_padding=frame_padding,
-        frame_ext=frame_ext,
-    )
-    for r in all_results:
-        if r.show == show and r.shot == shot:
-            frames_found = r.frames_found
-            missing_frames = r.missing_frames
-            break
-
-    # Disk usage for renders
-    total_bytes, file_count = _dir_size_bytes(render_dir)
+    # Only this shot's render dir is scanned, never the rest of shows_root; frames
+    # and disk usage come from the same single pass
+    scan = scan_render_dir(render_dir, _build_frame_regex(frame_prefix, frame_padding, frame_ext), sizes=True)
+    frames_found = scan.frames
+    missing_frames = _compute_missing(frames_found)
+    total_bytes, file_count = scan.total_bytes, scan.file_count
 
     status = "ok"
     if not frames_found or missing_frames:
@@ -82,25 +94,224 @@ def publish_shot(
         total_bytes=total_bytes,
         file_count=file_count,
     )
-    tracker.record_publish(record)
+    if profiler is not None:
+        seconds = perf_counter() - t0
+        profiler.add("publish.build", seconds)
+        profiler.shot(show, shot, seconds)
+    return record
+
+def publish_shot(
+    *,
+    shows_root: Path,
+    show: str,
+    shot: str,
+    version: str,
+    note: str,
+    tracker: Tracker,
+    frame_prefix: str,
+    frame_padding: int,
+    frame_ext: str,
+) -> PublishResult:
+    """
+    Simulate publishing a shot:
+    - validate frames for that shot
+    - compute disk usage for that shot's renders folder
+    - write a publish record via tracker
+    No file moves/deletes.
+    """
+    record = build_publish_record(
+        shows_root=shows_root,
+        show=show,
+        shot=shot,
+        version=version,
+        note=note,
+        frame_prefix=frame_prefix,
+        frame_padding=frame_padding,
+        frame_ext=frame_ext,
+    )
+    with profiling.phase("publish.tracker_write"):
+        tracker.record_publish(record)
     return PublishResult(record=record)
 
-def write_publish_manifest(*, publish_root: Path, shows_root: Path, record: PublishRecord) -> Path:
+def frame_checksums(
+    render_dir: Path,
+    frames: list[int],
+    *,
+    frame_prefix: str,
+    frame_padding: int,
+    frame_ext: str,
+    algorithm: str = "blake2b",
+    workers: int = 4,
+    cache: Optional[ChecksumCache] = None,
+) -> dict[str, str]:
+    """
+    Return {frame file name: hex digest} for the given frames of render_dir, hashed
+    in parallel (see toolkit.checksums.checksum_files). Raises ValueError/OSError.
+    """
+    from .checksums import checksum_files
+
+    names = [f"{frame_prefix}{f:0{frame_padding}d}{frame_ext}" for f in frames]
+    digests = checksum_files([render_dir / n for n in names], algorithm=algorithm, workers=workers, cache=cache)
+    return dict(zip(names, digests))
+
+@profiling.timed("publish.manifest")
+def write_publish_manifest(
+    *,
+    publish_root: Path,
+    shows_root: Path,
+    record: PublishRecord,
+    frames_format: str = "list",
+    checksums: Optional[dict[str, str]] = None,
+    checksum_algorithm: str = "blake2b",
+) -> Path:
     """
     Write a publish manifest JSON file to:
       <publish_root>/<show>/<shot>/<version>/publish.json
 
     This simulates the kind of metadata artifact a pipeline might generate.
+    frames_format="ranges" writes frame lists as range strings ("1001-1240,1242-2000").
+    checksums (from frame_checksums) adds a per-frame "checksums" block so a
+    downstream site can verify the delivery.
     """
     render_dir = shows_root / record.show / "shots" / record.shot / "renders"
     out_dir = publish_root / record.show / record.shot / record.version
     out_dir.mkdir(parents=True, exist_ok=True)
 
     manifest_path = out_dir / "publish.json"
+    record_data = asdict(record)
+    if frames_format == "ranges":
+        record_data["frames_found"] = format_frame_ranges(record.frames_found)
+        record_data["missing_frames"] = format_frame_ranges(record.missing_frames)
+
     payload = {
         "schema": "vfx-ops-toolkit.publish_manifest",
-        "record": asdict(record),
+        "frames_format": frames_format,
+        "record": record_data,
         "source_render_dir": str(render_dir),
     }
+    if checksums is not None:
+        payload["checksums"] = {"algorithm": checksum_algorithm, "files": checksums}
     manifest_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     return manifest_path
+
+
+def parse_publish_requests(text: str, fmt: Optional[str] = None) -> list[PublishRequest]:
+    """
+    Parse batch publish rows from CSV (header: show,shot[,version][,note]) or JSON
+    (a list of objects, or {"publishes": [...]}). fmt is "csv", "json" or None to
+    detect from the content. Raises PublishError on malformed input.
+    """
+    if fmt is None:
+        fmt = "json" if text.lstrip()[:1] in ("[", "{") else "csv"
+
+    if fmt == "json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise PublishError(f"Invalid JSON batch input: {e}") from e
+        if isinstance(data, dict):
+            data = data.get("publishes")
+        if not isinstance(data, list):
+            raise PublishError("JSON batch input must be a list of publish rows")
+        rows = data
+    elif fmt == "csv":
+        rows = list(csv.DictReader(io.StringIO(text)))
+    else:
+        raise PublishError(f"Unsupported batch input format: {fmt}")
+
+    requests: list[PublishRequest] = []
+    for i, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            raise PublishError(f"Batch row {i}: expected an object")
+        show = str(row.get("show") or "").strip()
+        shot = str(row.get("shot") or "").strip()
+        if not show or not shot:
+            raise PublishError(f"Batch row {i}: 'show' and 'shot' are required")
+        requests.append(
+            PublishRequest(
+                show=show,
+                shot=shot,
+                version=str(row.get("version") or "v001").strip(),
+                note=str(row.get("note") or ""),
+            )
+        )
+    return requests
+
+def publish_shots(
+    requests: list[PublishRequest],
+    *,
+    shows_root: Path,
+    tracker: Tracker,
+    frame_prefix: str,
+    frame_padding: int,
+    frame_ext: str,
+    workers: int = 4,
+    publish_root: Optional[Path] = None,
+    frames_format: str = "list",
+    checksum_algorithm: Optional[str] = None,
+    checksum_workers: int = 4,
+    checksum_cache: Optional[ChecksumCache] = None,
+) -> list[BatchPublishResult]:
+    """
+    Publish many shots in one go:
+    - validate/measure shots in parallel (one thread per shot, up to workers)
+    - write every successful record to the tracker in a single record_publishes call
+    - write manifests concurrently when publish_root is given, with per-frame
+      checksums when checksum_algorithm is set
+    A failing shot is reported in its result and does not abort the batch.
+    Results are returned in input order.
+    """
+    def _build(req: PublishRequest) -> BatchPublishResult:
+        try:
+            record = build_publish_record(
+                shows_root=shows_root,
+                show=req.show,
+                shot=req.shot,
+                version=req.version,
+                note=req.note,
+                frame_prefix=frame_prefix,
+                frame_padding=frame_padding,
+                frame_ext=frame_ext,
+            )
+        except (PublishError, OSError) as e:
+            return BatchPublishResult(request=req, error=str(e))
+        return BatchPublishResult(request=req, record=record)
+
+    def _manifest(result: BatchPublishResult) -> BatchPublishResult:
+        if result.record is None or publish_root is None:
+            return result
+        record = result.record
+        try:
+            checksums = None
+            if checksum_algorithm is not None:
+                checksums = frame_checksums(
+                    shows_root / record.show / "shots" / record.shot / "renders",
+                    record.frames_found,
+                    frame_prefix=frame_prefix,
+                    frame_padding=frame_padding,
+                    frame_ext=frame_ext,
+                    algorithm=checksum_algorithm,
+                    workers=checksum_workers,
+                    cache=checksum_cache,
+                )
+            path = write_publish_manifest(
+                publish_root=publish_root,
+                shows_root=shows_root,
+                record=record,
+                frames_format=frames_format,
+                checksums=checksums,
+                checksum_algorithm=checksum_algorithm or "blake2b",
+            )
+        except (OSError, ValueError) as e:
+            return BatchPublishResult(request=result.request, record=result.record, error=f"manifest: {e}")
+        return BatchPublishResult(request=result.request, record=result.record, manifest_path=path)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="toolkit-publish") as pool:
+        results = list(pool.map(_build, requests))
+
+        records = [r.record for r in results if r.record is not None]
+        if records:
+            with profiling.phase("publish.tracker_write"):
+                tracker.record_publishes(records)
+
+        return list(pool.map(_manifest, results))
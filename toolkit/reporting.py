@@ -0,0 +1,122 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Iterator, Optional
+
+from . import profiling
+from .frames import frame_ranges
+from .scan_cache import ScanCache
+from .scanning import _is_glob, iter_shot_render_dirs, scan_render_dirs
+from .tracking.base import PublishRecord, Tracker
+from .validation import _build_frame_regex, _compute_missing
+
+
+@dataclass(frozen=True)
+class ShotReport:
+    """
+    Missing frames, disk usage and latest publish of one shot, from a single scan.
+    allocated_bytes counts a hardlinked inode only in the first shot that contains it.
+    """
+    show: str
+    shot: str
+    render_dir: Path
+    frames_found: list[int]
+    missing_frames: list[int]
+    total_bytes: int
+    file_count: int
+    allocated_bytes: int
+    latest_publish: Optional[PublishRecord]
+
+    @cached_property
+    def missing_ranges(self) -> list[tuple[int, int]]:
+        """missing_frames as inclusive (start, end) runs, computed on first use"""
+        return frame_ranges(self.missing_frames)
+
+    def usage_bytes(self, accounting: str = "apparent") -> int:
+        return self.allocated_bytes if accounting == "allocated" else self.total_bytes
+
+
+@profiling.timed("report.tracker")
+def latest_publishes(
+        tracker: Tracker,
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+        record_counts: Optional[dict[str, int]] = None,
+) -> dict[tuple[str, str], PublishRecord]:
+    """
+    {(show, shot): newest publish} from one list_publishes call. Literal show/shot
+    names are passed to the tracker as filters; globs are ignored here.
+    If record_counts is given it is filled with {show: records read} from the same call.
+    """
+    records = tracker.list_publishes(
+        show=show if show and not _is_glob(show) else None,
+        shot=shot if shot and not _is_glob(shot) else None,
+    )
+    latest: dict[tuple[str, str], PublishRecord] = {}
+    for rec in records:  # newest first
+        latest.setdefault((rec.show, rec.shot), rec)
+        if record_counts is not None:
+            record_counts[rec.show] = record_counts.get(rec.show, 0) + 1
+    return latest
+
+
+def iter_shot_reports(
+        shows_root: Path,
+        *,
+        tracker: Optional[Tracker] = None,
+        frame_prefix: str = "frame_",
+        frame_padding: int = 4,
+        frame_ext: str = ".exr",
+        workers: int = 1,
+        cache: Optional[ScanCache] = None,
+        executor: str = "thread",
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+        record_counts: Optional[dict[str, int]] = None,
+) -> Iterator[ShotReport]:
+    """
+    Yield a ShotReport per shot in (show, shot) order.
+
+    Frames and sizes come from one scan_render_dir pass per render dir (the same
+    walk disk does, with the frame regex applied to top-level names), so a report
+    costs about as much as `toolkit disk`. The tracker is read once, on a background
+    thread that overlaps the first scans; its errors (OSError) are raised from the
+    first next() call. record_counts is filled as in latest_publishes.
+    """
+    frame_re = _build_frame_regex(frame_prefix, frame_padding, frame_ext)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="toolkit-report") as pool:
+        publishes_future = pool.submit(latest_publishes, tracker, show, shot, record_counts) if tracker is not None else None
+        scans = scan_render_dirs(
+            iter_shot_render_dirs(shows_root, show, shot),
+            frame_re,
+            sizes=True,
+            workers=workers,
+            cache=cache,
+            executor=executor,
+        )
+        publishes: Optional[dict[tuple[str, str], PublishRecord]] = None
+        seen_links: set[tuple[int, int]] = set()
+        for show_name, shot_name, render_dir, scan in scans:
+            if publishes is None:
+                publishes = publishes_future.result() if publishes_future is not None else {}
+            allocated = scan.allocated_bytes
+            for dev, ino, alloc in scan.linked:
+                if (dev, ino) in seen_links:
+                    allocated -= alloc
+                else:
+                    seen_links.add((dev, ino))
+            yield ShotReport(
+                show=show_name,
+                shot=shot_name,
+                render_dir=render_dir,
+                frames_found=scan.frames,
+                missing_frames=_compute_missing(scan.frames),
+                total_bytes=scan.total_bytes,
+                file_count=scan.file_count,
+                allocated_bytes=allocated,
+                latest_publish=publishes.get((show_name, shot_name)),
+            )
+        if publishes is None and publishes_future is not None:
+            publishes_future.result()  # no shot matched: still surface a failed tracker read
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .frames import format_frame_ranges, parse_frame_ranges
+from .scanning import RenderDirScan
+
+# Directories modified this recently are not cached: a file landing within the same
+# mtime tick as the scan would otherwise go unnoticed on coarse-timestamp filesystems.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ScanCache:
+    """
+    Persistent render dir scan cache (JSON file, e.g. data/scan_cache.json).
+
+    Each render dir entry stores the (mtime_ns, inode) stamp of every directory that
+    was listed, plus the scan result. An entry is reused only while all stamps still
+    match, so only directories whose mtime changed are listed again. Frame sets are
+    stored as range strings to keep the file small.
+    On save, entries this process never looked up or stored are dropped if their
+    render dir no longer exists, so deleted or renamed shots do not accumulate
+    (entries for shots outside a --show/--shot filter are kept).
+    Note: a file rewritten in place does not change its directory's mtime.
+    """
+
+    VERSION = 3
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def save(self) -> None:
+        """
+        Write the cache atomically if anything changed since it was loaded,
+        after pruning entries whose render dir is gone
+        """
+        with self._lock:
+            unseen = [key for key in self._entries if key not in self._seen]
+        gone = [key for key in unseen if not os.path.isdir(key)]
+        with self._lock:
+            for key in gone:
+                if self._entries.pop(key, None) is not None:
+                    self._dirty = True
+            if not self._dirty:
+                return
+            payload = json.dumps({"version": self.VERSION, "entries": self._entries})
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # per-process temp name: concurrent runs must not write into each other's temp file
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _stamps_match(render_dir: Path, stamps: dict, top_only: bool) -> bool:
+        for rel, stamp in stamps.items():
+            if top_only and rel:
+                continue
+            try:
+                st = os.stat(render_dir / rel if rel else render_dir)
+            except OSError:
+                return False
+            if [st.st_mtime_ns, st.st_ino] != list(stamp):
+                return False
+        return "" in stamps
+
+    def lookup(self, render_dir: Path, pattern: Optional[str], sizes: bool) -> Optional[RenderDirScan]:
+        """
+        Return the cached scan of render_dir, or None if it is missing or stale.
+        pattern is the frame regex pattern (None when frames are not needed).
+        """
+        key = render_dir.as_posix()
+        with self._lock:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+
+        usable = (
+            isinstance(entry, dict)
+            and (not sizes or entry.get("sized"))
+            and (pattern is None or pattern in entry.get("frames", {}))
+            and self._stamps_match(render_dir, entry.get("stamps", {}), top_only=not sizes)
+        )
+
+        with self._lock:
+            if not usable:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return RenderDirScan(
+            frames=parse_frame_ranges(entry["frames"][pattern]) if pattern is not None else [],
+            total_bytes=int(entry.get("total_bytes", 0)) if sizes else 0,
+            file_count=int(entry.get("file_count", 0)) if sizes else 0,
+            allocated_bytes=int(entry.get("allocated_bytes", 0)) if sizes else 0,
+            linked=tuple(tuple(link) for link in entry.get("linked", ())) if sizes else (),
+        )
+
+    def store(
+            self,
+            render_dir: Path,
+            pattern: Optional[str],
+            sizes: bool,
+            scan: RenderDirScan,
+            stamps: dict[str, tuple[int, int]],
+    ) -> None:
+        """
+        Record a fresh scan of render_dir together with the directory stamps taken for it
+        """
+        if "" not in stamps:
+            return
+        now = time.time_ns()
+        if any(now - mtime_ns < RACY_WINDOW_NS for mtime_ns, _ in stamps.values()):
+            return
+
+        key = render_dir.as_posix()
+        new_stamps = {rel: [mtime_ns, ino] for rel, (mtime_ns, ino) in stamps.items()}
+
+        with self._lock:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+            same_top = isinstance(entry, dict) and entry.get("stamps", {}).get("") == new_stamps[""]
+            if not same_top:
+                entry = {"stamps": {"": new_stamps[""]}, "sized": False, "frames": {}}
+
+            if pattern is not None:
+                entry["frames"][pattern] = format_frame_ranges(scan.frames)
+            if sizes:
+                entry["stamps"] = new_stamps
+                entry["sized"] = True
+                entry["total_bytes"] = scan.total_bytes
+                entry["file_count"] = scan.file_count
+                entry["allocated_bytes"] = scan.allocated_bytes
+                entry["linked"] = [list(link) for link in scan.linked]
+
+            self._entries[key] = entry
+            self._dirty = True
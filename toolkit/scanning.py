@@ -0,0 +1,425 @@
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import os
+from pathlib import Path
+import re
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, TypeVar
+
+from . import profiling
+from .frames import format_frame_ranges, parse_frame_ranges
+
+if TYPE_CHECKING:
+    from .scan_cache import ScanCache
+
+# st_blocks is POSIX-only; elsewhere allocated size falls back to st_size
+_HAS_BLOCKS = hasattr(os.stat_result, "st_blocks")
+
+EXECUTORS = ("thread", "process")
+
+# Tasks submitted ahead of the consumer per worker: keeps every worker busy while
+# bounding queued tasks (and the input walk) to a small window.
+WINDOW_PER_WORKER = 4
+# Finished results per worker that may wait behind a slow earlier item before the
+# pool stops taking new work (results are yielded in input order).
+BUFFER_PER_WORKER = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+@dataclass(frozen=True)
+class RenderDirScan:
+    """
+    Single-pass scan result for one render directory.
+    total_bytes is apparent size (st_size per link); allocated_bytes is st_blocks * 512
+    with each inode counted once. linked holds (st_dev, st_ino, allocated) for files
+    with more than one link, so callers can de-duplicate across directories.
+    """
+    frames: list[int]
+    total_bytes: int
+    file_count: int
+    allocated_bytes: int = 0
+    linked: tuple[tuple[int, int, int], ...] = ()
+
+
+def _list_subdirs(path: Path) -> list[os.DirEntry]:
+    """
+    Return the sub-directory entries of path sorted by name (one listing, no extra stats)
+    """
+    with os.scandir(path) as it:
+        return sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+
+def _matching_subdirs(path: Path, pattern: Optional[str]) -> list[tuple[str, Path]]:
+    """
+    (name, path) of the sub-directories of path matching pattern, sorted by name.
+    None matches everything; a literal name is joined directly (no listing);
+    a glob (fnmatch, case-sensitive) filters one listing of path.
+    """
+    if pattern is not None and not _is_glob(pattern):
+        if not pattern or "/" in pattern or os.sep in pattern or pattern in (".", ".."):
+            return []
+        candidate = path / pattern
+        return [(pattern, candidate)] if candidate.is_dir() else []
+    try:
+        entries = _list_subdirs(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [(e.name, Path(e.path)) for e in entries if pattern is None or fnmatchcase(e.name, pattern)]
+
+
+def iter_shot_render_dirs(
+        shows_root: Path,
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> Iterable[tuple[str, str, Path]]:
+    """
+    Yield (show_name, shot_name, render_dir) for: shows_root/<show>/shots/<shot>/renders
+    show/shot restrict the walk to matching names (literal or glob like "shot1*"),
+    applied before any directory below them is listed.
+    """
+    if not shows_root.is_dir():
+        return
+    for show_name, show_dir in _matching_subdirs(shows_root, show):
+        for shot_name, shot_dir in _matching_subdirs(show_dir / "shots", shot):
+            render_dir = shot_dir / "renders"
+            if render_dir.is_dir():
+                yield show_name, shot_name, render_dir
+
+
+def scan_render_dir(
+        render_dir: Path,
+        frame_re: Optional[re.Pattern] = None,
+        *,
+        sizes: bool = True,
+        dir_stamps: Optional[dict[str, tuple[int, int]]] = None,
+) -> RenderDirScan:
+    """
+    Scan render_dir in one pass using os.scandir.
+
+    Top-level file names matching frame_re (group 1 = frame number) become sorted
+    frame numbers. When sizes is True, files are also counted and their apparent and
+    allocated sizes summed recursively from the same DirEntry stat call (hardlinked
+    inodes are allocated once); with sizes=False nothing is stat'ed and
+    sub-directories are not entered.
+    If dir_stamps is given it is filled with {relative_dir: (mtime_ns, inode)} for every
+    directory listed ("" is render_dir), each taken just before the listing.
+    Errors listing render_dir itself propagate; unreadable sub-directories are skipped.
+
+    While profiling is enabled, time is split into scan.list / scan.stat / scan.regex.
+    """
+    frames: list[int] = []
+    total = 0
+    count = 0
+    allocated = 0
+    # only multi-link inodes are remembered, so memory grows with hardlinks, not files
+    linked: dict[tuple[int, int], int] = {}
+
+    profiler = profiling.active()
+    timed = profiler is not None
+    t_start = perf_counter() if timed else 0.0
+    t_stat = t_regex = 0.0
+    n_dirs = n_stat = n_regex = 0
+
+    root = os.fspath(render_dir)
+    pending = [root]
+    top = True
+    while pending:
+        path = pending.pop()
+        try:
+            if dir_stamps is not None:
+                st = os.stat(path)
+                rel = "" if top else Path(os.path.relpath(path, root)).as_posix()
+                dir_stamps[rel] = (st.st_mtime_ns, st.st_ino)
+            it = os.scandir(path)
+        except OSError:
+            if top:
+                raise
+            continue
+        n_dirs += 1
+
+        with it:
+            for entry in it:
+                try:
+                    is_file = entry.is_file()
+                except OSError:
+                    continue
+
+                if is_file:
+                    if top and frame_re is not None:
+                        if timed:
+                            t0 = perf_counter()
+                        m = frame_re.match(entry.name)
+                        if timed:
+                            t_regex += perf_counter() - t0
+                            n_regex += 1
+                        if m:
+                            frames.append(int(m.group(1)))
+                    if sizes:
+                        count += 1
+                        if timed:
+                            t0 = perf_counter()
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            st = None
+                        if st is not None:
+                            total += st.st_size
+                            alloc = st.st_blocks * 512 if _HAS_BLOCKS else st.st_size
+                            if st.st_nlink > 1:
+                                key = (st.st_dev, st.st_ino)
+                                if key not in linked:
+                                    linked[key] = alloc
+                                    allocated += alloc
+                            else:
+                                allocated += alloc
+                        if timed:
+                            t_stat += perf_counter() - t0
+                            n_stat += 1
+                elif sizes and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+        top = False
+
+    frames.sort()
+    if timed:
+        profiler.add("scan.list", perf_counter() - t_start - t_stat - t_regex, n_dirs)
+        if n_stat:
+            profiler.add("scan.stat", t_stat, n_stat)
+        if n_regex:
+            profiler.add("scan.regex", t_regex, n_regex)
+    return RenderDirScan(
+        frames=frames,
+        total_bytes=total,
+        file_count=count,
+        allocated_bytes=allocated,
+        linked=tuple((dev, ino, alloc) for (dev, ino), alloc in linked.items()),
+    )
+
+
+def _scan_or_empty(
+        render_dir: Path,
+        frame_re: Optional[re.Pattern],
+        sizes: bool,
+        cache: Optional[ScanCache] = None,
+) -> RenderDirScan:
+    """
+    scan_render_dir through the optional cache, treating a render dir that vanished
+    since it was listed as empty
+    """
+    pattern = frame_re.pattern if frame_re is not None else None
+    if cache is not None:
+        with profiling.phase("scan_cache.lookup"):
+            cached = cache.lookup(render_dir, pattern, sizes)
+        if cached is not None:
+            return cached
+
+    stamps: Optional[dict[str, tuple[int, int]]] = {} if cache is not None else None
+    try:
+        scan = scan_render_dir(render_dir, frame_re, sizes=sizes, dir_stamps=stamps)
+    except (FileNotFoundError, NotADirectoryError):
+        return RenderDirScan(frames=[], total_bytes=0, file_count=0)
+
+    if cache is not None:
+        cache.store(render_dir, pattern, sizes, scan, stamps)
+    return scan
+
+
+def _scan_shot(
+        item: tuple[str, str, Path],
+        frame_re: Optional[re.Pattern],
+        sizes: bool,
+        cache: Optional[ScanCache],
+) -> RenderDirScan:
+    """
+    _scan_or_empty for one (show, shot, render_dir), recording per-shot latency when profiling
+    """
+    profiler = profiling.active()
+    if profiler is None:
+        return _scan_or_empty(item[2], frame_re, sizes, cache)
+    t0 = perf_counter()
+    scan = _scan_or_empty(item[2], frame_re, sizes, cache)
+    seconds = perf_counter() - t0
+    profiler.add("scan.shot", seconds)
+    profiler.shot(item[0], item[1], seconds)
+    return scan
+
+
+def _scan_show_shard(
+        render_dirs: list[str],
+        pattern: Optional[str],
+        flags: int,
+        sizes: bool,
+        stamps: bool,
+) -> list[tuple]:
+    """
+    Process-pool worker: scan the render dirs of one show. Returns one compact,
+    cheap-to-pickle tuple per dir, in order:
+    (frames range string, total_bytes, file_count, allocated_bytes, linked, dir_stamps)
+    dir_stamps is None when not requested or when the dir vanished.
+    """
+    frame_re = re.compile(pattern, flags) if pattern is not None else None
+    out: list[tuple] = []
+    for render_dir in render_dirs:
+        dir_stamps: Optional[dict[str, tuple[int, int]]] = {} if stamps else None
+        try:
+            scan = scan_render_dir(Path(render_dir), frame_re, sizes=sizes, dir_stamps=dir_stamps)
+        except (FileNotFoundError, NotADirectoryError):
+            out.append(("", 0, 0, 0, (), None))
+            continue
+        out.append(
+            (format_frame_ranges(scan.frames), scan.total_bytes, scan.file_count, scan.allocated_bytes, scan.linked, dir_stamps)
+        )
+    return out
+
+
+def _scan_render_dirs_processes(
+        items: list[tuple[str, str, Path]],
+        frame_re: Optional[re.Pattern],
+        sizes: bool,
+        workers: int,
+        cache: Optional[ScanCache],
+) -> Iterator[tuple[str, str, Path, RenderDirScan]]:
+    """
+    scan_render_dirs over a process pool, one task per show. Cache lookups and stores
+    stay in this process; results are yielded in input order.
+    """
+    pattern = frame_re.pattern if frame_re is not None else None
+    flags = frame_re.flags if frame_re is not None else 0
+
+    scans: list[Optional[RenderDirScan]] = [None] * len(items)
+    shards: dict[str, list[int]] = {}
+    for i, (show, _, render_dir) in enumerate(items):
+        if cache is not None:
+            with profiling.phase("scan_cache.lookup"):
+                scans[i] = cache.lookup(render_dir, pattern, sizes)
+            if scans[i] is not None:
+                continue
+        shards.setdefault(show, []).append(i)
+
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(shards))) if shards else None
+    try:
+        futures = {
+            show: pool.submit(
+                _scan_show_shard, [os.fspath(items[i][2]) for i in idx], pattern, flags, sizes, cache is not None
+            )
+            for show, idx in shards.items()
+        }
+        for i, (show, shot, render_dir) in enumerate(items):
+            if scans[i] is None:
+                # first miss of this show: unpack the whole shard
+                for j, (frames, total, count, allocated, linked, stamps) in zip(shards[show], futures[show].result()):
+                    scan = RenderDirScan(
+                        frames=parse_frame_ranges(frames),
+                        total_bytes=total,
+                        file_count=count,
+                        allocated_bytes=allocated,
+                        linked=tuple(tuple(link) for link in linked),
+                    )
+                    if cache is not None and stamps is not None:
+                        cache.store(items[j][2], pattern, sizes, scan, stamps)
+                    scans[j] = scan
+            yield show, shot, render_dir, scans[i]
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _ordered_map(
+        pool: Executor,
+        fn: Callable[[_T], _R],
+        items: Iterable[_T],
+        window: int,
+        buffered: int = 0,
+) -> Iterator[tuple[_T, _R]]:
+    """
+    Like pool.map, but yields (item, result) in input order, pulling items lazily.
+    At most `window` tasks are queued or running at once. While the oldest item is
+    still running, later ones keep being submitted as tasks finish, until `buffered`
+    finished results are waiting for it; only then does the pool stall. Memory stays
+    bounded by window + buffered however long items is and however slowly the
+    caller consumes.
+    """
+    it = iter(items)
+    pending: deque = deque()  # (item, future) in input order, running or finished
+    running: set = set()
+    exhausted = False
+
+    def fill() -> None:
+        nonlocal exhausted, running
+        running = {f for f in running if not f.done()}
+        while not exhausted and len(running) < window and len(pending) < window + buffered:
+            for item in it:
+                future = pool.submit(fn, item)
+                pending.append((item, future))
+                running.add(future)
+                break
+            else:
+                exhausted = True
+
+    fill()
+    while pending:
+        item, future = pending[0]
+        if not future.done():
+            wait(running, return_when=FIRST_COMPLETED)
+            fill()
+            continue
+        pending.popleft()
+        result = future.result()
+        fill()
+        yield item, result
+
+
+def scan_render_dirs(
+        render_dirs: Iterable[tuple[str, str, Path]],
+        frame_re: Optional[re.Pattern] = None,
+        *,
+        sizes: bool = True,
+        workers: int = 1,
+        cache: Optional[ScanCache] = None,
+        executor: str = "thread",
+) -> Iterator[tuple[str, str, Path, RenderDirScan]]:
+    """
+    Scan each (show, shot, render_dir) and yield (show, shot, render_dir, scan) in input order.
+
+    With workers > 1 the render dirs are spread over a thread pool. Idle threads pull
+    the next dir from the pool's shared queue, so one very large shot keeps a single
+    worker busy while the others move on; their results wait in a buffer of
+    BUFFER_PER_WORKER * workers scans, since results are yielded in order. If the
+    others fill that buffer before the large shot is done, the pool stalls until it
+    is: the bound keeps memory flat on huge roots.
+    render_dirs is consumed lazily and only WINDOW_PER_WORKER * workers dirs are
+    queued at once, so memory does not grow with the number of shots.
+    executor="process" uses a process pool instead, sharded by show (one task per show,
+    e.g. per filer volume) so regex matching and stat bookkeeping are not bound by the
+    GIL; a single-show tree then runs in one worker.
+    With a cache, unchanged render dirs are served from it instead of being listed.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unsupported executor: {executor}. Expected one of: {', '.join(EXECUTORS)}")
+
+    if workers > 1 and executor == "process":
+        yield from _scan_render_dirs_processes(list(render_dirs), frame_re, sizes, workers, cache)
+        return
+
+    if workers <= 1:
+        for show, shot, render_dir in render_dirs:
+            yield show, shot, render_dir, _scan_shot((show, shot, render_dir), frame_re, sizes, cache)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="toolkit-scan") as pool:
+        scans = _ordered_map(
+            pool,
+            lambda item: _scan_shot(item, frame_re, sizes, cache),
+            render_dirs,
+            workers * WINDOW_PER_WORKER,
+            workers * BUFFER_PER_WORKER,
+        )
+        for (show, shot, render_dir), scan in scans:
+            yield show, shot, render_dir, scan
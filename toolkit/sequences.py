@@ -0,0 +1,110 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from functools import cached_property
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+from . import profiling
+from .frames import frame_ranges, missing_frame_numbers
+
+
+@dataclass(frozen=True)
+class Sequence:
+    """
+    One frame sequence in a directory, e.g. prefix="beauty.", padding=4, ext=".exr".
+    frames_found is sorted; missing_frames are the gaps between its first and last frame.
+    """
+    prefix: str
+    padding: int
+    ext: str
+    frames_found: list[int]
+    missing_frames: list[int]
+
+    @cached_property
+    def missing_ranges(self) -> list[tuple[int, int]]:
+        """missing_frames as inclusive (start, end) runs, computed on first use"""
+        return frame_ranges(self.missing_frames)
+
+    @property
+    def pattern(self) -> str:
+        """Display form with one # per padded digit, e.g. beauty.####.exr"""
+        return f"{self.prefix}{'#' * self.padding}{self.ext}"
+
+
+def _split_frame_name(name: str) -> Optional[tuple[str, str, str]]:
+    """
+    Split a file name into (prefix, frame digits, ext), or None if it has no frame number.
+    The frame number is the last run of digits before the extension:
+    "beauty_v002.1001.exr" -> ("beauty_v002.", "1001", ".exr"). An all-digit suffix
+    counts as the frame ("plate.1001" -> ("plate.", "1001", "")).
+    """
+    dot = name.rfind(".")
+    if dot > 0 and not name[dot + 1:].isdigit():
+        stem, ext = name[:dot], name[dot:]
+    else:
+        stem, ext = name, ""
+    end = len(stem)
+    start = end
+    while start > 0 and stem[start - 1].isdigit():
+        start -= 1
+    if start == end:
+        return None
+    return stem[:start], stem[start:], ext
+
+
+def group_sequences(names: Iterable[str], include: Optional[Iterable[str]] = None) -> list[Sequence]:
+    """
+    Group file names into sequences keyed on (prefix, padding, ext), sorted by that key.
+
+    include is a list of fnmatch patterns (e.g. ["*.exr", "*.dpx"]); None keeps every
+    name with a frame number. Padding is the digit count, so "shot.0001.exr" and
+    "shot.00001.exr" are two sequences. A wider group in which no number has a
+    leading zero is overflow of the narrowest padding (frame 10000 of a ####
+    sequence, or 10 of an unpadded one) and joins that sequence.
+    """
+    patterns = list(include) if include is not None else None
+    groups: dict[tuple[str, int, str], list[int]] = {}
+    unpadded: dict[tuple[str, int, str], bool] = {}
+    for name in names:
+        if patterns is not None and not any(fnmatchcase(name, p) for p in patterns):
+            continue
+        parts = _split_frame_name(name)
+        if parts is None:
+            continue
+        prefix, digits, ext = parts
+        key = (prefix, len(digits), ext)
+        groups.setdefault(key, []).append(int(digits))
+        if digits[0] == "0" and len(digits) > 1:
+            unpadded[key] = False
+        else:
+            unpadded.setdefault(key, True)
+
+    narrowest: dict[tuple[str, str], int] = {}
+    for prefix, padding, ext in sorted(groups):
+        narrowest.setdefault((prefix, ext), padding)
+    for key in sorted(groups):
+        prefix, padding, ext = key
+        base = (prefix, narrowest[(prefix, ext)], ext)
+        if key != base and unpadded[key]:
+            groups[base].extend(groups.pop(key))
+
+    sequences = []
+    for (prefix, padding, ext), frames in sorted(groups.items()):
+        frames = sorted(set(frames))
+        sequences.append(
+            Sequence(prefix=prefix, padding=padding, ext=ext, frames_found=frames, missing_frames=missing_frame_numbers(frames))
+        )
+    return sequences
+
+
+@profiling.timed("sequences.scan")
+def scan_sequences(render_dir: Path, include: Optional[Iterable[str]] = None) -> list[Sequence]:
+    """
+    Detect every frame sequence among the files directly in render_dir with a single
+    os.scandir listing (no stat calls). Errors listing render_dir propagate.
+    """
+    with os.scandir(render_dir) as it:
+        names = [e.name for e in it if e.is_file()]
+    return group_sequences(names, include)
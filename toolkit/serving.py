@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from .frames import format_frame_ranges
+from .metrics import ScanMetrics
+from .monitoring import bytes_to_mb
+from .reporting import iter_shot_reports
+from .scan_cache import ScanCache
+from .tracking.base import PublishRecord, Tracker
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_PUBLISH_LIMIT = 50
+# Encoded /publishes responses kept per tracker version (least recently used dropped)
+PUBLISH_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """An encoded JSON response body with its strong ETag"""
+    body: bytes
+    etag: str
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _digest(content) -> str:
+    return hashlib.blake2b(json.dumps(content, separators=(",", ":")).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    True if an If-None-Match header value matches etag (weak comparison, as RFC 9110
+    requires for If-None-Match)
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ServeState:
+    """
+    Scan results and tracker index held in memory for `toolkit serve`.
+
+    refresh() rescans (through the scan cache when one is given, so only render dirs
+    whose directory stamps changed are listed again), reloads the tracker when its
+    file changed, and swaps in new snapshots. Request threads only read snapshots,
+    so any number of clients cost no filesystem I/O. A snapshot (and its ETag) is
+    replaced only when its content changes; "timestamp" is when that happened.
+    """
+
+    def __init__(
+            self,
+            shows_root: Path,
+            *,
+            tracker: Optional[Tracker] = None,
+            frame_prefix: str = "frame_",
+            frame_padding: int = 4,
+            frame_ext: str = ".exr",
+            workers: int = 1,
+            cache: Optional[ScanCache] = None,
+            executor: str = "thread",
+            show: Optional[str] = None,
+            shot: Optional[str] = None,
+            frames_format: str = "list",
+            accounting: str = "apparent",
+            warn_mb: float = 0.0,
+    ):
+        self.shows_root = shows_root
+        self.tracker = tracker
+        self.frame_prefix = frame_prefix
+        self.frame_padding = frame_padding
+        self.frame_ext = frame_ext
+        self.workers = workers
+        self.cache = cache
+        self.executor = executor
+        self.show = show
+        self.shot = shot
+        self.frames_format = frames_format
+        self.accounting = accounting
+        self.warn_mb = warn_mb
+
+        self.refreshes = 0
+        self.last_refresh_seconds = 0.0
+        self.last_refresh_at: Optional[str] = None
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[str] = None
+        self._last_failed = False
+        self.metrics: Optional[ScanMetrics] = None
+        self._lock = threading.Lock()
+        self._snapshots: dict[str, Snapshot] = {}
+        self._tracker_stamp: Optional[tuple] = None
+        self._tracker_timestamp = ""
+        self._records: list[PublishRecord] = []
+        self._by_show: dict[str, list[PublishRecord]] = {}
+        self._by_shot: dict[tuple[str, str], list[PublishRecord]] = {}
+        self._publish_cache: OrderedDict[tuple, Snapshot] = OrderedDict()
+
+    def _frames_out(self, frames: list[int]):
+        return format_frame_ranges(frames) if self.frames_format == "ranges" else frames
+
+    def _payload(self, command: str, timestamp: str, content: dict) -> dict:
+        return {
+            "tool": "vfx-ops-toolkit",
+            "command": command,
+            "timestamp": timestamp,
+            "shows_root": self.shows_root.as_posix(),
+            **content,
+        }
+
+    def _snapshot(self, name: str, content: dict) -> Snapshot:
+        """
+        Encode the payload for content, reusing the current snapshot if content is unchanged
+        """
+        etag = f'"{_digest(content)}"'
+        current = self._snapshots.get(name)
+        if current is not None and current.etag == etag:
+            return current
+        payload = self._payload(name, _utc_now(), content)
+        return Snapshot(body=json.dumps(payload, indent=2).encode("utf-8"), etag=etag)
+
+    def _current_tracker_stamp(self) -> Optional[tuple]:
+        """
+        (mtime_ns, size) of the tracker's file(s), or None if it has no local file
+        (then it is reloaded on every refresh)
+        """
+        path = getattr(self.tracker, "path", None)
+        if path is None:
+            return None
+        stamp = []
+        for p in (Path(path), Path(f"{path}-wal")):  # SQLite WAL commits may not touch the main file
+            try:
+                st = os.stat(p)
+            except OSError:
+                stamp.append(None)
+                continue
+            stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    def _load_tracker(self) -> Optional[tuple]:
+        """
+        Read the tracker if its file changed and index it: (stamp, records, by_show,
+        by_shot), or None when there is no tracker or it is unchanged. Nothing is
+        swapped in here, so a failed read leaves every snapshot as it was.
+        """
+        if self.tracker is None:
+            return None
+        stamp = self._current_tracker_stamp()
+        if stamp is not None and stamp == self._tracker_stamp:
+            return None
+        records = self.tracker.list_publishes()  # newest first
+        by_show: dict[str, list[PublishRecord]] = {}
+        by_shot: dict[tuple[str, str], list[PublishRecord]] = {}
+        for rec in records:
+            by_show.setdefault(rec.show, []).append(rec)
+            by_shot.setdefault((rec.show, rec.shot), []).append(rec)
+        return stamp, records, by_show, by_shot
+
+    def refresh(self) -> None:
+        """
+        Rescan shows_root and reload the tracker if it changed. Errors are recorded
+        for status(), then propagate and leave the previous snapshots in place.
+        """
+        try:
+            self._refresh()
+        except Exception as e:
+            with self._lock:
+                self.failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                self.last_error_at = _utc_now()
+                self._last_failed = True
+            raise
+
+    def _refresh(self) -> None:
+        t0 = perf_counter()
+        metrics = ScanMetrics("serve")
+        validate_rows = []
+        disk_rows = []
+        with_missing = 0
+        for r in iter_shot_reports(
+            self.shows_root,
+            frame_prefix=self.frame_prefix,
+            frame_padding=self.frame_padding,
+            frame_ext=self.frame_ext,
+            workers=self.workers,
+            cache=self.cache,
+            executor=self.executor,
+            show=self.show,
+            shot=self.shot,
+        ):
+            render_dir = r.render_dir.as_posix()
+            if r.missing_frames:
+                with_missing += 1
+            metrics.add_shot(
+                r.show,
+                r.shot,
+                total_bytes=r.total_bytes,
+                allocated_bytes=r.allocated_bytes,
+                file_count=r.file_count,
+                frames=len(r.frames_found),
+                missing_frames=len(r.missing_frames),
+            )
+            validate_rows.append({
+                "show": r.show,
+                "shot": r.shot,
+                "render_dir": render_dir,
+                "frames_found": self._frames_out(r.frames_found),
+                "missing_frames": self._frames_out(r.missing_frames),
+            })
+            disk_rows.append({
+                "show": r.show,
+                "shot": r.shot,
+                "render_dir": render_dir,
+                "total_bytes": r.total_bytes,
+                "allocated_bytes": r.allocated_bytes,
+                "file_count": r.file_count,
+                "total_mb": round(bytes_to_mb(r.total_bytes), 3),
+                "allocated_mb": round(bytes_to_mb(r.allocated_bytes), 3),
+                "warning": self.warn_mb > 0 and bytes_to_mb(r.usage_bytes(self.accounting)) >= self.warn_mb,
+            })
+
+        validate = self._snapshot(
+            "validate",
+            {"frames_format": self.frames_format, "shots_with_missing": with_missing, "results": validate_rows},
+        )
+        disk = self._snapshot("disk", {"accounting": self.accounting, "results": disk_rows})
+        metrics.finish()
+        tracker_index = self._load_tracker()
+
+        # swap scan snapshots, tracker index and metrics together, so clients never
+        # see a new scan next to an old tracker (or the reverse)
+        with self._lock:
+            self._snapshots = {"validate": validate, "disk": disk}
+            if tracker_index is not None:
+                stamp, records, by_show, by_shot = tracker_index
+                if not self._tracker_timestamp or records != self._records:
+                    self._tracker_timestamp = _utc_now()
+                    self._publish_cache.clear()
+                self._records, self._by_show, self._by_shot = records, by_show, by_shot
+                self._tracker_stamp = stamp
+            elif not self._tracker_timestamp:
+                self._tracker_timestamp = _utc_now()
+            if self.tracker is not None:
+                metrics.tracker_records = {show: len(recs) for show, recs in self._by_show.items()}
+            self.metrics = metrics
+            self.refreshes += 1
+            self.last_refresh_seconds = perf_counter() - t0
+            self.last_refresh_at = _utc_now()
+            self._last_failed = False
+
+    def status(self) -> Snapshot:
+        """Refresh health: last successful refresh, last error and counts"""
+        with self._lock:
+            content = {
+                "ok": self.last_refresh_at is not None and not self._last_failed,
+                "refreshes": self.refreshes,
+                "failures": self.failures,
+                "last_refresh": None if self.last_refresh_at is None else {
+                    "timestamp": self.last_refresh_at,
+                    "seconds": round(self.last_refresh_seconds, 3),
+                },
+                "last_error": None if self.last_error_at is None else {
+                    "timestamp": self.last_error_at,
+                    "message": self.last_error,
+                },
+            }
+        payload = self._payload("status", _utc_now(), content)
+        return Snapshot(body=json.dumps(payload, indent=2).encode("utf-8"), etag=f'"{_digest(content)}"')
+
+    def snapshot(self, name: str) -> Optional[Snapshot]:
+        """Current "validate" or "disk" snapshot (None before the first refresh)"""
+        with self._lock:
+            return self._snapshots.get(name)
+
+    def publishes(self, show: Optional[str] = None, shot: Optional[str] = None, limit: int = DEFAULT_PUBLISH_LIMIT) -> Snapshot:
+        """
+        Newest-first publish records from the in-memory tracker index, as a snapshot.
+        Encoded responses for the PUBLISH_CACHE_SIZE most recent queries are memoized
+        until the tracker changes.
+        """
+        key = (show, shot, limit)
+        with self._lock:
+            cached = self._publish_cache.get(key)
+            if cached is not None:
+                self._publish_cache.move_to_end(key)
+                return cached
+            if show and shot:
+                records = self._by_shot.get((show, shot), [])
+            elif show:
+                records = self._by_show.get(show, [])
+            else:
+                records = self._records
+            if shot and not show:
+                records = [r for r in records if r.shot == shot]
+            records = records[: max(0, limit)]
+            timestamp = self._tracker_timestamp
+
+        content = {
+            "filters": {"show": show, "shot": shot, "limit": limit},
+            "frames_format": self.frames_format,
+            "count": len(records),
+            "records": [
+                {
+                    "show": r.show,
+                    "shot": r.shot,
+                    "version": r.version,
+                    "status": r.status,
+                    "note": r.note,
+                    "timestamp_utc": r.timestamp_utc,
+                    "frames_found": self._frames_out(r.frames_found),
+                    "missing_frames": self._frames_out(r.missing_frames),
+                    "total_bytes": r.total_bytes,
+                    "file_count": r.file_count,
+                }
+                for r in records
+            ],
+        }
+        payload = self._payload("list-publishes", timestamp, content)
+        snap = Snapshot(body=json.dumps(payload, indent=2).encode("utf-8"), etag=f'"{_digest(content)}"')
+        with self._lock:
+            if timestamp == self._tracker_timestamp:
+                self._publish_cache[key] = snap
+                if len(self._publish_cache) > PUBLISH_CACHE_SIZE:
+                    self._publish_cache.popitem(last=False)
+        return snap
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "vfx-ops-toolkit"
+    protocol_version = "HTTP/1.1"
+    # headers and body go out in separate writes; without TCP_NODELAY a keep-alive
+    # client stalls on delayed ACK (~40 ms) for every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._respond(head_only=False)
+
+    def do_HEAD(self) -> None:
+        self._respond(head_only=True)
+
+    def _respond(self, head_only: bool) -> None:
+        state: ServeState = self.server.state
+        url = urlsplit(self.path)
+
+        if url.path in ("/validate", "/disk"):
+            snap = state.snapshot(url.path[1:])
+            if snap is None:
+                return self._error(HTTPStatus.SERVICE_UNAVAILABLE, "first scan not finished", head_only)
+        elif url.path == "/publishes":
+            query = parse_qs(url.query)
+            try:
+                limit = int(query.get("limit", [DEFAULT_PUBLISH_LIMIT])[-1])
+            except ValueError:
+                return self._error(HTTPStatus.BAD_REQUEST, "limit must be an integer", head_only)
+            show = query.get("show", [None])[-1] or None
+            shot = query.get("shot", [None])[-1] or None
+            snap = state.publishes(show=show, shot=shot, limit=limit)
+        elif url.path == "/status":
+            snap = state.status()
+        else:
+            return self._error(HTTPStatus.NOT_FOUND, "unknown path; use /validate, /disk, /publishes or /status", head_only)
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and _etag_matches(if_none_match, snap.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", snap.etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(snap.body)))
+        self.send_header("ETag", snap.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if not head_only:
+            try:
+                self.wfile.write(snap.body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client went away mid-response; nothing to clean up
+
+    def _error(self, status: HTTPStatus, message: str, head_only: bool) -> None:
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # per-request access lines would flood stderr with dashboard polling
+        pass
+
+
+def make_server(state: ServeState, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    HTTP server answering /validate, /disk, /publishes and /status from state (port 0 = any free port)
+    """
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def serve(
+        state: ServeState,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        interval: float = 30.0,
+        duration: Optional[float] = None,
+        on_ready: Optional[Callable[[str, int], None]] = None,
+        on_refresh: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+) -> None:
+    """
+    Refresh state once, then serve it over HTTP, refreshing every `interval` seconds on
+    a background thread until interrupted (or for `duration` seconds).
+    Refresh failures (e.g. storage briefly unavailable, or any unexpected exception)
+    go to on_error and show up in /status; the previous snapshots keep being served
+    and the refresher keeps running.
+    """
+    state.refresh()
+    if on_refresh is not None:
+        on_refresh()
+
+    server = make_server(state, host, port)
+    stop = threading.Event()
+
+    def refresher() -> None:
+        while not stop.wait(interval):
+            # any exception escaping here would end the thread and freeze the snapshots silently
+            try:
+                state.refresh()
+                if on_refresh is not None:
+                    on_refresh()
+            except Exception as e:
+                if on_error is not None:
+                    on_error(e)
+
+    threading.Thread(target=refresher, name="toolkit-serve-refresh", daemon=True).start()
+    timer = None
+    if duration is not None:
+        timer = threading.Timer(duration, server.shutdown)
+        timer.daemon = True
+        timer.start()
+
+    if on_ready is not None:
+        bound_host, bound_port = server.server_address[:2]
+        on_ready(bound_host, bound_port)
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        stop.set()
+        if timer is not None:
+            timer.cancel()
+        server.server_close()
@@ -1,5 +1,25 @@
-from .base import PublishRecord, Tracker
-from .json_tracker import JsonTracker
-from .factory import make_tracker
+from __future__ import annotations
 
-__all__ = ["PublishRecord", "Tracker", "JsonTracker", "make_tracker"]
\ No newline at end of file
+import importlib
+
+# Backends are imported on first attribute access so that e.g. the JSON backend
+# never pays for importing sqlite3.
+_EXPORTS = {
+    "PublishRecord": ".base",
+    "Tracker": ".base",
+    "JsonTracker": ".json_tracker",
+    "SqliteTracker": ".sqlite_tracker",
+    "HttpTracker": ".http_tracker",
+    "make_tracker": ".factory",
+}
+
+__all__ = ["PublishRecord", "Tracker", "JsonTracker", "SqliteTracker", "HttpTracker", "make_tracker"]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -21,4 +21,10 @@ class PublishRecord:
 
 class Tracker(Protocol):
     def record_publish(self, record: PublishRecord) -> None: ...
-    def list_publishes(self, show: Optional[str] = None, shot: Optional[str] = None) -> list[PublishRecord]: ...
+    def record_publishes(self, records: list[PublishRecord]) -> None: ...
+    def list_publishes(
+        self,
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[PublishRecord]: ...
@@ -1,15 +1,44 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 from .base import Tracker
-from .json_tracker import JsonTracker
 
 
 def make_tracker(cfg: dict) -> Tracker:
     tracking_cfg = cfg.get("tracking", {}) if isinstance(cfg.get("tracking", {}), dict) else {}
     backend = tracking_cfg.get("backend", "json")
 
+    if backend == "sqlite":
+        from .sqlite_tracker import SqliteTracker
+        sqlite_path = tracking_cfg.get("sqlite_path", "data/tracking_db.sqlite3")
+        return SqliteTracker(Path(sqlite_path))
+
+    if backend == "http":
+        from .http_tracker import HttpTracker
+        http_url = tracking_cfg.get("http_url")
+        if not http_url:
+            raise ValueError("tracking.http_url is required for tracking backend 'http'.")
+        # the token comes from the environment so it never lands in toolkit.yaml
+        token = os.environ.get(tracking_cfg.get("http_token_env", "TOOLKIT_TRACKER_TOKEN")) or None
+        try:
+            return HttpTracker(
+                str(http_url),
+                token=token,
+                timeout=float(tracking_cfg.get("http_timeout", 30)),
+                batch_size=int(tracking_cfg.get("http_batch_size", 500)),
+                page_size=int(tracking_cfg.get("http_page_size", 500)),
+                retries=int(tracking_cfg.get("http_retries", 3)),
+                backoff=float(tracking_cfg.get("http_backoff", 0.2)),
+                pool_size=int(tracking_cfg.get("http_pool_size", 4)),
+            )
+        except TypeError as e:
+            raise ValueError(f"Invalid tracking.http_* setting: {e}") from None
+
     if backend != "json":
-        raise ValueError(f"Unsupported tracking backend: {backend}. Only 'json' is implemented.")
+        raise ValueError(f"Unsupported tracking backend: {backend}. Expected 'json', 'sqlite' or 'http'.")
 
+    from .json_tracker import JsonTracker
     json_path = tracking_cfg.get("json_path", "data/tracking_db.json")
-    return JsonTracker(Path(json_path))
\ No newline at end of file
+    json_format = tracking_cfg.get("json_format", "json")
+    frames_format = tracking_cfg.get("frames_format", "list")
+    return JsonTracker(Path(json_path), fmt=json_format, frames_format=frames_format)
\ No newline at end of file
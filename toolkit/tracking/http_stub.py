@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+MAX_PAGE_SIZE = 1000
+
+
+class StubTrackingServer(ThreadingHTTPServer):
+    """
+    In-memory tracking service implementing the API HttpTracker speaks, for tests
+    and local development (`python -m toolkit.tracking.http_stub --port 8080`).
+
+    Any path ending in /publishes is served, so base URLs with a prefix work.
+    Cursors are plain offsets into the newest-first result. POSTs with an
+    Idempotency-Key already seen are acknowledged without storing again.
+    For tests it counts accepted connections, logs (method, path) per request and
+    answers the next requests with the statuses queued in fail_next.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int] = ("127.0.0.1", 0)):
+        super().__init__(address, _StubHandler)
+        self.rows: list[dict] = []
+        self.connections = 0
+        self.requests: list[tuple[str, str]] = []
+        self.fail_next: list[int] = []
+        self._seen_keys: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def store(self, rows: list[dict], idempotency_key: Optional[str]) -> int:
+        with self._lock:
+            if idempotency_key:
+                if idempotency_key in self._seen_keys:
+                    return 0
+                self._seen_keys.add(idempotency_key)
+            self.rows.extend(rows)
+        return len(rows)
+
+    def page(self, show: Optional[str], shot: Optional[str], offset: int, limit: int) -> tuple[list[dict], Optional[str]]:
+        with self._lock:
+            # newest first; for equal timestamps the later insert first
+            ordered = sorted(enumerate(self.rows), key=lambda item: (item[1].get("timestamp_utc", ""), item[0]), reverse=True)
+        matches = [
+            row for _, row in ordered
+            if (not show or row.get("show") == show) and (not shot or row.get("shot") == shot)
+        ]
+        end = offset + limit
+        return matches[offset:end], (str(end) if end < len(matches) else None)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server_version = "vfx-ops-toolkit-stub"
+    protocol_version = "HTTP/1.1"
+    # headers and body go out in separate writes; without TCP_NODELAY a keep-alive
+    # client stalls on delayed ACK (~40 ms) for every response
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server._lock:
+            self.server.connections += 1
+
+    def _send(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _injected_failure(self) -> bool:
+        server: StubTrackingServer = self.server
+        with server._lock:
+            server.requests.append((self.command, self.path))
+            status = server.fail_next.pop(0) if server.fail_next else None
+        if status is None:
+            return False
+        self._send(status, {"error": "injected failure"}, headers={"Retry-After": "0"})
+        return True
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)  # read before answering so the connection stays usable
+        if self._injected_failure():
+            return
+        if not urlsplit(self.path).path.rstrip("/").endswith("/publishes"):
+            return self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        try:
+            rows = json.loads(body)["records"]
+        except (ValueError, KeyError, TypeError):
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "expected {\"records\": [...]}"})
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "records must be a list of objects"})
+        stored = self.server.store(rows, self.headers.get("Idempotency-Key"))
+        self._send(HTTPStatus.CREATED, {"stored": stored})
+
+    def do_GET(self) -> None:
+        if self._injected_failure():
+            return
+        url = urlsplit(self.path)
+        if not url.path.rstrip("/").endswith("/publishes"):
+            return self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        query = parse_qs(url.query)
+        try:
+            limit = min(int(query.get("limit", [MAX_PAGE_SIZE])[-1]), MAX_PAGE_SIZE)
+            offset = int(query.get("cursor", [0])[-1])
+        except ValueError:
+            return self._send(HTTPStatus.BAD_REQUEST, {"error": "limit and cursor must be integers"})
+        rows, next_cursor = self.server.page(
+            query.get("show", [None])[-1],
+            query.get("shot", [None])[-1],
+            max(0, offset),
+            max(0, limit),
+        )
+        self._send(HTTPStatus.OK, {"records": rows, "next_cursor": next_cursor})
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="In-memory stub of the tracking REST service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = StubTrackingServer((args.host, args.port))
+    print(f"Stub tracking service on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import http.client
+import json
+import threading
+import time
+import uuid
+from dataclasses import asdict, fields
+from typing import Optional
+from urllib.parse import urlencode, urlsplit
+
+from .. import profiling
+from ..frames import format_frame_ranges, parse_frame_ranges
+from .base import PublishRecord
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRY_AFTER = 60.0
+
+_FIELDS = tuple(f.name for f in fields(PublishRecord))
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds form only), capped"""
+    if not value:
+        return None
+    try:
+        return min(max(0.0, float(value)), MAX_RETRY_AFTER)
+    except ValueError:
+        return None
+
+
+class HttpTracker:
+    """
+    Tracker backed by a central tracking REST service.
+
+    API (JSON bodies; frame lists travel as range strings like "1001-1240,1242"):
+    - POST {base}/publishes with {"records": [...]} stores a batch (2xx)
+    - GET {base}/publishes?show=&shot=&limit=&cursor= returns
+      {"records": [...], "next_cursor": str | null}, newest first, at most `limit` per page
+
+    Connections are kept alive in a small pool, so a batch publish or a paged
+    listing pays the TCP (+TLS) handshake once instead of per request.
+    record_publishes sends batch_size records per POST; list_publishes pushes
+    show/shot filters and the remaining limit to the server page by page.
+    Connection errors and 429/502/503/504 responses are retried with exponential
+    backoff (Retry-After is honoured). Every POST carries an Idempotency-Key, so a
+    batch retried after a lost response is not stored twice. Requests that still
+    fail raise ConnectionError; batches sent before a failing one stay stored.
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            *,
+            token: Optional[str] = None,
+            timeout: float = 30.0,
+            batch_size: int = 500,
+            page_size: int = 500,
+            retries: int = 3,
+            backoff: float = 0.2,
+            pool_size: int = 4,
+    ):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported tracking URL: {base_url!r}. Expected http(s)://host[:port][/path]")
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.batch_size = max(1, batch_size)
+        self.page_size = max(1, page_size)
+        self.retries = max(0, retries)
+        self.backoff = max(0.0, backoff)
+        self.pool_size = max(1, pool_size)
+        self.connections_opened = 0
+
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path.rstrip("/")
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """(connection, reused): the most recently used idle connection, or a new one"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+            self.connections_opened += 1
+        conn_cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        return conn_cls(self._host, self._port, timeout=self.timeout), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close idle pooled connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    @profiling.timed("tracker.request")
+    def _request(self, method: str, path: str, body: Optional[dict] = None, headers: Optional[dict] = None) -> dict:
+        """
+        Send one request (with retries) and return the decoded JSON response body
+        """
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        request_headers = {"Accept": "application/json"}
+        if data is not None:
+            request_headers["Content-Type"] = "application/json"
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        request_headers.update(headers or {})
+        target = f"{method} {self.base_url}{path}"
+
+        attempt = 0
+        stale_retried = False
+        while True:
+            conn, reused = self._acquire()
+            retry_after = None
+            try:
+                conn.request(method, self._path + path, body=data, headers=request_headers)
+                resp = conn.getresponse()
+                payload = resp.read()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if reused and not stale_retried:
+                    # the server may have closed an idle keep-alive connection; retry once at once
+                    stale_retried = True
+                    continue
+                error = f"{target}: {e}"
+            else:
+                if resp.will_close:
+                    conn.close()
+                else:
+                    self._release(conn)
+                if 200 <= resp.status < 300:
+                    try:
+                        return json.loads(payload) if payload else {}
+                    except ValueError as e:
+                        raise ConnectionError(f"{target}: invalid JSON response: {e}") from None
+                error = f"{target}: HTTP {resp.status} {payload[:200].decode('utf-8', 'replace')}".rstrip()
+                if resp.status not in RETRY_STATUSES:
+                    raise ConnectionError(error)
+                retry_after = _retry_after(resp.getheader("Retry-After"))
+
+            if attempt >= self.retries:
+                raise ConnectionError(f"{error} (gave up after {attempt + 1} attempts)")
+            time.sleep(retry_after if retry_after is not None else self.backoff * 2 ** attempt)
+            attempt += 1
+
+    @staticmethod
+    def _to_row(record: PublishRecord) -> dict:
+        row = asdict(record)
+        row["frames_found"] = format_frame_ranges(record.frames_found)
+        row["missing_frames"] = format_frame_ranges(record.missing_frames)
+        return row
+
+    @staticmethod
+    def _from_row(row: dict) -> PublishRecord:
+        """
+        Build a PublishRecord from a response row (extra server fields are ignored);
+        raises TypeError/ValueError/KeyError for malformed rows
+        """
+        values = {name: row[name] for name in _FIELDS}
+        values["frames_found"] = parse_frame_ranges(values["frames_found"])
+        values["missing_frames"] = parse_frame_ranges(values["missing_frames"])
+        return PublishRecord(**values)
+
+    def record_publish(self, record: PublishRecord) -> None:
+        self.record_publishes([record])
+
+    def record_publishes(self, records: list[PublishRecord]) -> None:
+        """
+        POST records in batches of batch_size over pooled connections
+        """
+        for start in range(0, len(records), self.batch_size):
+            batch = records[start:start + self.batch_size]
+            self._request(
+                "POST",
+                "/publishes",
+                {"records": [self._to_row(r) for r in batch]},
+                headers={"Idempotency-Key": uuid.uuid4().hex},
+            )
+
+    def list_publishes(
+            self,
+            show: Optional[str] = None,
+            shot: Optional[str] = None,
+            limit: Optional[int] = None,
+    ) -> list[PublishRecord]:
+        records: list[PublishRecord] = []
+        remaining = None if limit is None else max(0, limit)
+        cursor = None
+        while remaining is None or remaining > 0:
+            query: dict[str, str | int] = {"limit": self.page_size if remaining is None else min(self.page_size, remaining)}
+            if show:
+                query["show"] = show
+            if shot:
+                query["shot"] = shot
+            if cursor:
+                query["cursor"] = cursor
+            data = self._request("GET", "/publishes?" + urlencode(query))
+
+            rows = data.get("records") if isinstance(data, dict) else None
+            if not isinstance(rows, list):
+                raise ConnectionError(f"GET {self.base_url}/publishes: response has no records list")
+            for row in rows:
+                try:
+                    records.append(self._from_row(row))
+                except (TypeError, ValueError, KeyError):
+                    continue
+            if remaining is not None:
+                remaining -= len(rows)
+
+            cursor = data.get("next_cursor")
+            if not cursor or not rows:
+                break
+        return records if limit is None else records[: max(0, limit)]
@@ -1,49 +1,224 @@
 from __future__ import annotations
 
 import json
+import os
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .. import profiling
+from ..frames import FRAME_FORMATS, format_frame_ranges, parse_frame_ranges
 from .base import PublishRecord
 
 
 class JsonTracker:
     """
     Local JSON-backed tracker. Simulates a production tracking system.
-    Stores a list of publish records in a JSON file.
+
+    Storage formats:
+    - "json": a JSON list of publish records, rewritten on every publish
+    - "jsonl": JSON Lines, one appended line per publish (constant write cost)
+    Both formats are readable in either mode. A legacy list file is migrated to
+    JSON Lines on the first "jsonl" publish (or by compact()).
+    Writers hold an exclusive lock on a sibling ".lock" file, so concurrent
+    publishes cannot lose each other's records; readers need no lock because
+    rewrites are published with os.replace.
+
+    frames_format="ranges" stores frame lists as range strings ("1001-1240,1242-2000");
+    rows written either way are read back as list[int].
     """
 
-    def __init__(self, path: Path):
+    FORMATS = ("json", "jsonl")
+
+    def __init__(self, path: Path, fmt: str = "json", frames_format: str = "list"):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported JSON tracker format: {fmt}. Expected one of: {', '.join(self.FORMATS)}")
+        if frames_format not in FRAME_FORMATS:
+            raise ValueError(
+                f"Unsupported frames format: {frames_format}. Expected one of: {', '.join(FRAME_FORMATS)}"
+            )
         self.path = path
+        self.fmt = fmt
+        self.frames_format = frames_format
+
+    def _to_row(self, record: PublishRecord) -> dict:
+        row = asdict(record)
+        if self.frames_format == "ranges":
+            row["frames_found"] = format_frame_ranges(record.frames_found)
+            row["missing_frames"] = format_frame_ranges(record.missing_frames)
+        return row
+
+    @staticmethod
+    def _from_row(row: dict) -> PublishRecord:
+        """
+        Build a PublishRecord from a stored row; raises TypeError/ValueError for malformed rows
+        """
+        rec = PublishRecord(**row)
+        return PublishRecord(
+            **{
+                **row,
+                "frames_found": parse_frame_ranges(rec.frames_found),
+                "missing_frames": parse_frame_ranges(rec.missing_frames),
+            }
+        )
+
+    def _is_list_file(self) -> bool:
+        """
+        True if the file holds a JSON list (legacy/"json" format) rather than JSON Lines
+        """
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                head = f.read(64).lstrip()
+        except FileNotFoundError:
+            return False
+        return head.startswith("[")
 
+    @profiling.timed("tracker.load")
     def _load(self) -> list[dict]:
         if not self.path.exists():
             return []
-        try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            return []
-        if not isinstance(data, list):
-            return []
-        return data
+        text = self.path.read_text(encoding="utf-8")
+
+        if text.lstrip().startswith("["):
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError:
+                return []
+            if not isinstance(data, list):
+                return []
+            return data
+
+        rows: list[dict] = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # e.g. a torn final line from an interrupted append
+                continue
+            if isinstance(row, dict):
+                rows.append(row)
+        return rows
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on "<path>.lock" for a read-modify-write
+        (blocks on POSIX; on Windows retries for ~10s, then raises OSError)
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(self.path.name + ".lock"), "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
 
+    @profiling.timed("tracker.save")
     def _save(self, rows: list[dict]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        if self.fmt == "jsonl":
+            text = "".join(json.dumps(r) + "\n" for r in rows)
+        else:
+            text = json.dumps(rows, indent=2)
+
+        # per-process temp name: concurrent writers must not write into each other's temp file
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @profiling.timed("tracker.append")
+    def _append(self, rows: list[dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._is_list_file():
+            self._save(self._load())
+
+        line = "".join(json.dumps(row) + "\n" for row in rows)
+        with self.path.open("a+b") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
 
     def record_publish(self, record: PublishRecord) -> None:
+        self.record_publishes([record])
+
+    def record_publishes(self, records: list[PublishRecord]) -> None:
+        """
+        Store several records with one write (one append in "jsonl", one rewrite in "json")
+        """
+        if not records:
+            return
+        new_rows = [self._to_row(r) for r in records]
+        with self._write_lock():
+            if self.fmt == "jsonl":
+                self._append(new_rows)
+                return
+            rows = self._load()
+            rows.extend(new_rows)
+            self._save(rows)
+
+    def compact(self) -> tuple[int, int]:
+        """
+        Rewrite the file in the configured format: drop malformed rows, de-duplicate
+        identical publishes (show, shot, version, timestamp_utc; last one wins) and
+        order by timestamp. Frame lists are rewritten in the configured frames_format.
+        Returns (rows_before, rows_after).
+        """
+        with self._write_lock():
+            return self._compact()
+
+    def _compact(self) -> tuple[int, int]:
         rows = self._load()
-        rows.append(asdict(record))
-        self._save(rows)
+        latest: dict[tuple, dict] = {}
+        for r in rows:
+            try:
+                rec = self._from_row(r)
+            except (TypeError, ValueError):
+                continue
+            key = (rec.show, rec.shot, rec.version, rec.timestamp_utc)
+            latest.pop(key, None)
+            latest[key] = self._to_row(rec)
+
+        compacted = sorted(latest.values(), key=lambda r: r["timestamp_utc"])
+        if self.path.exists() or compacted:
+            self._save(compacted)
+        return len(rows), len(compacted)
 
-    def list_publishes(self, show: Optional[str] = None, shot: Optional[str] = None) -> list[PublishRecord]:
+    def list_publishes(
+            self,
+            show: Optional[str] = None,
+            shot: Optional[str] = None,
+            limit: Optional[int] = None,
+    ) -> list[PublishRecord]:
         rows = self._load()
         records: list[PublishRecord] = []
         for r in rows:
             try:
-                rec = PublishRecord(**r)
-            except TypeError:
+                rec = self._from_row(r)
+            except (TypeError, ValueError):
                 continue
 
             if show and rec.show != show:
@@ -54,4 +229,6 @@ class JsonTracker:
 
         # newest first
         records.sort(key=lambda x: x.timestamp_utc, reverse=True)
+        if limit is not None:
+            records = records[: max(0, limit)]
         return records
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..frames import format_frame_ranges, parse_frame_ranges
+from .base import PublishRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publishes (
+    id INTEGER PRIMARY KEY,
+    show TEXT NOT NULL,
+    shot TEXT NOT NULL,
+    version TEXT NOT NULL,
+    status TEXT NOT NULL,
+    note TEXT NOT NULL,
+    timestamp_utc TEXT NOT NULL,
+    frames_found TEXT NOT NULL,
+    missing_frames TEXT NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    file_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_publishes_timestamp ON publishes (timestamp_utc);
+CREATE INDEX IF NOT EXISTS idx_publishes_show_ts ON publishes (show, timestamp_utc);
+CREATE INDEX IF NOT EXISTS idx_publishes_show_shot_ts ON publishes (show, shot, timestamp_utc);
+CREATE INDEX IF NOT EXISTS idx_publishes_shot_ts ON publishes (shot, timestamp_utc);
+CREATE INDEX IF NOT EXISTS idx_publishes_version ON publishes (show, shot, version);
+"""
+
+_COLUMNS = (
+    "show", "shot", "version", "status", "note", "timestamp_utc",
+    "frames_found", "missing_frames", "total_bytes", "file_count",
+)
+
+
+class SqliteTracker:
+    """
+    SQLite-backed tracker. Publish records live in one indexed table; show/shot
+    filters, newest-first ordering and the limit are pushed into the query.
+    The database runs in WAL mode so readers do not block a publish (and vice versa).
+    Frame lists are stored as compact range strings ("1001-1240,1242-2000").
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _to_row(record: PublishRecord) -> tuple:
+        return (
+            record.show,
+            record.shot,
+            record.version,
+            record.status,
+            record.note,
+            record.timestamp_utc,
+            format_frame_ranges(record.frames_found),
+            format_frame_ranges(record.missing_frames),
+            record.total_bytes,
+            record.file_count,
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> PublishRecord:
+        show, shot, version, status, note, ts, frames_found, missing_frames, total_bytes, file_count = row
+        return PublishRecord(
+            show=show,
+            shot=shot,
+            version=version,
+            status=status,
+            note=note,
+            timestamp_utc=ts,
+            frames_found=parse_frame_ranges(frames_found),
+            missing_frames=parse_frame_ranges(missing_frames),
+            total_bytes=total_bytes,
+            file_count=file_count,
+        )
+
+    def record_publish(self, record: PublishRecord) -> None:
+        self.record_publishes([record])
+
+    def record_publishes(self, records: list[PublishRecord]) -> None:
+        """
+        Insert several records in one transaction
+        """
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT INTO publishes ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                    [self._to_row(r) for r in records],
+                )
+
+    def list_publishes(
+            self,
+            show: Optional[str] = None,
+            shot: Optional[str] = None,
+            limit: Optional[int] = None,
+    ) -> list[PublishRecord]:
+        where: list[str] = []
+        params: list = []
+        if show:
+            where.append("show = ?")
+            params.append(show)
+        if shot:
+            where.append("shot = ?")
+            params.append(shot)
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM publishes"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        # newest first
+        sql += " ORDER BY timestamp_utc DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(0, limit))
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [self._from_row(r) for r in rows]
@@ -1,8 +1,16 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 import re
-from typing import Iterable
+from typing import Iterable, Iterator, Optional
+
+from . import profiling
+from .frames import frame_ranges, missing_frame_numbers
+from .scan_cache import ScanCache
+from .scanning import BUFFER_PER_WORKER, WINDOW_PER_WORKER, _ordered_map, iter_shot_render_dirs, scan_render_dir, scan_render_dirs
+from .sequences import Sequence, scan_sequences
 
 @dataclass(frozen=True)
 class ShotValidationResult:
@@ -13,6 +21,19 @@ class ShotValidationResult:
     frames_found: list[int]
     missing_frames: list[int]
 
+    @cached_property
+    def missing_ranges(self) -> list[tuple[int, int]]:
+        """missing_frames as inclusive (start, end) runs, computed on first use"""
+        return frame_ranges(self.missing_frames)
+
+@dataclass(frozen=True)
+class ShotSequencesResult:
+    """Every frame sequence detected in one shot render directory"""
+    show: str
+    shot: str
+    render_dir: Path
+    sequences: list[Sequence]
+
 def _build_frame_regex(prefix: str, padding: int, ext: str) -> re.Pattern:
     """
     Return a compiled regex for frame files; group 1 captures the frame number
@@ -24,44 +45,69 @@ def _collect_frame_numbers(render_dir: Path, frame_re: re.Pattern) -> list[int]:
     """
     Return sorted frame unmbers found in render_dir matching frame_re
     """
-    frames: list[int] = []
-    for p in render_dir.iterdir():
-        if not p.is_file():
-            continue
-        m = frame_re.match(p.name)
-        if not m:
-            continue
-        frames.append(int(m.group(1)))
-    frames.sort()
-    return frames
+    return scan_render_dir(render_dir, frame_re, sizes=False).frames
 
 def _compute_missing(frames: list[int]) -> list[int]:
     """
-    Return missing frame numbers between min(frames) and max(frames)
+    Return missing frame numbers between min(frames) and max(frames) (frames sorted)
     """
-    if not frames:
-        return []
-    lo, hi = frames[0], frames[-1]
-    have = set(frames)
-    missing = [f for f in range(lo, hi + 1) if f not in have]
-    return missing
+    return missing_frame_numbers(frames)
 
-def iter_shot_render_dirs(shows_root: Path) -> Iterable[tuple[str, str, Path]]:
+@profiling.timed("validate.shot")
+def validate_shot(
+        render_dir: Path,
+        *,
+        frame_prefix: str = "frame_",
+        frame_padding: int = 4,
+        frame_ext: str = ".exr",
+) -> ShotValidationResult:
     """
-    Yield (show_name, shot_name, render_dir) for: shows_root/<show>/shots/renders
+    Report missing frames for one render dir (<shows_root>/<show>/shots/<shot>/renders).
+    Only render_dir is listed; show/shot names are taken from its path.
     """
-    if not shows_root.exists():
-        return
-    for show_dir in sorted([p for p in shows_root.iterdir() if p.is_dir()]):
-        shots_dir = show_dir / "shots"
+    frame_re = _build_frame_regex(frame_prefix, frame_padding, frame_ext)
+    frames = _collect_frame_numbers(render_dir, frame_re)
+    parents = render_dir.parents
+    return ShotValidationResult(
+        show=parents[2].name if len(parents) > 2 else "",
+        shot=render_dir.parent.name,
+        render_dir=render_dir,
+        frames_found=frames,
+        missing_frames=_compute_missing(frames)
+    )
 
-        if not shots_dir.exists():
-            continue
-        
-        for shot_dir in sorted([p for p in shots_dir.iterdir() if p.is_dir()]):
-            render_dir = shot_dir / "renders"
-            if render_dir.exists() and render_dir.is_dir():
-                yield show_dir.name, shot_dir.name, render_dir
+def iter_validate_renders(
+        shows_root: Path,
+        *,
+        frame_prefix: str = "frame_",
+        frame_padding: int = 4,
+        frame_ext: str = ".exr",
+        workers: int = 1,
+        cache: Optional[ScanCache] = None,
+        executor: str = "thread",
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> Iterator[ShotValidationResult]:
+    """
+    Yield a validation result per shot in (show, shot) order as each shot finishes scanning.
+    workers > 1 scans shots concurrently (executor "thread", or "process" sharded by
+    show); with a cache, render dirs whose mtime is unchanged are not listed again.
+    show/shot (names or globs) limit the scan to matching shots.
+    """
+    frame_re = _build_frame_regex(frame_prefix, frame_padding, frame_ext)
+    scans = scan_render_dirs(
+        iter_shot_render_dirs(shows_root, show, shot), frame_re, sizes=False, workers=workers, cache=cache, executor=executor
+    )
+    for show, shot, render_dir, scan in scans:
+        with profiling.phase("validate.missing"):
+            missing = _compute_missing(scan.frames)
+        yield ShotValidationResult(
+            show=show,
+            shot=shot,
+            render_dir=render_dir,
+            frames_found=scan.frames,
+            missing_frames=missing
+        )
 
 def validate_renders(
         shows_root: Path,
@@ -69,22 +115,65 @@ def validate_renders(
         frame_prefix: str = "frame_",
         frame_padding: int = 4,
         frame_ext: str = ".exr",
+        workers: int = 1,
+        cache: Optional[ScanCache] = None,
+        executor: str = "thread",
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
 ) -> list[ShotValidationResult]:
     """
     Scan all shot render dirs and report missing frames for each shot
+    (list form of iter_validate_renders; holds every result, so prefer the generator
+    on large roots)
     """
-    frame_re = _build_frame_regex(frame_prefix, frame_padding, frame_ext)
-    results: list[ShotValidationResult] = []
-    for show, shot, render_dir in iter_shot_render_dirs(shows_root):
-        frames = _collect_frame_numbers(render_dir, frame_re)
-        missing = _compute_missing(frames)
-        results.append(
-            ShotValidationResult(
-                show=show,
-                shot=shot,
-                render_dir=render_dir,
-                frames_found=frames,
-                missing_frames=missing
-            )
+    return list(
+        iter_validate_renders(
+            shows_root,
+            frame_prefix=frame_prefix,
+            frame_padding=frame_padding,
+            frame_ext=frame_ext,
+            workers=workers,
+            cache=cache,
+            executor=executor,
+            show=show,
+            shot=shot,
+        )
+    )
+
+def _sequences_or_empty(render_dir: Path, include: Optional[list[str]]) -> list[Sequence]:
+    try:
+        return scan_sequences(render_dir, include)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+def iter_validate_sequences(
+        shows_root: Path,
+        *,
+        include: Optional[Iterable[str]] = None,
+        workers: int = 1,
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> Iterator[ShotSequencesResult]:
+    """
+    Yield every frame sequence (prefix, padding, ext) per shot, with its missing frames,
+    in (show, shot) order. Each render dir is listed once whatever the number of AOV
+    passes; include (fnmatch patterns) limits which files are considered.
+    workers > 1 lists render dirs on a thread pool. The scan cache is not used.
+    """
+    patterns = list(include) if include is not None else None
+    items = iter_shot_render_dirs(shows_root, show, shot)
+    if workers <= 1:
+        for show_name, shot_name, render_dir in items:
+            yield ShotSequencesResult(show_name, shot_name, render_dir, _sequences_or_empty(render_dir, patterns))
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="toolkit-seq") as pool:
+        scans = _ordered_map(
+            pool,
+            lambda item: _sequences_or_empty(item[2], patterns),
+            items,
+            workers * WINDOW_PER_WORKER,
+            workers * BUFFER_PER_WORKER,
         )
-    return results
\ No newline at end of file
+        for (show_name, shot_name, render_dir), sequences in scans:
+            yield ShotSequencesResult(show_name, shot_name, render_dir, sequences)
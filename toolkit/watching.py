@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import bisect
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import stat
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from .frames import format_ranges, missing_ranges
+from .monitoring import bytes_to_mb
+from .scanning import iter_shot_render_dirs, scan_render_dir
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_WATCH_MASK = IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    """A change in a shot's missing frames or disk warning state"""
+    kind: str  # "missing_frames" or "disk_warning"
+    show: str
+    shot: str
+    render_dir: Path
+    missing_frames: str  # range string, e.g. "0003,0005-0007" ("" when complete)
+    frame_count: int
+    total_bytes: int
+    warning: bool
+
+
+@dataclass
+class _ShotState:
+    show: str
+    shot: str
+    render_dir: Path
+    frames: list[int] = field(default_factory=list)  # sorted
+    file_sizes: dict[str, int] = field(default_factory=dict)  # top-level files only
+    nested_bytes: int = 0  # files in sub-directories, taken from the seed scan
+    top_bytes: int = 0
+    missing: tuple = ()
+    warning: bool = False
+
+    @property
+    def total_bytes(self) -> int:
+        return self.top_bytes + self.nested_bytes
+
+
+class FrameIndex:
+    """
+    In-memory frame/size index for every render dir under shows_root.
+
+    Seeded once with iter_shot_render_dirs and one listing per render dir (sub-directories
+    are summed with scan_render_dir in the same pass); afterwards each file
+    event updates one shot in place, so the work per event is independent of the
+    size of the tree. Files in sub-directories of a render dir keep their seed size.
+    """
+
+    def __init__(self, frame_re: re.Pattern, *, warn_mb: float = 0.0, frame_padding: int = 4):
+        self.frame_re = frame_re
+        self.warn_mb = warn_mb
+        self.frame_padding = frame_padding
+        self.shots: dict[Path, _ShotState] = {}
+
+    def seed(self, shows_root: Path, show: Optional[str] = None, shot: Optional[str] = None) -> list[WatchEvent]:
+        """
+        Build the index for the shots matching show/shot (names or globs); returns
+        events for shots that start with missing frames or a warning
+        """
+        events: list[WatchEvent] = []
+        for show_name, shot_name, render_dir in iter_shot_render_dirs(shows_root, show, shot):
+            state = _ShotState(show=show_name, shot=shot_name, render_dir=render_dir)
+            self.shots[render_dir] = state
+            self._relist(state, nested=True)
+            events.extend(self._refresh(state, initial=True))
+        return events
+
+    def _relist(self, state: _ShotState, nested: bool = False) -> None:
+        """
+        List the top level of the render dir; with nested, also size its sub-directories
+        """
+        frames: list[int] = []
+        sizes: dict[str, int] = {}
+        subdirs: list[str] = []
+        try:
+            with os.scandir(state.render_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            if nested and entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            continue
+                        sizes[entry.name] = entry.stat().st_size
+                    except OSError:
+                        continue
+                    m = self.frame_re.match(entry.name)
+                    if m:
+                        frames.append(int(m.group(1)))
+        except OSError:
+            pass
+        frames.sort()
+        state.frames = frames
+        state.file_sizes = sizes
+        state.top_bytes = sum(sizes.values())
+        if nested:
+            state.nested_bytes = 0
+            for path in subdirs:
+                try:
+                    state.nested_bytes += scan_render_dir(Path(path)).total_bytes
+                except OSError:
+                    continue
+
+    def _event(self, kind: str, state: _ShotState) -> WatchEvent:
+        return WatchEvent(
+            kind=kind,
+            show=state.show,
+            shot=state.shot,
+            render_dir=state.render_dir,
+            missing_frames=format_ranges(state.missing, padding=self.frame_padding),
+            frame_count=len(state.frames),
+            total_bytes=state.total_bytes,
+            warning=state.warning,
+        )
+
+    def _refresh(self, state: _ShotState, initial: bool = False) -> list[WatchEvent]:
+        """
+        Recompute derived state for one shot and return the events for what changed
+        """
+        events: list[WatchEvent] = []
+        missing = tuple(missing_ranges(state.frames))
+        warning = self.warn_mb > 0 and bytes_to_mb(state.total_bytes) >= self.warn_mb
+
+        missing_changed = missing != state.missing
+        warning_changed = warning != state.warning
+        state.missing = missing
+        state.warning = warning
+
+        if missing_changed:
+            events.append(self._event("missing_frames", state))
+        if warning_changed and not (initial and not warning):
+            events.append(self._event("disk_warning", state))
+        return events
+
+    def apply(self, render_dir: Path, name: str, present: bool) -> list[WatchEvent]:
+        """
+        Apply one file event (name appeared/changed or disappeared in render_dir)
+        """
+        state = self.shots.get(render_dir)
+        if state is None:
+            return []
+
+        size = 0
+        if present:
+            try:
+                st = os.stat(render_dir / name)
+            except OSError:
+                present = False
+            else:
+                if not stat.S_ISREG(st.st_mode):
+                    return []
+                size = st.st_size
+
+        old_size = state.file_sizes.pop(name, None)
+        if old_size is not None:
+            state.top_bytes -= old_size
+        if present:
+            state.file_sizes[name] = size
+            state.top_bytes += size
+
+        m = self.frame_re.match(name)
+        if m:
+            frame = int(m.group(1))
+            i = bisect.bisect_left(state.frames, frame)
+            have = i < len(state.frames) and state.frames[i] == frame
+            if present and not have:
+                state.frames.insert(i, frame)
+            elif not present and have:
+                del state.frames[i]
+
+        return self._refresh(state)
+
+    def resync(self, render_dir: Path) -> list[WatchEvent]:
+        """
+        Re-list one render dir (after lost events or for polling) and return changes
+        """
+        state = self.shots.get(render_dir)
+        if state is None:
+            return []
+        self._relist(state)
+        return self._refresh(state)
+
+
+class PollingWatcher:
+    """
+    Portable fallback: each poll stats every render dir and re-lists only those whose
+    mtime changed. A file rewritten in place does not change its directory's mtime.
+    """
+
+    def __init__(self, render_dirs: list[Path]):
+        self._mtimes: dict[Path, Optional[int]] = {d: self._mtime(d) for d in render_dirs}
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def poll(self, timeout: float) -> list[tuple[Path, Optional[str], bool]]:
+        """
+        Sleep for timeout seconds and return (render_dir, None, True) for each changed dir
+        """
+        time.sleep(timeout)
+        changed: list[tuple[Path, Optional[str], bool]] = []
+        for render_dir, old in self._mtimes.items():
+            new = self._mtime(render_dir)
+            if new != old:
+                self._mtimes[render_dir] = new
+                changed.append((render_dir, None, True))
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """
+    Linux inotify watcher (via libc/ctypes) on each render dir.
+    poll() returns (render_dir, name, present) file events; name is None when the
+    kernel queue overflowed or the watch went away and the dir must be re-listed.
+    Each watch costs one inotify watch descriptor (see fs.inotify.max_user_watches).
+    """
+
+    def __init__(self, render_dirs: list[Path]):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dirs: dict[int, Path] = {}
+        for render_dir in render_dirs:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(render_dir), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                self.close()
+                raise OSError(err, f"inotify_add_watch failed for {render_dir}: {os.strerror(err)}")
+            self._dirs[wd] = render_dir
+
+    def poll(self, timeout: float) -> list[tuple[Path, Optional[str], bool]]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events: list[tuple[Path, Optional[str], bool]] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.extend((d, None, True) for d in self._dirs.values())
+                continue
+            render_dir = self._dirs.get(wd)
+            if render_dir is None:
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                events.append((render_dir, None, False))
+                continue
+            if mask & IN_ISDIR or not raw_name:
+                continue
+            present = bool(mask & (IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO))
+            events.append((render_dir, os.fsdecode(raw_name), present))
+        return events
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(render_dirs: list[Path], backend: str = "auto"):
+    """
+    Return an InotifyWatcher (Linux) or PollingWatcher. backend: "auto", "inotify" or "poll".
+    """
+    if backend == "poll":
+        return PollingWatcher(render_dirs)
+    if backend not in ("auto", "inotify"):
+        raise ValueError(f"Unsupported watch backend: {backend}. Expected auto, inotify or poll.")
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(render_dirs)
+        except (OSError, AttributeError):
+            if backend == "inotify":
+                raise
+    elif backend == "inotify":
+        raise ValueError("inotify is only available on Linux")
+    return PollingWatcher(render_dirs)
+
+
+def watch(
+        shows_root: Path,
+        *,
+        frame_re: re.Pattern,
+        on_event: Callable[[WatchEvent], None],
+        warn_mb: float = 0.0,
+        frame_padding: int = 4,
+        backend: str = "auto",
+        interval: float = 2.0,
+        duration: Optional[float] = None,
+        show: Optional[str] = None,
+        shot: Optional[str] = None,
+) -> FrameIndex:
+    """
+    Seed a FrameIndex, then apply file events until duration elapses (forever if None).
+    on_event is called for the initial state and for every missing-frame / disk
+    warning change. show/shot restrict the watched shots (names or globs). Returns the index.
+    """
+    index = FrameIndex(frame_re, warn_mb=warn_mb, frame_padding=frame_padding)
+    for event in index.seed(shows_root, show, shot):
+        on_event(event)
+
+    watcher = make_watcher(list(index.shots), backend)
+    deadline = None if duration is None else time.monotonic() + duration
+    try:
+        while deadline is None or time.monotonic() < deadline:
+            timeout = interval if deadline is None else max(0.0, min(interval, deadline - time.monotonic()))
+            for render_dir, name, present in watcher.poll(timeout):
+                events = index.resync(render_dir) if name is None else index.apply(render_dir, name, present)
+                for event in events:
+                    on_event(event)
+    finally:
+        watcher.close()
+    return index